@@ -1,12 +1,132 @@
 #!/usr/bin/python
 # coding:utf-8
+import string
 import time
+from typing import Iterable, List, Optional, Tuple
 
-def get__ac_signature(one_site: str, one_nonce: str, ua_n: str,one_time_stamp: int=int(time.time())) -> str:
+SIGN_HEAD = '_02B4Z6wo00f01'
+# 6位编码表: A-Z, a-z, 0-9, '-', '.'
+ENC_TABLE = string.ascii_uppercase + string.ascii_lowercase + string.digits + '-.'
+
+
+def cal_one_str(one_str: str, orgi_iv: int) -> int:
+    """计算字符串的哈希值 (方法1)"""
+    k = orgi_iv
+    for char in one_str:
+        a = ord(char)
+        k = ((k ^ a) * 65599) & 0xFFFFFFFF  # 模拟 JavaScript 的 >>> 0
+    return k
+
+
+def cal_one_str_3(one_str: str, orgi_iv: int) -> int:
+    """计算字符串的哈希值 (方法3)"""
+    k = orgi_iv
+    for char in one_str:
+        k = (k * 65599 + ord(char)) & 0xFFFFFFFF
+    return k
+
+
+def get_one_chr(enc_chr_code: int) -> str:
+    """将数字编码转换为字符"""
+    return ENC_TABLE[enc_chr_code]
+
+
+def enc_num_to_str(one_orgi_enc: int) -> str:
+    """将32位整数编码为5字符字符串 (每组6位)"""
+    return (ENC_TABLE[(one_orgi_enc >> 24) & 63] + ENC_TABLE[(one_orgi_enc >> 18) & 63]
+            + ENC_TABLE[(one_orgi_enc >> 12) & 63] + ENC_TABLE[(one_orgi_enc >> 6) & 63]
+            + ENC_TABLE[one_orgi_enc & 63])
+
+
+class AcSignatureGenerator:
+    """
+    _ac_signature 生成器
+    签名中只有与 nonce 相关的部分每次都要重新计算，与域名、UA、时间戳相关的部分
+    按秒缓存，同一秒内批量签名多个 nonce 时只计算一次
+    """
+
+    def __init__(self, one_site: str, ua_n: str):
+        """
+        :param one_site: 网站域名
+        :param ua_n: User-Agent 字符串
+        """
+        self.one_site = one_site
+        self.ua_n = ua_n
+        # (时间戳, 中间结果)，整体替换以保证多线程下读到的是一致的一组值
+        self._cached = (None, None)
+
+    def _state(self, one_time_stamp: int) -> Tuple[str, int, int, int, str, int]:
+        """
+        计算与 nonce 无关的中间结果
+        :return: (签名前缀, c, ua哈希, 524576^b 右移4位, 签名后缀m, 前缀的校验状态)
+        """
+        cached_time_stamp, cached_state = self._cached
+        if one_time_stamp == cached_time_stamp:
+            return cached_state
+
+        # 步骤1: 计算 a
+        a = cal_one_str(self.one_site, cal_one_str(str(one_time_stamp), 0)) % 65521
+
+        # 步骤2: 计算 b, "10000000110000" + 32位二进制字符串
+        x = one_time_stamp ^ (a * 65521)
+        b = (0b10000000110000 << max(32, x.bit_length())) | x
+
+        # 步骤3: 计算 c
+        c = cal_one_str(str(b), 0)
+
+        # 步骤4: 计算 d, e, f, g, h, i
+        d = enc_num_to_str(b >> 2)
+        e = (b // 4294967296) & 0xFFFFFFFF  # 模拟 >>> 0
+        f = enc_num_to_str((b << 28) | (e >> 4))
+        g = 582085784 ^ b
+        h = enc_num_to_str((e << 26) | (g >> 6))
+        i = ENC_TABLE[g & 63]
+
+        prefix = SIGN_HEAD + d + f + h + i
+        ua_hash = (cal_one_str(self.ua_n, c) % 65521) << 16
+        state = (prefix, c, ua_hash, (524576 ^ b) >> 4, enc_num_to_str(a), cal_one_str_3(prefix, 0))
+
+        self._cached = (one_time_stamp, state)
+        return state
+
+    def sign(self, one_nonce: str, one_time_stamp: Optional[int] = None) -> str:
+        """
+        计算 _ac_signature
+        :param one_nonce: 随机字符串
+        :param one_time_stamp: 时间戳 (整数)，默认取调用时的当前时间
+        :return: _ac_signature 字符串
+        """
+        if one_time_stamp is None:
+            one_time_stamp = int(time.time())
+        prefix, c, ua_hash, b_tail, m, check = self._state(one_time_stamp)
+
+        # 步骤5: 计算 j, k, l
+        j = ua_hash | (cal_one_str(one_nonce, c) % 65521)
+        k = enc_num_to_str(j >> 2)
+        l = enc_num_to_str((j << 28) | b_tail)
+        tail = k + l + m
+
+        # 步骤6、7: 组合各部分并计算校验位 o (取16进制最后两位)
+        o = '%02x' % (cal_one_str_3(tail, check) & 0xFF)
+        return prefix + tail + o
+
+    def sign_many(self, nonces: Iterable[str], one_time_stamp: Optional[int] = None) -> List[str]:
+        """
+        批量计算 _ac_signature，共用同一个时间戳
+        :param nonces: 随机字符串列表
+        :param one_time_stamp: 时间戳 (整数)，默认取调用时的当前时间
+        :return: 与输入顺序一致的签名列表
+        """
+        if one_time_stamp is None:
+            one_time_stamp = int(time.time())
+        return [self.sign(nonce, one_time_stamp) for nonce in nonces]
+
+
+def get__ac_signature(one_site: str, one_nonce: str, ua_n: str, one_time_stamp: Optional[int] = None) -> str:
     """计算x音的 _ac_signature 参数
 
     参数:
-        one_time_stamp: 时间戳 (整数)
+        one_time_stamp: 时间戳 (整数)，默认取调用时的当前时间
         one_site: 网站域名 (字符串)
         one_nonce: 随机字符串 (字符串)
         ua_n: User-Agent 字符串 (字符串)
@@ -14,92 +134,4 @@ def get__ac_signature(one_site: str, one_nonce: str, ua_n: str,one_time_stamp: i
     返回:
         _ac_signature 字符串
     """
-    
-    def cal_one_str(one_str: str, orgi_iv: int) -> int:
-        """计算字符串的哈希值 (方法1)"""
-        k = orgi_iv
-        for char in one_str:
-            a = ord(char)
-            k = ((k ^ a) * 65599) & 0xFFFFFFFF  # 模拟 JavaScript 的 >>> 0
-        return k
-    
-    def cal_one_str_2(one_str: str, orgi_iv: int) -> int:
-        """计算字符串的哈希值 (方法2)"""
-        k = orgi_iv
-        a = len(one_str)
-        for _ in range(32):
-            # 使用 k % a 作为索引确保在字符串范围内
-            char_index = k % a
-            k = (k * 65599 + ord(one_str[char_index])) & 0xFFFFFFFF
-        return k
-    
-    def cal_one_str_3(one_str: str, orgi_iv: int) -> int:
-        """计算字符串的哈希值 (方法3)"""
-        k = orgi_iv
-        for char in one_str:
-            k = (k * 65599 + ord(char)) & 0xFFFFFFFF
-        return k
-    
-    def get_one_chr(enc_chr_code: int) -> str:
-        """将数字编码转换为字符"""
-        if enc_chr_code < 26:
-            return chr(enc_chr_code + 65)  # A-Z
-        elif enc_chr_code < 52:
-            return chr(enc_chr_code + 71)  # a-z (71 = 65 - 26 + 6)
-        elif enc_chr_code < 62:
-            return chr(enc_chr_code - 4)  # 0-9
-        else:
-            return chr(enc_chr_code - 17)  # + 和 /
-    
-    def enc_num_to_str(one_orgi_enc: int) -> str:
-        """将32位整数编码为4字符字符串"""
-        s = ''
-        # 处理24位数据 (4组6位)
-        for i in range(24, -1, -6):
-            # 提取6位数据
-            bits = (one_orgi_enc >> i) & 63
-            s += get_one_chr(bits)
-        return s
-    
-    # 主逻辑开始
-    sign_head = '_02B4Z6wo00f01'
-    time_stamp_s = str(one_time_stamp)
-    
-    # 步骤1: 计算 a
-    a = cal_one_str(one_site, cal_one_str(time_stamp_s, 0)) % 65521
-    
-    # 步骤2: 计算 b
-    # 创建二进制字符串: "10000000110000" + 32位二进制字符串
-    bin_str = bin(one_time_stamp ^ (a * 65521))[2:].zfill(32)
-    b = int("10000000110000" + bin_str, 2)
-    b_s = str(b)
-    
-    # 步骤3: 计算 c
-    c = cal_one_str(b_s, 0)
-    
-    # 步骤4: 计算 d, e, f, g, h, i
-    d = enc_num_to_str(b >> 2)
-    e = (b // 4294967296) & 0xFFFFFFFF  # 模拟 >>> 0
-    f = enc_num_to_str((b << 28) | (e >> 4))
-    g = 582085784 ^ b
-    h = enc_num_to_str((e << 26) | (g >> 6))
-    i = get_one_chr(g & 63)
-    
-    # 步骤5: 计算 j, k, l, m
-    j = ((cal_one_str(ua_n, c) % 65521) << 16) | (cal_one_str(one_nonce, c) % 65521)
-    k = enc_num_to_str(j >> 2)
-    l = enc_num_to_str((j << 28) | ((524576 ^ b) >> 4))
-    m = enc_num_to_str(a)
-    
-    # 步骤6: 组合各部分
-    n = sign_head + d + f + h + i + k + l + m
-    
-    # 步骤7: 计算校验位 o
-    o_hex = hex(cal_one_str_3(n, 0))[2:]  # 转换为16进制
-    o = o_hex[-2:].zfill(2)  # 取最后两位
-    
-    # 最终签名
-    signature = n + o
-    return signature
-
-    
\ No newline at end of file
+    return AcSignatureGenerator(one_site, ua_n).sign(one_nonce, one_time_stamp)
@@ -0,0 +1,353 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+基于 asyncio 的直播间弹幕抓取
+
+DouyinLiveWebFetcher 每个直播间至少占用两个线程（run_forever 接收线程和心跳线程），
+这里把 HTTP 引导、websocket 接收和心跳都放到同一个事件循环里，一个进程可以同时挂几百个直播间。
+帧解码、消息解析与分发沿用 DouyinLiveWebFetcher 的 _decodeFrame、_dispatchMessages、_applyMessages，
+各类消息的回调仍是 _handle*Msg 方法。
+
+用法:
+    async for message in AsyncDouyinLiveWebFetcher(live_id):
+        print(message)
+
+或在一个事件循环里监听多个直播间:
+    python async_fetcher.py <live_id> [<live_id> ...]
+"""
+
+import asyncio
+import sys
+import time
+from typing import Optional
+
+import aiohttp
+
+from backoff import Backoff
+from bootstrap import RoomIdNotFoundError, RoomIdScanner
+from heartbeat import HeartbeatHandle
+from liveMan import HEARTBEAT_FRAME, DouyinLiveWebFetcher, generateMsToken
+from message_handler import AsyncMessageHandler
+
+
+class AsyncDouyinLiveWebFetcher(DouyinLiveWebFetcher):
+    """
+    asyncio 版本的直播间弹幕抓取对象
+    """
+
+    def __init__(self, live_id, session: Optional[aiohttp.ClientSession] = None, abogus_file=None,
+                 heartbeat_interval: float = 5, max_reconnect_delay: float = 60, subscriptions=None, codec=None,
+                 decode_pool=None, recorder=None, endpoint=None, skip_bootstrap=None):
+        """
+        :param live_id: 直播间的直播id
+        :param session: 共享的 aiohttp 会话，多个直播间共用一个会话可以复用连接池；为None时自动创建
+        :param abogus_file: a_bogus的JS脚本路径，为None时使用纯Python实现
+        :param heartbeat_interval: 默认心跳间隔（秒），收到服务端的 heartbeat_duration 后以服务端为准
+        :param max_reconnect_delay: 断线重连的最长等待时间（秒）
+        :param subscriptions: 需要的消息类型，如 ('chat', 'gift')，未订阅的消息不解析；None表示全部
+        :param codec: protobuf编解码后端（见 codec.py），为None时使用 configure_codec 选择的后端
+        :param decode_pool: 解析消息列表的 DecodePool，为None时使用进程内共享的线程池，为False时在事件循环中直接解析
+        :param recorder: 原始帧录制器 FrameRecorder（见 capture.py），为None时不录制
+        :param endpoint: 推送服务器地址，为None时连接抖音
+        :param skip_bootstrap: 是否跳过签名、ttwid/room_id获取和直播间状态查询，为None时指定了endpoint就跳过
+        """
+        super().__init__(live_id, abogus_file, max_reconnect_delay, heartbeat_interval, subscriptions, codec,
+                         decode_pool, recorder, endpoint, skip_bootstrap)
+        self.http = session
+        self._own_http = session is None
+        self._loop = None
+        self._task = None
+        self._heartbeat_task = None
+        # 在事件循环内创建，见 start
+        self._stop_event = None
+
+    def _createMessageHandler(self):
+        # 在事件循环中发布（见 _deliverMessages），默认订阅使用 asyncio 版本
+        return AsyncMessageHandler()
+
+    async def _ensure_http(self) -> aiohttp.ClientSession:
+        if self.http is None:
+            self.http = aiohttp.ClientSession()
+        return self.http
+
+    async def _fetch_ttwid(self) -> str:
+        """
+        异步获取ttwid，优先使用缓存
+        """
+        ttwid = self.bootstrap_cache.get_ttwid()
+        if ttwid:
+            return ttwid
+        http = await self._ensure_http()
+        async with http.get(self.live_url, headers={"User-Agent": self.user_agent}) as response:
+            response.raise_for_status()
+            morsel = response.cookies.get('ttwid')
+        if morsel is None:
+            raise RuntimeError("响应中没有ttwid")
+        self.bootstrap_cache.set_ttwid(morsel.value)
+        return morsel.value
+
+    async def _fetch_room_id(self, ttwid: str) -> str:
+        """
+        异步获取room_id，流式读取页面，找到后立即停止下载，优先使用缓存
+        """
+        room_id = self.bootstrap_cache.get_room_id(self.live_id)
+        if room_id:
+            return room_id
+        http = await self._ensure_http()
+        headers = {
+            "User-Agent": self.user_agent,
+            "cookie": f"ttwid={ttwid}&msToken={generateMsToken()}; __ac_nonce=0123407cc00a9e438deb4",
+        }
+        scanner = RoomIdScanner()
+        async with http.get(self.live_url + self.live_id, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(8192):
+                room_id = scanner.feed(chunk)
+                if room_id:
+                    break
+        if not room_id:
+            raise RoomIdNotFoundError(self.live_id, "页面中未找到roomId", scanner.bytes_read)
+        self.bootstrap_cache.set_room_id(self.live_id, room_id)
+        return room_id
+
+    async def _fetch_room_status(self):
+        """
+        异步获取直播间开播状态，与 get_room_status 相同，请求复用 self.http，不占用线程池
+        """
+        if self.skip_bootstrap:
+            return self.room_status
+        http = await self._ensure_http()
+        async with http.get(self.host, headers=self.headers) as response:
+            morsel = response.cookies.get('__ac_nonce')
+        nonce = morsel.value if morsel is not None else None
+        signature = self.ac_signer.sign(nonce)
+        url, headers = self._roomStatusRequest(nonce, signature)
+        async with http.get(url, headers=headers) as response:
+            response.raise_for_status()
+            data = (await response.json(content_type=None)).get('data')
+        return self._parseRoomStatus(data)
+
+    async def bootstrap(self):
+        """
+        异步获取ttwid与room_id并写入引导缓存，之后ttwid/room_id属性直接命中缓存，不再发起同步请求
+        """
+        if self.skip_bootstrap:
+            return
+        ttwid = await self._fetch_ttwid()
+        await self._fetch_room_id(ttwid)
+
+    async def start(self):
+        """
+        连接直播间并持续接收消息，连接断开后按指数退避自动重连，直到调用stop或直播结束
+        """
+        self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        backoff = Backoff(maximum=self.max_reconnect_delay, jitter=0.5)
+        try:
+            await self.bootstrap()
+            while self.bus.is_running():
+                backoff.mark_started()
+                await self._connectWebSocket()
+                if not self._shouldReconnect() or not await self._waitReconnect(backoff):
+                    break
+        finally:
+            self.bus.stop()
+            if self._own_http and self.http is not None:
+                await self.http.close()
+                self.http = None
+
+    async def _waitReconnect(self, backoff: Backoff) -> bool:
+        """
+        退避等待后重新获取room_id（主播可能已重新开播），获取失败时继续退避，
+        保证连接时 room_id 属性命中缓存，不在事件循环中发起同步请求
+        :return: 是否可以重连，调用了stop时为False
+        """
+        while True:
+            delay = backoff.next_delay()
+            print(f"【X】连接已断开，{delay:.1f}秒后重连")
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), delay)
+                return False
+            except asyncio.TimeoutError:
+                pass
+            self._invalidateRoomId()
+            try:
+                await self.bootstrap()
+                return True
+            except Exception as e:
+                print(f"【X】重新获取room_id失败: {e}")
+
+    def stop(self):
+        """
+        停止接收，可在事件循环内的任意位置调用（包括消息解析回调中）
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
+        self.bus.stop()
+        if self.ws is not None and not self.ws.closed:
+            asyncio.ensure_future(self.ws.close())
+
+    async def _connectWebSocket(self):
+        """
+        连接抖音直播间websocket服务器，请求直播间数据
+        """
+        if not self.bus.is_running():
+            return
+        # 签名计算在线程池中执行，避免阻塞事件循环
+        wss = await asyncio.get_running_loop().run_in_executor(None, self._signWssUrl, self._buildWssUrl())
+
+        headers = {
+            "cookie": f"ttwid={self.ttwid}",
+            'user-agent': self.user_agent,
+        }
+        http = await self._ensure_http()
+        try:
+            async with http.ws_connect(wss, headers=headers, max_msg_size=0) as ws:
+                self.ws = ws
+                self._wsOnOpen(ws)
+                try:
+                    await self._receive(ws)
+                finally:
+                    self._stopHeartbeat()
+        except aiohttp.WSServerHandshakeError as e:
+            # 握手被拒绝，可能是签名失效，下次重连重新签名
+            self._signature = None
+            self._wsOnError(self.ws, e)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._wsOnError(self.ws, e)
+        finally:
+            self.ws = None
+            await self._wsOnClose(None)
+
+    async def _receive(self, ws):
+        async for msg in ws:
+            if msg.type == aiohttp.WSMsgType.BINARY:
+                try:
+                    await self._wsOnMessage(ws, msg.data)
+                except Exception as e:
+                    print("【X】解析消息出错: ", e)
+            elif msg.type == aiohttp.WSMsgType.ERROR:
+                self._wsOnError(ws, ws.exception())
+                break
+
+    def _startHeartbeat(self, ws):
+        """
+        心跳是事件循环中的任务，不使用共享的心跳调度线程；
+        HeartbeatHandle 只记录到期时间，ack 推迟心跳、服务端修改间隔与同步版一致
+        :param ws: websocket实例
+        """
+        self._stopHeartbeat()
+        self._heartbeat = HeartbeatHandle(None, None, self.heartbeat_interval)
+        self._heartbeat_task = asyncio.ensure_future(self._sendHeartbeat(ws, self._heartbeat))
+
+    def _stopHeartbeat(self):
+        super()._stopHeartbeat()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
+    async def _sendHeartbeat(self, ws, handle: HeartbeatHandle):
+        """
+        按 handle 的到期时间发送心跳包，直到连接关闭或心跳被取消
+        """
+        while not handle.cancelled and not ws.closed:
+            delay = handle.due - time.monotonic()
+            if delay > 0:
+                # 期间可能被 touch 推迟，醒来后重新检查
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await ws.ping(HEARTBEAT_FRAME)
+                print("【√】发送心跳包")
+            except Exception as e:
+                print("【X】心跳包检测错误: ", e)
+                break
+            handle.due = time.monotonic() + handle.interval
+
+    def _wsOnOpen(self, ws):
+        """
+        连接建立成功
+        """
+        print("【√】WebSocket连接成功.")
+        if self.on_status_update:
+            self.on_status_update("WebSocket连接成功")
+        self._startHeartbeat(ws)
+
+    async def _wsOnMessage(self, ws, message):
+        """
+        接收到数据
+        :param ws: websocket实例
+        :param message: 数据
+        """
+        if self.recorder is not None:
+            self.recorder.record(message)
+        package, data, response = self._decodeFrame(message)
+
+        # 返回直播间服务器链接存活确认消息，便于持续获取数据
+        ack = self._buildAck(package, response)
+        if ack:
+            await ws.send_bytes(ack)
+            # ack本身就能保持连接活跃，推迟下一次心跳
+            if self._heartbeat is not None:
+                self._heartbeat.touch()
+
+        self._dispatchMessages(data)
+        self._saveResumeState(response)
+
+    def _deliverMessages(self, decoded):
+        """
+        解析池的线程按顺序交付结果，转到事件循环中发布（AsyncMessageHandler 不是线程安全的）
+        """
+        self._loop.call_soon_threadsafe(self._applyMessages, decoded)
+
+    async def _wsOnClose(self, ws, *args):
+        try:
+            self.room_status = await self._fetch_room_status()
+        except Exception as e:
+            print("【X】获取直播间状态失败: ", e)
+        print("WebSocket connection closed.")
+        if self.on_status_update:
+            self.on_status_update("WebSocket连接已关闭")
+
+    def __aiter__(self):
+        if self._task is None:
+            self._task = asyncio.ensure_future(self.start())
+        return self._iter_messages()
+
+    async def _iter_messages(self):
+        while True:
+            message = await self.message_handler.get_message()
+            if message is None:
+                break
+            yield message
+        # 等待连接任务收尾，任务中的异常在迭代结束时抛出
+        if self._task is not None:
+            await self._task
+
+
+async def _watch(live_id: str, session: aiohttp.ClientSession):
+    try:
+        async for message in AsyncDouyinLiveWebFetcher(live_id, session):
+            print(f"[{live_id}] {message['type']}: {message['payload']}")
+    except Exception as e:
+        print(f"【X】[{live_id}] 发生错误: {e}")
+
+
+async def run_rooms(live_ids):
+    """
+    在同一个事件循环里监听多个直播间
+    :param live_ids: 直播id列表
+    """
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(*(_watch(live_id, session) for live_id in live_ids))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("用法: python async_fetcher.py <live_id> [<live_id> ...]")
+    else:
+        try:
+            asyncio.run(run_rooms(sys.argv[1:]))
+        except KeyboardInterrupt:
+            print("\n程序已退出")
@@ -0,0 +1,44 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+断线重连与进程重启共用的指数退避
+"""
+
+import random
+import time
+
+
+class Backoff:
+    """
+    指数退避，运行时间足够长后视为恢复正常并重置
+    """
+
+    def __init__(self, initial: float = 1, maximum: float = 60, reset_after: float = 60, jitter: float = 0):
+        """
+        :param initial: 首次等待时间（秒）
+        :param maximum: 最长等待时间（秒）
+        :param reset_after: 连续正常运行超过该时间（秒）后重置退避
+        :param jitter: 随机抖动比例(0~1)，实际等待时间在 [delay*(1-jitter), delay] 之间，
+                       避免网络恢复时大量直播间同时重连
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self.reset_after = reset_after
+        self.jitter = jitter
+        self.delay = initial
+        self.started_at = time.monotonic()
+
+    def mark_started(self):
+        self.started_at = time.monotonic()
+
+    def next_delay(self) -> float:
+        """
+        计算下一次重连（重启）前的等待时间
+        :return: 等待时间（秒）
+        """
+        if time.monotonic() - self.started_at >= self.reset_after:
+            self.delay = self.initial
+        delay = self.delay
+        self.delay = min(self.delay * 2, self.maximum)
+        return delay * (1 - self.jitter * random.random())
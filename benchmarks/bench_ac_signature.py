@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+__ac_signature 计算的微基准
+
+用法: python benchmarks/bench_ac_signature.py [次数]
+"""
+
+import os
+import sys
+import timeit
+import uuid
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ac_signature import AcSignatureGenerator, get__ac_signature
+
+SITE = "www.douyin.com/"
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/140.0.0.0 Safari/537.36 Edg/140.0.0.0")
+
+
+def main(number=20000):
+    nonces = [uuid.uuid4().hex[:21] for _ in range(number)]
+    time_stamp = 1760000000
+    generator = AcSignatureGenerator(SITE, USER_AGENT)
+
+    def run_function():
+        for nonce in nonces:
+            get__ac_signature(SITE, nonce, USER_AGENT, time_stamp)
+
+    def run_generator():
+        for nonce in nonces:
+            generator.sign(nonce, time_stamp)
+
+    def run_batch():
+        generator.sign_many(nonces, time_stamp)
+
+    print(f"__ac_signature x{number}")
+    for name, func in (("get__ac_signature", run_function),
+                       ("AcSignatureGenerator.sign", run_generator),
+                       ("AcSignatureGenerator.sign_many", run_batch)):
+        cost = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"  {name:<32}{cost * 1e6 / number:8.2f} us/次")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+高频消息解码的吞吐基准：betterproto 完整解析 vs protobuf/fast_decoder.py vs 官方 protobuf 后端
+
+先逐条对拍解码结果，再分别测量每秒可处理的帧数（含 PushFrame/gzip/Response 解析）。
+未安装 protobuf 时跳过官方 protobuf 后端。
+
+用法: python benchmarks/bench_decoder.py [帧数]
+"""
+
+import gzip
+import os
+import random
+import sys
+import timeit
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from codec import BetterprotoCodec, ProtobufCodec
+from protobuf.douyin import (ChatMessage, Common, FansClub, FansClubData, GiftMessage, GiftStruct, Image,
+                             LikeMessage, MemberMessage, Message, PayGrade, PushFrame, Response, SocialMessage, User)
+from protobuf.fast_decoder import FAST_DECODERS, REFERENCE_DECODERS, verify
+
+# Message.method -> 消息类型
+MSG_TYPES = {
+    'WebcastChatMessage': 'chat',
+    'WebcastGiftMessage': 'gift',
+    'WebcastLikeMessage': 'like',
+    'WebcastMemberMessage': 'member',
+    'WebcastSocialMessage': 'social',
+}
+
+MESSAGES_PER_FRAME = 20
+
+
+def _image(rnd):
+    return Image(url_list_list=[f"https://p{i}.douyinpic.com/img/{rnd.getrandbits(64):x}~100x100.webp"
+                                for i in range(3)],
+                 uri=f"img/{rnd.getrandbits(32):x}", height=100, width=100, avg_color="#A1B2C3")
+
+
+def _user(rnd):
+    """带头像、等级、粉丝团、勋章等嵌套字段的用户，接近真实弹幕中的 User"""
+    return User(id=rnd.getrandbits(60), short_id=rnd.getrandbits(40),
+                nick_name=rnd.choice(["小明", "Alice", "夜猫子🌙", "路人甲", "x" * 30]),
+                gender=rnd.randint(0, 1), level=rnd.randint(0, 60), city="杭州",
+                avatar_thumb=_image(rnd), avatar_medium=_image(rnd), avatar_large=_image(rnd),
+                badge_image_list=[_image(rnd) for _ in range(rnd.randint(0, 3))],
+                pay_grade=PayGrade(total_diamond_count=rnd.getrandbits(20), diamond_icon=_image(rnd),
+                                   name=f"荣誉等级{rnd.randint(1, 50)}", icon=_image(rnd), level=rnd.randint(1, 50)),
+                fans_club=FansClub(data=FansClubData(club_name="粉丝团", level=rnd.randint(1, 20),
+                                                     available_gift_ids=[1, 2, 3], anchor_id=rnd.getrandbits(50))),
+                sec_uid="MS4wLjABAAAA" + "%x" % rnd.getrandbits(128), id_str=str(rnd.getrandbits(60)))
+
+
+def _message(rnd):
+    common = Common(msg_id=rnd.getrandbits(62), room_id=7392091211001140287, create_time=1760000000000)
+    kind = rnd.choice(list(FAST_DECODERS))
+    if kind == 'WebcastChatMessage':
+        payload = ChatMessage(common=common, user=_user(rnd), content=rnd.choice(["你好", "主播好！", "666" * 5]))
+    elif kind == 'WebcastGiftMessage':
+        payload = GiftMessage(common=common, gift_id=463, combo_count=rnd.randint(1, 99), user=_user(rnd),
+                              gift=GiftStruct(image=_image(rnd), describe="送出了小心心", id=463, name="小心心"))
+    elif kind == 'WebcastLikeMessage':
+        payload = LikeMessage(common=common, count=rnd.randint(1, 20), total=rnd.getrandbits(20), user=_user(rnd))
+    elif kind == 'WebcastMemberMessage':
+        payload = MemberMessage(common=common, user=_user(rnd), member_count=rnd.getrandbits(16))
+    else:
+        payload = SocialMessage(common=common, user=_user(rnd), follow_count=rnd.getrandbits(16))
+    return Message(method=kind, payload=bytes(payload))
+
+
+def build_frames(count, seed=0):
+    rnd = random.Random(seed)
+    frames = []
+    for _ in range(count):
+        response = Response(messages_list=[_message(rnd) for _ in range(MESSAGES_PER_FRAME)],
+                            cursor="t-1760000000000_r-1", internal_ext="internal_src:dim", need_ack=True)
+        frames.append(PushFrame(log_id=rnd.getrandbits(62), payload_type='msg',
+                                payload=gzip.compress(bytes(response))).SerializeToString())
+    return frames
+
+
+def _handle(frames, decoders):
+    for frame in frames:
+        package = PushFrame().parse(frame)
+        response = Response().parse(gzip.decompress(package.payload))
+        for msg in response.messages_list:
+            decoders[msg.method](msg.payload)
+
+
+def _handle_codec(frames, codec):
+    for frame in frames:
+        package = codec.parse_frame(frame)
+        response = codec.parse_response(gzip.decompress(package.payload))
+        for msg in response.messages_list:
+            codec.decode(MSG_TYPES[msg.method], msg.payload)
+
+
+def _backends():
+    yield "betterproto", lambda frames: _handle(frames, REFERENCE_DECODERS)
+    yield "fast_decoder", lambda frames: _handle_codec(frames, BetterprotoCodec())
+    try:
+        codec = ProtobufCodec()
+    except ImportError:
+        print("  (未安装 protobuf，跳过官方 protobuf 后端)")
+        return
+    yield "protobuf", lambda frames: _handle_codec(frames, codec)
+
+
+def main(count=100):
+    frames = build_frames(count)
+
+    try:
+        protobuf_codec = ProtobufCodec()
+    except ImportError:
+        protobuf_codec = None
+    checked = 0
+    for frame in frames:
+        response = Response().parse(gzip.decompress(PushFrame().parse(frame).payload))
+        for msg in response.messages_list:
+            if not verify(msg.method, msg.payload):
+                raise SystemExit(f"对拍失败: {msg.method} {msg.payload.hex()}")
+            if protobuf_codec is not None and \
+                    protobuf_codec.decode(MSG_TYPES[msg.method], msg.payload) != REFERENCE_DECODERS[msg.method](msg.payload):
+                raise SystemExit(f"protobuf后端对拍失败: {msg.method} {msg.payload.hex()}")
+            checked += 1
+    print(f"对拍通过: {checked} 条消息")
+
+    print(f"{count} 帧 x {MESSAGES_PER_FRAME} 条消息")
+    results = {}
+    for name, handle in _backends():
+        cost = min(timeit.repeat(lambda: handle(frames), number=1, repeat=3))
+        results[name] = count / cost
+        print(f"  {name:<16}{results[name]:10.1f} 帧/秒  ({results[name] / results['betterproto']:.2f}x)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MessageHandler 队列中每条消息占用的内存
+
+用 tracemalloc 统计放入N条消息前后的内存差，消息由 betterproto 后端解析合成流量得到，
+包含事件对象（见 events.py）、字符串和整数等全部对象。队列不设类型配额和合并，每条消息都保留。
+
+用法: python benchmarks/bench_memory.py [--quick]
+"""
+
+import gc
+import sys
+import tracemalloc
+from typing import Dict
+
+from metrics import Metric, print_metrics
+
+from codec import BetterprotoCodec
+from liveMan import MESSAGE_METHODS
+from message_handler import MessageHandler
+from mock_server import TRAFFIC_METHODS, MessageCorpus, TrafficProfile
+
+
+def run(quick: bool = False) -> Dict[str, Metric]:
+    count = 2000 if quick else 20000
+    codec = BetterprotoCodec()
+    corpus = MessageCorpus(TrafficProfile(users=count, seed=1))
+    results = {}
+    for msg_type in TRAFFIC_METHODS:
+        payloads = corpus.payloads[msg_type]
+        method_type = MESSAGE_METHODS[TRAFFIC_METHODS[msg_type]][0]
+        handler = MessageHandler(maxsize=count, policies={})
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            # 每条消息单独解析，和实际运行时一样持有各自的对象
+            handler.put_messages([codec.decode(method_type, payloads[i % len(payloads)])])
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[f"memory.{msg_type}.bytes_per_msg"] = Metric((after - before) / count, 'bytes', False)
+        del handler
+    return results
+
+
+if __name__ == '__main__':
+    print_metrics(run('--quick' in sys.argv))
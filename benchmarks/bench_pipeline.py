@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+接收流水线吞吐：原始帧经 _wsOnMessage（PushFrame/gzip/Response解析、ack、消息解析、分发入队）的每秒帧数
+
+按消息类型分别测量（每帧全是同一类消息），另有按默认流量比例混合的 mixed；
+每种protobuf后端分别测量在接收线程中直接解析（inline）和交给解析线程池（pool）两种方式。
+帧由 mock_server.py 的合成流量生成，不需要网络。
+
+用法: python benchmarks/bench_pipeline.py [--quick]
+"""
+
+import sys
+from typing import Dict, List
+
+from metrics import Metric, print_metrics, quiet, rate
+
+from capture import ReplaySocket
+from codec import create_codec
+from decode_pool import DecodePool
+from liveMan import DouyinLiveWebFetcher
+from mock_server import TRAFFIC_METHODS, MessageCorpus, TrafficGenerator, TrafficProfile
+
+MESSAGES_PER_FRAME = 20
+
+
+def build_frames(msg_type: str, count: int, seed: int = 0) -> List[bytes]:
+    """
+    :param msg_type: TRAFFIC_METHODS 中的消息类型，或 'mixed'
+    :param count: 帧数
+    :return: 序列化后的 PushFrame
+    """
+    if msg_type == 'mixed':
+        profile = TrafficProfile(users=500, room_stats_interval=0, seed=seed)
+    else:
+        profile = TrafficProfile(users=500, room_stats_interval=0, seed=seed,
+                                 **{name: float(name == msg_type) for name in TRAFFIC_METHODS})
+    corpus = MessageCorpus(profile)
+    generator = TrafficGenerator(profile, corpus, '1', seed)
+    rnd = generator.rnd
+    if msg_type == 'mixed':
+        # 按各类消息的速率比例抽取
+        pools = list(corpus.messages.values())
+        weights = [getattr(profile, name) for name in corpus.messages]
+        return [generator.frame([rnd.choice(rnd.choices(pools, weights)[0]) for _ in range(MESSAGES_PER_FRAME)])[1]
+                for _ in range(count)]
+    pool = corpus.messages[msg_type]
+    return [generator.frame(rnd.choices(pool, k=MESSAGES_PER_FRAME))[1] for _ in range(count)]
+
+
+def _codecs():
+    for name in ('betterproto', 'protobuf'):
+        try:
+            yield create_codec(name)
+        except ImportError:
+            print(f"  (未安装 {name}，跳过)")
+
+
+def run(quick: bool = False) -> Dict[str, Metric]:
+    count = 50 if quick else 300
+    frame_sets = {msg_type: build_frames(msg_type, count) for msg_type in list(TRAFFIC_METHODS) + ['mixed']}
+    decode_pool = DecodePool(workers=2)
+    results = {}
+    try:
+        for codec in _codecs():
+            for mode, pool in (('inline', False), ('pool', decode_pool)):
+                for msg_type, frames in frame_sets.items():
+                    fetcher = DouyinLiveWebFetcher('bench', codec=codec, decode_pool=pool)
+                    ws = ReplaySocket()
+
+                    def handle():
+                        for frame in frames:
+                            fetcher._wsOnMessage(ws, frame)
+                        fetcher.flush()
+
+                    with quiet():
+                        value = rate(handle, len(frames))
+                    results[f"pipeline.{codec.name}.{mode}.{msg_type}.frames_per_sec"] = Metric(value, 'frames/s')
+    finally:
+        decode_pool.shutdown()
+    return results
+
+
+if __name__ == '__main__':
+    print(f"每帧 {MESSAGES_PER_FRAME} 条消息")
+    print_metrics(run('--quick' in sys.argv))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MessageHandler 的吞吐：多个生产线程放入、多个消费线程取出同时进行时每秒通过的消息数
+
+逐条方式为 add_message/get_message；批量方式为 add_messages（每批一帧的消息数）/get_batch。
+队列容量足够大，不触发按优先级丢弃的逻辑；另测单线程先全部放入再全部取出的吞吐作为无竞争的对照，
+以及单线程向小容量队列放入混合类型消息（触发合并与按优先级丢弃）的吞吐，
+和 MessageBus 把每批消息广播给多个订阅（每个订阅各取一遍）的吞吐。
+
+用法: python benchmarks/bench_queue.py [--quick]
+"""
+
+import sys
+import threading
+import time
+from typing import Dict
+
+from metrics import Metric, print_metrics, rate
+
+from message_bus import MessageBus
+from events import ChatEvent
+from message_handler import MessageHandler
+from mock_server import TRAFFIC_METHODS
+
+PAYLOAD = {'user_name': '小明', 'user_id': 1234567890, 'content': '主播好！'}
+EVENT = ChatEvent('小明', 1234567890, '主播好！')
+
+# (生产线程数, 消费线程数)
+CONTENTION = ((1, 1), (4, 1), (4, 4))
+# 批量方式每次放入的消息数，相当于一帧中的消息数
+PRODUCER_BATCH = 20
+CONSUMER_BATCH = 100
+# 溢出测试的队列容量
+OVERFLOW_MAXSIZE = 100
+# 广播测试的订阅数
+FANOUT = (1, 3)
+
+
+def _contended(producers: int, consumers: int, per_producer: int, batched: bool) -> float:
+    """
+    :return: 每秒通过的消息数，计时到生产线程全部结束且队列被取空为止
+    """
+    total = producers * per_producer
+    handler = MessageHandler(maxsize=total)
+    start_barrier = threading.Barrier(producers + consumers + 1)
+    done = threading.Event()
+
+    def produce():
+        start_barrier.wait()
+        if batched:
+            add_messages = handler.add_messages
+            batch = [('chat', EVENT)] * PRODUCER_BATCH
+            for _ in range(per_producer // PRODUCER_BATCH):
+                add_messages(batch)
+        else:
+            add_message = handler.add_message
+            for _ in range(per_producer):
+                add_message('chat', EVENT)
+
+    def consume():
+        start_barrier.wait()
+        while not done.is_set():
+            if batched:
+                handler.get_batch(CONSUMER_BATCH, timeout=0.01)
+            else:
+                handler.get_message(timeout=0.01)
+
+    producer_threads = [threading.Thread(target=produce) for _ in range(producers)]
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    for thread in producer_threads + consumer_threads:
+        thread.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for thread in producer_threads:
+        thread.join()
+    while handler.size():
+        time.sleep(0.0005)
+    elapsed = time.perf_counter() - start
+    done.set()
+    for thread in consumer_threads:
+        thread.join()
+    return total / elapsed
+
+
+def run(quick: bool = False) -> Dict[str, Metric]:
+    count = 20000 if quick else 200000
+    results = {}
+
+    def single_thread():
+        handler = MessageHandler(maxsize=count)
+        for _ in range(count):
+            handler.add_message('chat', EVENT)
+        for _ in range(count):
+            handler.get_message_nowait()
+
+    results["queue.single_thread.msgs_per_sec"] = Metric(rate(single_thread, count), 'msgs/s')
+
+    # 各类消息轮流放入，点赞来自不同用户，队列很快满，之后每条都要合并或按优先级丢弃
+    mixed = [(msg_type, dict(PAYLOAD, count=1, user_name=f'user{i % 50}'))
+             for i, msg_type in enumerate(list(TRAFFIC_METHODS) * (count // len(TRAFFIC_METHODS)))]
+
+    def overflow():
+        handler = MessageHandler(maxsize=OVERFLOW_MAXSIZE)
+        add_message = handler.add_message
+        for msg_type, payload in mixed:
+            add_message(msg_type, payload)
+
+    results["queue.overflow.msgs_per_sec"] = Metric(rate(overflow, len(mixed)), 'msgs/s')
+
+    events = [EVENT] * PRODUCER_BATCH
+    for subscribers in FANOUT:
+        def fanout():
+            bus = MessageBus()
+            handlers = [bus.subscribe(str(i), maxsize=count) for i in range(subscribers)]
+            for _ in range(count // PRODUCER_BATCH):
+                bus.publish_many(events)
+            for handler in handlers:
+                while handler.get_batch(CONSUMER_BATCH, timeout=0):
+                    pass
+
+        # 按发布的消息数计，每条消息要进出 subscribers 个订阅队列
+        results[f"queue.bus.fanout{subscribers}.msgs_per_sec"] = Metric(rate(fanout, count), 'msgs/s')
+    for mode, batched in (('single', False), ('batch', True)):
+        for producers, consumers in CONTENTION:
+            value = max(_contended(producers, consumers, count // producers, batched) for _ in range(3))
+            results[f"queue.{mode}.p{producers}_c{consumers}.msgs_per_sec"] = Metric(value, 'msgs/s')
+    return results
+
+
+if __name__ == '__main__':
+    print_metrics(run('--quick' in sys.argv))
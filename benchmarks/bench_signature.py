@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+签名计算的单次延迟：websocket signature（sign.js）、a_bogus（纯Python与a_bogus.js）、__ac_signature
+
+JS 上下文在计时前预热，测量的是稳定状态下每次调用的延迟，不包含首次编译脚本。
+
+用法: python benchmarks/bench_signature.py [--quick]
+"""
+
+import itertools
+import os
+import sys
+from typing import Dict
+
+from metrics import ROOT, Metric, latencies, latency_metrics, print_metrics, quiet
+
+from ac_signature import get__ac_signature
+from liveMan import DouyinLiveWebFetcher, generateSignature
+
+SITE = "www.douyin.com/"
+
+
+def run(quick: bool = False) -> Dict[str, Metric]:
+    number = 50 if quick else 500
+    # 只创建对象，不发起请求
+    fetcher = DouyinLiveWebFetcher('bench', skip_bootstrap=True)
+    user_agent = fetcher.user_agent
+    counter = itertools.count()
+    # 每次使用不同的参数，避免测到任何缓存
+    wss_urls = (fetcher._buildWssUrl().replace('room_id=bench', f'room_id={i}') for i in counter)
+    url_params = ({'aid': '6383', 'room_id': str(i), 'live_id': '1', 'msToken': ''} for i in counter)
+    nonces = (f"0{i:020x}" for i in counter)
+
+    sign_js = os.path.join(ROOT, 'sign.js')
+    abogus_js = os.path.join(ROOT, 'a_bogus.js')
+    js_fetcher = DouyinLiveWebFetcher('bench', abogus_file=abogus_js, skip_bootstrap=True)
+
+    cases = (
+        ('generateSignature', lambda: generateSignature(next(wss_urls), sign_js)),
+        ('get_a_bogus.python', lambda: fetcher.get_a_bogus(next(url_params))),
+        ('get_a_bogus.js', lambda: js_fetcher.get_a_bogus(next(url_params))),
+        ('get__ac_signature', lambda: get__ac_signature(SITE, next(nonces), user_agent)),
+    )
+    results = {}
+    for name, func in cases:
+        with quiet():
+            # 预热
+            for _ in range(3):
+                func()
+            samples = latencies(func, number)
+        results.update(latency_metrics(f"signature.{name}", samples))
+    return results
+
+
+if __name__ == '__main__':
+    print_metrics(run('--quick' in sys.argv))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TTS播报文本生成（GUI中 check_tts_trigger 使用的 render_tts_text）的单次耗时
+
+使用项目中的 tts_config.json，分别测量进场、关注、礼物、命中关键字的聊天、未命中关键字的聊天。
+另外测量合成结果缓存（edgetts/tts_cache.py）命中内存、命中磁盘时取出一段约20KB音频的耗时。
+
+用法: python benchmarks/bench_tts.py [--quick]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import timeit
+from typing import Dict
+
+from metrics import ROOT, Metric, print_metrics
+
+from edgetts.tts_cache import TTSCache
+from tts_trigger import render_tts_text
+
+CASES = {
+    'member': ('member', {'user_name': '小明', 'user_id': 1, 'gender': '男'}),
+    'social': ('social', {'user_name': '小明', 'user_id': 1}),
+    'gift': ('gift', {'user_name': '小明', 'gift_name': '小心心', 'gift_count': 3}),
+    'chat_keyword': ('chat', {'user_name': '小明', 'user_id': 1, 'content': '主播，我有个问题'}),
+    'chat_miss': ('chat', {'user_name': '小明', 'user_id': 1, 'content': '今天天气真不错，主播晚上好'}),
+}
+
+
+def run(quick: bool = False) -> Dict[str, Metric]:
+    number = 20000 if quick else 200000
+    with open(os.path.join(ROOT, 'tts_config.json'), 'r', encoding='utf-8') as f:
+        tts_config = json.load(f)
+    results = {}
+    for name, (msg_type, payload) in CASES.items():
+        cost = min(timeit.repeat(lambda: render_tts_text(tts_config, msg_type, payload), number=number, repeat=3))
+        results[f"tts.render.{name}.ns_per_call"] = Metric(cost / number * 1e9, 'ns', False)
+
+    number //= 20
+    audio = os.urandom(20 * 1024)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        TTSCache(cache_dir).put('感谢 小明 的关注', 'zh-CN-YunjianNeural', '+0%', audio)
+        cache = TTSCache(cache_dir)
+        for name, get in (
+                ('memory_hit', lambda: cache.get('感谢 小明 的关注', 'zh-CN-YunjianNeural', '+0%')),
+                # 每次先清空内存，强制从磁盘读取
+                ('disk_hit', lambda: (cache._memory.clear(), cache.get('感谢 小明 的关注', 'zh-CN-YunjianNeural', '+0%'))),
+        ):
+            cost = min(timeit.repeat(get, number=number, repeat=3))
+            results[f"tts.cache.{name}.us_per_call"] = Metric(cost / number * 1e6, 'us', False)
+    return results
+
+
+if __name__ == '__main__':
+    print_metrics(run('--quick' in sys.argv))
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+基准测试套件的公共部分：指标、计时、JSON读写与基线对比
+"""
+
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 添加项目根目录到Python路径
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+
+class Metric(NamedTuple):
+    """一项测量结果"""
+    value: float
+    unit: str
+    # 数值越大越好（吞吐）还是越小越好（延迟、内存）
+    higher_is_better: bool = True
+
+
+def rate(func: Callable[[], None], count: int, repeat: int = 3) -> float:
+    """
+    测量吞吐，取多次中最快的一次
+    :param func: 处理 count 个单位的函数
+    :param count: 每次调用处理的单位数
+    :param repeat: 重复次数
+    :return: 每秒处理的单位数
+    """
+    return count / min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def latencies(func: Callable[[], None], number: int) -> List[float]:
+    """
+    逐次测量延迟
+    :param func: 被测函数，调用一次为一个样本
+    :param number: 样本数
+    :return: 排好序的延迟（秒）
+    """
+    samples = []
+    perf_counter = time.perf_counter
+    for _ in range(number):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    samples.sort()
+    return samples
+
+
+def latency_metrics(prefix: str, samples: List[float]) -> Dict[str, Metric]:
+    """
+    :param prefix: 指标名前缀
+    :param samples: 排好序的延迟（秒）
+    :return: 平均值、p50、p99（微秒）
+    """
+    return {
+        f"{prefix}.mean_us": Metric(sum(samples) / len(samples) * 1e6, 'us', False),
+        f"{prefix}.p50_us": Metric(samples[len(samples) // 2] * 1e6, 'us', False),
+        f"{prefix}.p99_us": Metric(samples[min(len(samples) - 1, len(samples) * 99 // 100)] * 1e6, 'us', False),
+    }
+
+
+@contextlib.contextmanager
+def quiet():
+    """
+    屏蔽被测代码的print输出，避免终端输出影响计时
+    """
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def environment() -> Dict[str, str]:
+    """
+    记录运行环境，便于比较不同机器/版本的结果
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    return {
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+
+
+def dump(path: str, metrics: Dict[str, Metric], meta: Dict[str, str]):
+    """
+    把结果写入JSON文件
+    """
+    data = {
+        'meta': meta,
+        'metrics': {name: metric._asdict() for name, metric in sorted(metrics.items())},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load(path: str) -> Dict[str, Metric]:
+    """
+    读取 dump 写入的结果
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {name: Metric(**metric) for name, metric in data['metrics'].items()}
+
+
+def compare(current: Dict[str, Metric], baseline: Dict[str, Metric],
+            threshold: float) -> Tuple[List[Tuple[str, float, float, float, str]], List[str]]:
+    """
+    与基线对比
+    :param current: 本次结果
+    :param baseline: 基线结果
+    :param threshold: 变差超过该比例视为退化，如 0.1 表示 10%
+    :return: ([(指标名, 基线值, 本次值, 变化比例, 结论), ...], 退化的指标名列表)
+             变化比例为正表示变好
+    """
+    rows = []
+    regressions = []
+    for name in sorted(set(current) | set(baseline)):
+        if name not in baseline:
+            rows.append((name, float('nan'), current[name].value, float('nan'), '新增'))
+            continue
+        if name not in current:
+            rows.append((name, baseline[name].value, float('nan'), float('nan'), '缺失'))
+            continue
+        old, new = baseline[name].value, current[name].value
+        if old == 0:
+            change = 0.0 if new == 0 else float('inf')
+        else:
+            change = (new - old) / old
+        if not current[name].higher_is_better:
+            change = -change
+        if change < -threshold:
+            verdict = '退化'
+            regressions.append(name)
+        elif change > threshold:
+            verdict = '提升'
+        else:
+            verdict = ''
+        rows.append((name, old, new, change, verdict))
+    return rows, regressions
+
+
+def print_metrics(metrics: Dict[str, Metric]):
+    for name, metric in sorted(metrics.items()):
+        print(f"  {name:<52}{metric.value:14.2f} {metric.unit}")
+
+
+def print_comparison(rows: Iterable[Tuple[str, float, float, float, str]]):
+    print(f"  {'指标':<50}{'基线':>14}{'本次':>14}{'变化':>10}")
+    for name, old, new, change, verdict in rows:
+        print(f"  {name:<52}{old:14.2f}{new:14.2f}{change * 100:+9.1f}% {verdict}")
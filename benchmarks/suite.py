@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+基准测试套件：接收流水线 → 消息队列 → TTS判断，以及签名计算和内存占用，全部不需要网络
+
+    pipeline   原始帧经 _wsOnMessage 解析分发的每秒帧数（按消息类型、protobuf后端、是否使用解析池）
+    queue      MessageHandler.add_message/get_message 在多线程竞争下的吞吐，MessageBus 广播的吞吐
+    signature  generateSignature、get_a_bogus、get__ac_signature 的单次延迟
+    tts        check_tts_trigger 所用的 render_tts_text 的单次耗时
+    memory     队列中每条消息占用的内存
+
+结果以JSON输出，便于跟踪趋势；指定基线时逐项对比，变差超过阈值的指标视为退化，退出码为1。
+
+用法: python benchmarks/suite.py [--quick] [--only pipeline,queue] [--output results.json]
+                                 [--baseline baseline.json] [--threshold 0.1]
+"""
+
+import argparse
+import sys
+
+from metrics import compare, dump, environment, load, print_comparison, print_metrics
+
+import bench_memory
+import bench_pipeline
+import bench_queue
+import bench_signature
+import bench_tts
+
+BENCHMARKS = {
+    'pipeline': bench_pipeline.run,
+    'queue': bench_queue.run,
+    'signature': bench_signature.run,
+    'tts': bench_tts.run,
+    'memory': bench_memory.run,
+}
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="基准测试套件")
+    parser.add_argument('--quick', action='store_true', help="减少样本数，快速检查")
+    parser.add_argument('--only', default='', help=f"只运行指定的测试，逗号分隔，可选: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--output', help="结果写入的JSON文件")
+    parser.add_argument('--baseline', help="对比的基线JSON文件（之前 --output 的结果）")
+    parser.add_argument('--threshold', type=float, default=0.1, help="变差超过该比例视为退化，默认0.1")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    names = [name for name in args.only.split(',') if name] or list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise SystemExit(f"未知的测试: {', '.join(sorted(unknown))}")
+
+    meta = environment()
+    meta['quick'] = args.quick
+    metrics = {}
+    for name in names:
+        print(f"[{name}]")
+        results = BENCHMARKS[name](args.quick)
+        print_metrics(results)
+        metrics.update(results)
+
+    if args.output:
+        dump(args.output, metrics, meta)
+        print(f"结果已写入: {args.output}")
+
+    if args.baseline:
+        baseline = load(args.baseline)
+        # 只对比本次运行过的测试
+        baseline = {name: metric for name, metric in baseline.items() if name.split('.', 1)[0] in names}
+        rows, regressions = compare(metrics, baseline, args.threshold)
+        print(f"与基线对比 ({args.baseline})，阈值 {args.threshold:.0%}")
+        print_comparison(rows)
+        if regressions:
+            print(f"退化 {len(regressions)} 项: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
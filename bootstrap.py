@@ -0,0 +1,264 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+直播间连接前的引导数据共享层
+
+- 进程内共享一个带连接池的 requests.Session，所有直播间复用 TCP/TLS 连接
+- 用带过期时间的缓存保存 ttwid 和 live_id -> room_id 的映射，可选持久化到磁盘，
+  进程重启后在有效期内无需再发起 HTTP 请求
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+ROOM_ID_PATTERN = re.compile(rb'roomId\\":\\"(\d+)\\"')
+# 跨块保留的字节数，需大于一次完整匹配的最大长度
+_ROOM_ID_OVERLAP = 64
+
+
+class RoomIdNotFoundError(Exception):
+    """
+    直播间页面中未找到 roomId
+    """
+
+    def __init__(self, live_id: str, reason: str, bytes_read: int = 0):
+        """
+        :param live_id: 直播间的直播id
+        :param reason: 失败原因
+        :param bytes_read: 已读取的字节数
+        """
+        super().__init__(f"live_id={live_id}: {reason} (已读取 {bytes_read} 字节)")
+        self.live_id = live_id
+        self.reason = reason
+        self.bytes_read = bytes_read
+
+
+class RoomIdScanner:
+    """
+    增量扫描页面内容查找 roomId
+    相邻块之间保留一段重叠，保证跨块边界的匹配不会漏掉
+    """
+
+    def __init__(self):
+        self._tail = b''
+        self.bytes_read = 0
+
+    def feed(self, chunk: bytes) -> Optional[str]:
+        """
+        输入一个数据块
+        :param chunk: 页面内容的字节块
+        :return: 找到时返回roomId，否则返回None
+        """
+        if not chunk:
+            return None
+        self.bytes_read += len(chunk)
+        buf = self._tail + chunk
+        match = ROOM_ID_PATTERN.search(buf)
+        if match:
+            return match.group(1).decode()
+        self._tail = buf[-_ROOM_ID_OVERLAP:]
+        return None
+
+
+def scan_room_id(chunks: Iterable[bytes]) -> Optional[str]:
+    """
+    逐块扫描页面内容查找 roomId，找到后立即返回，不再消费后续数据块
+    :param chunks: 页面内容的字节块
+    :return: roomId，未找到时返回None
+    """
+    scanner = RoomIdScanner()
+    for chunk in chunks:
+        room_id = scanner.feed(chunk)
+        if room_id:
+            return room_id
+    return None
+
+
+def fetch_room_id(session: requests.Session, live_id: str, url: str, headers: Dict[str, str],
+                  chunk_size: int = 8192) -> str:
+    """
+    流式请求直播间页面并提取 roomId，找到后立即断开下载
+    :param session: HTTP 会话
+    :param live_id: 直播间的直播id
+    :param url: 直播间页面地址
+    :param headers: 请求头
+    :param chunk_size: 每次读取的字节数
+    :return: roomId
+    :raises RoomIdNotFoundError: 页面中没有 roomId
+    """
+    scanner = RoomIdScanner()
+    with session.get(url, headers=headers, stream=True) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            room_id = scanner.feed(chunk)
+            if room_id:
+                return room_id
+    raise RoomIdNotFoundError(live_id, "页面中未找到roomId", scanner.bytes_read)
+
+
+class TTLCache:
+    """
+    带过期时间的键值缓存，线程安全，可选持久化为 JSON 文件
+    """
+
+    def __init__(self, ttl: float, persist_file: Optional[str] = None):
+        """
+        :param ttl: 默认有效期（秒）
+        :param persist_file: 持久化文件路径，None 表示只保存在内存中
+        """
+        self.ttl = ttl
+        self.persist_file = persist_file
+        self.lock = threading.Lock()
+        self._data: Dict[str, list] = {}
+        self._load()
+
+    def _load(self):
+        if not self.persist_file or not os.path.exists(self.persist_file):
+            return
+        try:
+            with open(self.persist_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"【X】读取缓存文件失败: {e}")
+            return
+        now = time.time()
+        self._data = {k: v for k, v in data.items() if v[1] > now}
+
+    def _save(self):
+        if not self.persist_file:
+            return
+        tmp_file = self.persist_file + '.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(tmp_file, self.persist_file)
+        except Exception as e:
+            print(f"【X】写入缓存文件失败: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        获取缓存值
+        :param key: 键
+        :return: 未过期的值，不存在或已过期时返回None
+        """
+        with self.lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if item[1] <= time.time():
+                del self._data[key]
+                return None
+            return item[0]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        写入缓存值
+        :param key: 键
+        :param value: 值，需可被 JSON 序列化
+        :param ttl: 有效期（秒），默认使用构造时的 ttl
+        """
+        with self.lock:
+            self._data[key] = [value, time.time() + (self.ttl if ttl is None else ttl)]
+            self._save()
+
+    def delete(self, key: str):
+        """
+        删除缓存值
+        :param key: 键
+        """
+        with self.lock:
+            if self._data.pop(key, None) is not None:
+                self._save()
+
+
+class BootstrapCache:
+    """
+    ttwid 与 room_id 的缓存
+    ttwid 与具体直播间无关，全部直播间共用一个；room_id 在主播重新开播后会变化，有效期较短
+    """
+
+    def __init__(self, persist_file: Optional[str] = None, ttwid_ttl: float = 12 * 3600,
+                 room_id_ttl: float = 30 * 60):
+        """
+        :param persist_file: 持久化文件路径，None 表示只保存在内存中
+        :param ttwid_ttl: ttwid 有效期（秒）
+        :param room_id_ttl: room_id 有效期（秒）
+        """
+        self.room_id_ttl = room_id_ttl
+        self.cache = TTLCache(ttwid_ttl, persist_file)
+
+    def get_ttwid(self) -> Optional[str]:
+        return self.cache.get('ttwid')
+
+    def set_ttwid(self, ttwid: str):
+        self.cache.set('ttwid', ttwid)
+
+    def get_room_id(self, live_id: str) -> Optional[str]:
+        return self.cache.get(f'room_id:{live_id}')
+
+    def set_room_id(self, live_id: str, room_id: str):
+        self.cache.set(f'room_id:{live_id}', room_id, self.room_id_ttl)
+
+    def invalidate_room_id(self, live_id: str):
+        """
+        room_id 失效（如主播重新开播）时调用，下次会重新请求直播间页面
+        :param live_id: 直播间的直播id
+        """
+        self.cache.delete(f'room_id:{live_id}')
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_cache: Optional[BootstrapCache] = None
+_lock = threading.Lock()
+
+
+def get_shared_session(pool_maxsize: int = 32) -> requests.Session:
+    """
+    获取进程内共享的 HTTP 会话，所有直播间复用同一个连接池
+    :param pool_maxsize: 每个主机的最大连接数，仅在首次创建时生效
+    :return: requests.Session
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _lock:
+            if _shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _shared_session = session
+    return _shared_session
+
+
+def get_bootstrap_cache() -> BootstrapCache:
+    """
+    获取进程内共享的引导缓存，默认只保存在内存中，可通过 configure_bootstrap_cache 开启持久化
+    :return: BootstrapCache
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _lock:
+            if _shared_cache is None:
+                _shared_cache = BootstrapCache()
+    return _shared_cache
+
+
+def configure_bootstrap_cache(persist_file: Optional[str] = None, **kwargs) -> BootstrapCache:
+    """
+    替换进程内共享的引导缓存，应在创建 DouyinLiveWebFetcher 之前调用
+    :param persist_file: 持久化文件路径，如 'bootstrap_cache.json'
+    :param kwargs: 传给 BootstrapCache 的其他参数
+    :return: 新的 BootstrapCache
+    """
+    global _shared_cache
+    with _lock:
+        _shared_cache = BootstrapCache(persist_file, **kwargs)
+    return _shared_cache
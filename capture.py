@@ -0,0 +1,271 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+原始帧录制与回放
+
+录制：把websocket收到的原始 PushFrame 连同接收时间追加写入录制文件，可选zstd压缩。
+回放：把录制文件按原速、N倍速或最快速度送回抓取对象的 _wsOnMessage，
+ack/解析/分发/消息队列都走与在线时完全相同的代码，不需要网络，可用于离线压测和吞吐回归。
+
+文件格式：
+    文件头  b'DYCAP' + 版本(1字节) + 压缩方式(1字节，0 不压缩 / 1 zstd)
+    记录    接收时间(float64，秒，time.time()) + 帧长度(uint32) + 帧数据，小端序
+压缩时文件头之后的全部记录为一个zstd流。帧的payload本身是gzip数据，zstd主要压缩帧头、
+时间戳和长度字段，长时间录制时可以省下一部分空间。
+"""
+
+import asyncio
+import struct
+import threading
+import time
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Tuple
+
+import websocket
+
+MAGIC = b'DYCAP'
+VERSION = 1
+COMPRESSION_NONE = 0
+COMPRESSION_ZSTD = 1
+
+_HEADER = struct.Struct('<5sBB')
+_RECORD = struct.Struct('<dI')
+
+
+class CaptureFormatError(ValueError):
+    """录制文件格式错误"""
+
+
+def _zstandard():
+    # 可选依赖，只有压缩录制或读取压缩的录制文件时才需要安装 zstandard
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd压缩需要安装 zstandard: pip install zstandard") from None
+    return zstandard
+
+
+class FrameRecorder:
+    """
+    原始帧录制器，线程安全，多个直播间可以写同一个文件
+    """
+
+    def __init__(self, path: str, compress: bool = False, level: int = 3):
+        """
+        :param path: 录制文件路径，已存在时覆盖
+        :param compress: 是否使用zstd压缩（需 pip install zstandard）
+        :param level: zstd压缩级别
+        """
+        self.path = path
+        self.compress = compress
+        self.frames = 0
+        self.lock = threading.Lock()
+        if compress:
+            zstandard = _zstandard()
+        self._file = open(path, 'wb')
+        self._file.write(_HEADER.pack(MAGIC, VERSION, COMPRESSION_ZSTD if compress else COMPRESSION_NONE))
+        if compress:
+            self._out: BinaryIO = zstandard.ZstdCompressor(level=level).stream_writer(self._file)
+        else:
+            self._out = self._file
+
+    def record(self, frame: bytes, timestamp: Optional[float] = None):
+        """
+        追加一帧
+        :param frame: websocket收到的原始数据
+        :param timestamp: 接收时间，为None时取当前时间
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        with self.lock:
+            if self._out is None:
+                return
+            self._out.write(_RECORD.pack(timestamp, len(frame)))
+            self._out.write(frame)
+            self.frames += 1
+
+    def flush(self):
+        """
+        把缓冲区写入文件，压缩时结束当前zstd块，程序异常退出时已flush的帧仍可读取
+        """
+        with self.lock:
+            if self._out is not None:
+                self._out.flush()
+
+    def close(self):
+        with self.lock:
+            if self._out is None:
+                return
+            out, self._out = self._out, None
+            out.close()
+            if out is not self._file:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_capture(path: str) -> Iterator[Tuple[float, bytes]]:
+    """
+    读取录制文件，末尾不完整的记录（录制中途退出）被忽略
+    :param path: 录制文件路径
+    :return: 依次产出 (接收时间, 原始帧)
+    :raises CaptureFormatError: 不是录制文件或版本不支持
+    """
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise CaptureFormatError(f"不是录制文件: {path}")
+        magic, version, compression = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise CaptureFormatError(f"不是录制文件: {path}")
+        if version != VERSION:
+            raise CaptureFormatError(f"不支持的录制文件版本: {version}")
+        if compression == COMPRESSION_ZSTD:
+            stream: BinaryIO = _zstandard().ZstdDecompressor().stream_reader(f, read_across_frames=True)
+        elif compression == COMPRESSION_NONE:
+            stream = f
+        else:
+            raise CaptureFormatError(f"不支持的压缩方式: {compression}")
+        while True:
+            head = _read_exact(stream, _RECORD.size)
+            if head is None:
+                return
+            timestamp, length = _RECORD.unpack(head)
+            frame = _read_exact(stream, length)
+            if frame is None:
+                return
+            yield timestamp, frame
+
+
+def _read_exact(stream: BinaryIO, size: int) -> Optional[bytes]:
+    """
+    读取size字节，流结束时返回None
+    """
+    data = stream.read(size)
+    if len(data) == size:
+        return data
+    # zstd流的read可能返回少于size的数据
+    chunks = [data]
+    received = len(data)
+    while data and received < size:
+        data = stream.read(size - received)
+        chunks.append(data)
+        received += len(data)
+    return b''.join(chunks) if received == size else None
+
+
+class ReplayStats(NamedTuple):
+    """回放结果"""
+    frames: int
+    acks: int
+    errors: int
+    seconds: float
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.seconds if self.seconds else 0.0
+
+
+class ReplaySocket:
+    """
+    代替websocket传给 _wsOnMessage，丢弃发出的ack并计数
+    """
+
+    def __init__(self):
+        self.acks = 0
+        self.closed = False
+
+    def send(self, data, opcode=websocket.ABNF.OPCODE_TEXT):
+        self.acks += 1
+
+    async def send_bytes(self, data):
+        self.acks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class _Pacer:
+    """
+    按录制时的帧间隔控制回放节奏
+    """
+
+    def __init__(self, speed: Optional[float]):
+        self.speed = speed
+        self.first = None
+        self.start = None
+
+    def delay(self, timestamp: float) -> float:
+        """
+        :return: 距离该帧应当送出还需等待的秒数
+        """
+        if not self.speed:
+            return 0
+        if self.first is None:
+            self.first = timestamp
+            self.start = time.monotonic()
+            return 0
+        return self.start + (timestamp - self.first) / self.speed - time.monotonic()
+
+
+def replay(fetcher, path: str, speed: Optional[float] = 1.0, limit: Optional[int] = None) -> ReplayStats:
+    """
+    把录制文件回放给 DouyinLiveWebFetcher，不建立网络连接
+    :param fetcher: DouyinLiveWebFetcher
+    :param path: 录制文件路径
+    :param speed: 回放倍速，1为原速，None或0为最快速度
+    :param limit: 最多回放的帧数，None表示全部
+    :return: ReplayStats，耗时包含解析池中剩余帧的交付
+    """
+    ws = ReplaySocket()
+    pacer = _Pacer(speed)
+    frames = errors = 0
+    start = time.perf_counter()
+    for timestamp, frame in read_capture(path):
+        if limit is not None and frames >= limit:
+            break
+        delay = pacer.delay(timestamp)
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            fetcher._wsOnMessage(ws, frame)
+        except Exception as e:
+            print("【X】回放帧出错: ", e)
+            errors += 1
+        frames += 1
+    fetcher.flush()
+    return ReplayStats(frames, ws.acks, errors, time.perf_counter() - start)
+
+
+async def replay_async(fetcher, path: str, speed: Optional[float] = 1.0,
+                       limit: Optional[int] = None) -> ReplayStats:
+    """
+    把录制文件回放给 AsyncDouyinLiveWebFetcher，参数与返回值同 replay
+    """
+    loop = asyncio.get_running_loop()
+    # 解析池交付结果时需要知道事件循环，正常情况下由 start 设置
+    fetcher._loop = loop
+    ws = ReplaySocket()
+    pacer = _Pacer(speed)
+    frames = errors = 0
+    start = time.perf_counter()
+    for timestamp, frame in read_capture(path):
+        if limit is not None and frames >= limit:
+            break
+        delay = pacer.delay(timestamp)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            await fetcher._wsOnMessage(ws, frame)
+        except Exception as e:
+            print("【X】回放帧出错: ", e)
+            errors += 1
+        frames += 1
+    await loop.run_in_executor(None, fetcher.flush)
+    # 让 flush 期间通过 call_soon_threadsafe 交付的消息处理完
+    await asyncio.sleep(0)
+    return ReplayStats(frames, ws.acks, errors, time.perf_counter() - start)
@@ -0,0 +1,327 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+protobuf 编解码后端
+
+同一份 protobuf/douyin.proto 有两种 Python 实现：
+- betterproto: protobuf/douyin.py，纯Python，默认使用；高频消息走 protobuf/fast_decoder.py
+- protobuf: protobuf/douyin_pb2.py，使用官方 protobuf 运行时（upb/C++ 实现），需 pip install protobuf
+
+两种后端解析出的帧、Response 和消息内容完全一致，liveMan 只通过这里的接口访问，
+在启动时用 configure_codec 选择即可。
+"""
+
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, NamedTuple
+
+from events import (ChatEvent, ControlEvent, EmojiChatEvent, Event, FansclubEvent, GiftEvent, LikeEvent, MemberEvent,
+                    RankEntry, RankEvent, RoomDisplayStatsEvent, RoomEvent, RoomStatsEvent, SocialEvent,
+                    StreamAdaptationEvent)
+from protobuf import douyin
+from protobuf import fast_decoder
+
+
+class Frame(NamedTuple):
+    """PushFrame 中用到的字段"""
+    log_id: int
+    payload_type: str
+    payload: bytes
+
+
+class ResponseView(NamedTuple):
+    """Response 中用到的字段，messages_list 中的元素带有 method 与 payload 属性"""
+    messages_list: List[Any]
+    cursor: str
+    internal_ext: str
+    push_server: str
+    heartbeat_duration: int
+    fetch_interval: int
+    need_ack: bool
+
+
+def _gender(value: int) -> str:
+    return ["女", "男"][value]
+
+
+def gunzip(data: bytes) -> bytes:
+    """
+    解压gzip数据，一次调用完成，省去 gzip.decompress 在Python层解析文件头和多成员循环的开销
+    """
+    return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+
+# Response: cursor=2, fetch_interval=3, internal_ext=5, heartbeat_duration=8, need_ack=9, push_server=10
+_RESPONSE_HEADER_FIELDS = frozenset((2, 3, 5, 8, 9, 10))
+
+
+def scan_response_header(data: bytes) -> ResponseView:
+    """
+    只扫描 Response 中除消息列表外的字段，消息列表按长度跳过，用于尽快回复ack和记录续传位置
+    与编解码后端无关
+    :param data: 解压后的 Response
+    :return: ResponseView，其中 messages_list 为 None
+    """
+    fields = fast_decoder.scan_fields(data, _RESPONSE_HEADER_FIELDS)
+    return ResponseView(None, fields.get(2, b'').decode('utf-8'), fields.get(5, b'').decode('utf-8'),
+                        fields.get(10, b'').decode('utf-8'), fields.get(8, 0), fields.get(3, 0),
+                        bool(fields.get(9, 0)))
+
+
+def decode_messages(codec, data: bytes, wanted: Dict[str, str]) -> List[Event]:
+    """
+    解析 Response 中需要的消息
+    :param codec: 编解码后端
+    :param data: 解压后的 Response
+    :param wanted: 需要解析的 Message.method -> 消息类型，其余消息不解析
+    :return: 事件列表（见 events.py），与消息列表顺序一致
+    """
+    decoded = []
+    for msg in codec.parse_response(data).messages_list:
+        msg_type = wanted.get(msg.method)
+        if msg_type is None:
+            continue
+        try:
+            decoded.append(codec.decode(msg_type, msg.payload))
+        except Exception as e:
+            print(f"【X】解析{msg.method}出错: ", e)
+    return decoded
+
+
+class BetterprotoCodec:
+    """
+    betterproto 后端
+    """
+
+    name = 'betterproto'
+
+    def __init__(self):
+        self.decoders: Dict[str, Callable[[bytes], Event]] = {
+            'chat': fast_decoder.decode_chat,
+            'gift': fast_decoder.decode_gift,
+            'like': fast_decoder.decode_like,
+            'member': fast_decoder.decode_member,
+            'social': fast_decoder.decode_social,
+            'room_stats': self._room_stats,
+            'fansclub': self._fansclub,
+            'control': self._control,
+            'emoji_chat': self._emoji_chat,
+            'room_display_stats': self._room_display_stats,
+            'room': self._room,
+            'rank': self._rank,
+            'stream_adaptation': self._stream_adaptation,
+        }
+
+    def parse_frame(self, data: bytes) -> Frame:
+        package = douyin.PushFrame().parse(data)
+        return Frame(package.log_id, package.payload_type, package.payload)
+
+    def parse_response(self, data: bytes) -> ResponseView:
+        response = douyin.Response().parse(data)
+        return ResponseView(response.messages_list, response.cursor, response.internal_ext, response.push_server,
+                            response.heartbeat_duration, response.fetch_interval, response.need_ack)
+
+    def build_ack(self, log_id: int, internal_ext: str) -> bytes:
+        return douyin.PushFrame(log_id=log_id, payload_type='ack',
+                                payload=internal_ext.encode('utf-8')).SerializeToString()
+
+    def decode(self, msg_type: str, payload: bytes) -> Event:
+        """
+        解析消息体
+        :param msg_type: 消息类型，如 'chat'
+        :param payload: Message.payload
+        :return: 消息类型对应的事件
+        """
+        return self.decoders[msg_type](payload)
+
+    @staticmethod
+    def _room_stats(payload):
+        message = douyin.RoomUserSeqMessage().parse(payload)
+        return RoomStatsEvent(message.total, message.total_pv_for_anchor)
+
+    @staticmethod
+    def _fansclub(payload):
+        return FansclubEvent(douyin.FansclubMessage().parse(payload).content)
+
+    @staticmethod
+    def _control(payload):
+        return ControlEvent(douyin.ControlMessage().parse(payload).status)
+
+    @staticmethod
+    def _emoji_chat(payload):
+        message = douyin.EmojiChatMessage().parse(payload)
+        return EmojiChatEvent(message.emoji_id, message.user.nick_name, message.user.id, message.default_content)
+
+    @staticmethod
+    def _room_display_stats(payload):
+        return RoomDisplayStatsEvent(douyin.RoomStatsMessage().parse(payload).display_long)
+
+    @staticmethod
+    def _room(payload):
+        return RoomEvent(douyin.RoomMessage().parse(payload).common.room_id)
+
+    @staticmethod
+    def _rank(payload):
+        message = douyin.RoomRankMessage().parse(payload)
+        return RankEvent(tuple(RankEntry(rank.user.nick_name, rank.user.id, rank.score_str)
+                               for rank in message.ranks_list))
+
+    @staticmethod
+    def _stream_adaptation(payload):
+        return StreamAdaptationEvent(douyin.RoomStreamAdaptationMessage().parse(payload).adaptation_type)
+
+
+class ProtobufCodec:
+    """
+    官方 protobuf 运行时后端，解析在C扩展中完成，User/GiftStruct 等大型嵌套结构解析更快
+    """
+
+    name = 'protobuf'
+
+    def __init__(self):
+        # 可选依赖，只有选用该后端时才需要安装 protobuf
+        from protobuf import douyin_pb2
+        self.pb = douyin_pb2
+        self.decoders: Dict[str, Callable[[bytes], Event]] = {
+            'chat': self._chat,
+            'gift': self._gift,
+            'like': self._like,
+            'member': self._member,
+            'social': self._social,
+            'room_stats': self._room_stats,
+            'fansclub': self._fansclub,
+            'control': self._control,
+            'emoji_chat': self._emoji_chat,
+            'room_display_stats': self._room_display_stats,
+            'room': self._room,
+            'rank': self._rank,
+            'stream_adaptation': self._stream_adaptation,
+        }
+
+    def _parse(self, cls, payload):
+        message = cls()
+        message.ParseFromString(payload)
+        return message
+
+    def parse_frame(self, data: bytes) -> Frame:
+        package = self._parse(self.pb.PushFrame, data)
+        return Frame(package.logId, package.payloadType, package.payload)
+
+    def parse_response(self, data: bytes) -> ResponseView:
+        response = self._parse(self.pb.Response, data)
+        return ResponseView(list(response.messagesList), response.cursor, response.internalExt,
+                            response.pushServer, response.heartbeatDuration, response.fetchInterval,
+                            response.needAck)
+
+    def build_ack(self, log_id: int, internal_ext: str) -> bytes:
+        return self.pb.PushFrame(logId=log_id, payloadType='ack',
+                                 payload=internal_ext.encode('utf-8')).SerializeToString()
+
+    def decode(self, msg_type: str, payload: bytes) -> Event:
+        """
+        解析消息体
+        :param msg_type: 消息类型，如 'chat'
+        :param payload: Message.payload
+        :return: 消息类型对应的事件
+        """
+        return self.decoders[msg_type](payload)
+
+    def _chat(self, payload):
+        message = self._parse(self.pb.ChatMessage, payload)
+        return ChatEvent(message.user.nickName, message.user.id, message.content)
+
+    def _gift(self, payload):
+        message = self._parse(self.pb.GiftMessage, payload)
+        return GiftEvent(message.user.nickName, message.gift.name, message.comboCount)
+
+    def _like(self, payload):
+        message = self._parse(self.pb.LikeMessage, payload)
+        return LikeEvent(message.user.nickName, message.count)
+
+    def _member(self, payload):
+        message = self._parse(self.pb.MemberMessage, payload)
+        return MemberEvent(message.user.nickName, message.user.id, _gender(message.user.gender))
+
+    def _social(self, payload):
+        message = self._parse(self.pb.SocialMessage, payload)
+        return SocialEvent(message.user.nickName, message.user.id)
+
+    def _room_stats(self, payload):
+        message = self._parse(self.pb.RoomUserSeqMessage, payload)
+        return RoomStatsEvent(message.total, message.totalPvForAnchor)
+
+    def _fansclub(self, payload):
+        return FansclubEvent(self._parse(self.pb.FansclubMessage, payload).content)
+
+    def _control(self, payload):
+        return ControlEvent(self._parse(self.pb.ControlMessage, payload).status)
+
+    def _emoji_chat(self, payload):
+        message = self._parse(self.pb.EmojiChatMessage, payload)
+        return EmojiChatEvent(message.emojiId, message.user.nickName, message.user.id, message.defaultContent)
+
+    def _room_display_stats(self, payload):
+        return RoomDisplayStatsEvent(self._parse(self.pb.RoomStatsMessage, payload).displayLong)
+
+    def _room(self, payload):
+        return RoomEvent(self._parse(self.pb.RoomMessage, payload).common.roomId)
+
+    def _rank(self, payload):
+        message = self._parse(self.pb.RoomRankMessage, payload)
+        return RankEvent(tuple(RankEntry(rank.user.nickName, rank.user.id, rank.scoreStr)
+                               for rank in message.ranksList))
+
+    def _stream_adaptation(self, payload):
+        return StreamAdaptationEvent(self._parse(self.pb.RoomStreamAdaptationMessage, payload).adaptationType)
+
+
+CODECS = {
+    BetterprotoCodec.name: BetterprotoCodec,
+    ProtobufCodec.name: ProtobufCodec,
+}
+
+_codec = None
+_lock = threading.Lock()
+
+
+def create_codec(name: str = 'betterproto'):
+    """
+    创建编解码后端
+    :param name: 'betterproto'、'protobuf'，或 'auto'（已安装 protobuf 时使用 protobuf，否则使用 betterproto）
+    :return: BetterprotoCodec 或 ProtobufCodec
+    :raises ImportError: 选择 'protobuf' 但没有安装 protobuf
+    """
+    if name == 'auto':
+        try:
+            return ProtobufCodec()
+        except ImportError:
+            return BetterprotoCodec()
+    if name not in CODECS:
+        raise ValueError(f"未知的编解码后端: {name}，可选: auto, {', '.join(CODECS)}")
+    return CODECS[name]()
+
+
+def get_codec():
+    """
+    获取进程内共享的编解码后端，默认为 betterproto，可通过 configure_codec 修改
+    """
+    global _codec
+    if _codec is None:
+        with _lock:
+            if _codec is None:
+                _codec = BetterprotoCodec()
+    return _codec
+
+
+def configure_codec(name: str = 'betterproto'):
+    """
+    替换进程内共享的编解码后端，应在创建 DouyinLiveWebFetcher 之前调用
+    :param name: 见 create_codec
+    :return: 新的编解码后端
+    """
+    global _codec
+    codec = create_codec(name)
+    with _lock:
+        _codec = codec
+    return codec
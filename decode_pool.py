@@ -0,0 +1,159 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+Response 解析流水线
+
+接收线程只做必要的工作：解析 PushFrame、解压、扫描 Response 头部字段并立即回复ack；
+消息列表的解析交给有界的线程池/进程池，结果按帧序号依次交付，保证同一直播间内的消息顺序不变。
+"""
+
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from codec import create_codec, decode_messages
+from events import AnyMessage
+
+# 工作线程/进程中按名称缓存的编解码后端
+_codecs = {}
+
+
+def _decode_job(codec_name: str, data: bytes, wanted: Dict[str, str]) -> List[AnyMessage]:
+    codec = _codecs.get(codec_name)
+    if codec is None:
+        codec = _codecs[codec_name] = create_codec(codec_name)
+    return decode_messages(codec, data, wanted)
+
+
+class DecodePool:
+    """
+    解析消息列表的线程池/进程池，可被多个直播间共用
+    线程池适合单个或少量直播间，主要作用是让接收线程不被解析阻塞；
+    进程池可以绕开GIL，适合大量直播间同时刷礼物的场景，代价是每帧需要在进程间传递数据
+    """
+
+    def __init__(self, workers: int = 2, use_processes: bool = False):
+        """
+        :param workers: 线程/进程数
+        :param use_processes: 是否使用进程池
+        """
+        self.workers = workers
+        self.use_processes = use_processes
+        if use_processes:
+            self.executor: Executor = ProcessPoolExecutor(workers)
+        else:
+            self.executor = ThreadPoolExecutor(workers, thread_name_prefix="DecodePool")
+
+    def submit(self, codec_name: str, data: bytes, wanted: Dict[str, str]) -> Future:
+        """
+        提交一个解压后的 Response
+        :param codec_name: 编解码后端名称
+        :param data: 解压后的 Response
+        :param wanted: 需要解析的 Message.method -> 消息类型
+        :return: Future，结果为解析出的事件列表（见 events.py），进程池中事件经 pickle 传回
+        """
+        return self.executor.submit(_decode_job, codec_name, data, wanted)
+
+    def shutdown(self, wait: bool = True):
+        self.executor.shutdown(wait)
+
+
+class OrderedDelivery:
+    """
+    一个直播间的解析结果按提交顺序交付
+    在途帧数有上限，超过时 submit 阻塞，避免解析跟不上时内存无限增长
+    """
+
+    def __init__(self, pool: DecodePool, deliver: Callable[[List[AnyMessage]], None],
+                 max_pending: int = 64):
+        """
+        :param pool: 解析池
+        :param deliver: 按顺序接收解析结果（事件列表）的回调，在解析池的线程中调用
+        :param max_pending: 最大在途帧数
+        """
+        self.pool = pool
+        self.deliver = deliver
+        self.lock = threading.Lock()
+        self._idle = threading.Condition(self.lock)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._next_submit = 0
+        self._next_deliver = 0
+        self._done = {}
+
+    def submit(self, codec_name: str, data: bytes, wanted: Dict[str, str]):
+        """
+        提交一帧，分配序号
+        """
+        self._slots.acquire()
+        with self.lock:
+            seq = self._next_submit
+            self._next_submit += 1
+        try:
+            future = self.pool.submit(codec_name, data, wanted)
+        except Exception:
+            # 解析池已关闭等情况，占位交付空结果，保证后续帧不被卡住
+            future = Future()
+            future.set_result([])
+        future.add_done_callback(lambda f: self._complete(seq, f))
+
+    def _complete(self, seq: int, future: Future):
+        try:
+            result = future.result()
+        except Exception as e:
+            print("【X】解析消息出错: ", e)
+            result = []
+        with self.lock:
+            self._done[seq] = result
+            # 在锁内交付，保证多个工作线程完成的结果按序号依次交付
+            while self._next_deliver in self._done:
+                ready = self._done.pop(self._next_deliver)
+                self._next_deliver += 1
+                self._slots.release()
+                try:
+                    self.deliver(ready)
+                except Exception as e:
+                    print("【X】分发消息出错: ", e)
+            if self._next_deliver == self._next_submit:
+                self._idle.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待已提交的帧全部交付
+        :param timeout: 超时时间（秒），None表示一直等待
+        :return: 是否全部交付
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._next_deliver == self._next_submit, timeout)
+
+
+_shared_pool: Optional[DecodePool] = None
+_lock = threading.Lock()
+
+
+def get_decode_pool() -> DecodePool:
+    """
+    获取进程内共享的解析线程池
+    :return: DecodePool
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        with _lock:
+            if _shared_pool is None:
+                _shared_pool = DecodePool()
+    return _shared_pool
+
+
+def configure_decode_pool(workers: int = 2, use_processes: bool = False) -> DecodePool:
+    """
+    替换进程内共享的解析池，应在创建 DouyinLiveWebFetcher 之前调用
+    :param workers: 线程/进程数
+    :param use_processes: 是否使用进程池
+    :return: 新的 DecodePool
+    """
+    global _shared_pool
+    with _lock:
+        old, _shared_pool = _shared_pool, DecodePool(workers, use_processes)
+    if old is not None:
+        old.shutdown(wait=False)
+    return _shared_pool
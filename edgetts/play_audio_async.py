@@ -9,6 +9,8 @@ import edge_tts
 import threading
 import sys
 
+from edgetts.tts_cache import get_tts_cache
+
 TEXT1 = ["君不见，黄河之水天上来，奔流到海不复回。",
 "君不见，高堂明镜悲白发，朝如青丝暮成雪。"
 "人生得意须尽欢，莫使金樽空对月。",
@@ -26,6 +28,7 @@ TEXT1 = ["君不见，黄河之水天上来，奔流到海不复回。",
 "陈王昔时宴平乐，斗酒十千恣欢谑。"
 ]
 VOICE = "zh-CN-YunjianNeural"
+RATE = "+0%"
 
 # 全局锁，确保同一时间只有一个音频播放
 _audio_lock = threading.Lock()
@@ -88,16 +91,37 @@ async def play_audio(audio_bytes):
             _audio_lock.release()
 
 
+async def synthesize(text, voice=VOICE, rate=RATE) -> bytes:
+    """
+    合成语音，同一 (文本, 音色, 语速) 只请求一次 edge-tts，之后从缓存读取
+    :param text: 播报文本
+    :param voice: 音色
+    :param rate: 语速，如 '+10%'
+    :return: MP3数据，合成失败时为空
+    """
+    cache = get_tts_cache()
+    audio_bytes = cache.get(text, voice, rate)
+    if audio_bytes is not None:
+        return audio_bytes
+    
+    communicate = edge_tts.Communicate(text, voice, rate=rate)
+    audio_bytes = bytearray()
+    
+    print("正在生成音频...")
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            audio_bytes.extend(chunk["data"])
+    
+    audio_bytes = bytes(audio_bytes)
+    if audio_bytes:
+        cache.put(text, voice, rate, audio_bytes)
+    return audio_bytes
+
+
 async def main(TEXT) -> None:
     """Main function"""
     try:
-        communicate = edge_tts.Communicate(TEXT, VOICE, boundary="SentenceBoundary")
-        audio_bytes = bytearray()
-        
-        print("正在生成音频...")
-        async for chunk in communicate.stream():
-            if chunk["type"] == "audio":
-                audio_bytes.extend(chunk["data"])
+        audio_bytes = await synthesize(TEXT)
         
         if audio_bytes:
             print("正在播放音频...")
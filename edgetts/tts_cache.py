@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TTS合成结果缓存
+
+播报文本大多来自 tts_config.json 中的少量模板和关键字回复，同一句话会反复合成。
+缓存以 (文本, 音色, 语速) 为键保存合成出的MP3数据，分两级：
+    内存  最近使用的音频，按总字节数淘汰最久未使用的
+    磁盘  cache_dir 下按内容哈希命名的文件，重启后仍然有效，按总字节数淘汰最久未使用的
+
+用法:
+    cache = get_tts_cache()
+    audio = cache.get(text, voice, rate)
+    if audio is None:
+        audio = ...  # 调用 edge-tts 合成
+        cache.put(text, voice, rate, audio)
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class TTSCache:
+    """
+    内存 + 磁盘两级的TTS合成结果缓存，线程安全
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_memory_bytes: int = 32 * 1024 * 1024,
+                 max_disk_bytes: int = 256 * 1024 * 1024):
+        """
+        :param cache_dir: 磁盘缓存目录，None 表示只缓存在内存中
+        :param max_memory_bytes: 内存中缓存的音频总字节数上限
+        :param max_disk_bytes: 磁盘上缓存的音频总字节数上限
+        """
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.lock = threading.Lock()
+        # 键 -> 音频，按使用顺序排列，最久未使用的在最前
+        self._memory: OrderedDict = OrderedDict()
+        self._memory_bytes = 0
+        # 键 -> 文件大小，按使用顺序排列
+        self._disk: OrderedDict = OrderedDict()
+        self._disk_bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def make_key(text: str, voice: str, rate: str) -> str:
+        """
+        :return: (文本, 音色, 语速) 的内容哈希，也是磁盘缓存的文件名
+        """
+        return hashlib.sha256(f"{voice}\n{rate}\n{text}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + '.mp3')
+
+    def _load(self):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and entry.name.endswith('.mp3'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        except Exception as e:
+            print(f"【X】读取TTS缓存目录失败: {e}")
+            return
+        # 上次运行的使用顺序记在文件的修改时间中
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        self._evict_disk()
+
+    def get(self, text: str, voice: str, rate: str) -> Optional[bytes]:
+        """
+        获取缓存的音频
+        :param text: 播报文本
+        :param voice: 音色
+        :param rate: 语速，如 '+0%'
+        :return: MP3数据，未缓存时返回None
+        """
+        key = self.make_key(text, voice, rate)
+        with self.lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return audio
+            if key in self._disk:
+                audio = self._read_disk(key)
+                if audio is not None:
+                    self._disk.move_to_end(key)
+                    self._remember(key, audio)
+                    self.disk_hits += 1
+                    return audio
+            self.misses += 1
+            return None
+
+    def put(self, text: str, voice: str, rate: str, audio: bytes):
+        """
+        缓存合成出的音频
+        :param text: 播报文本
+        :param voice: 音色
+        :param rate: 语速，如 '+0%'
+        :param audio: MP3数据
+        """
+        key = self.make_key(text, voice, rate)
+        audio = bytes(audio)
+        with self.lock:
+            self._remember(key, audio)
+            if self.cache_dir and key not in self._disk:
+                self._write_disk(key, audio)
+
+    def _remember(self, key: str, audio: bytes):
+        if len(audio) > self.max_memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                audio = f.read()
+            # 记录使用顺序，下次启动时按修改时间恢复
+            os.utime(path)
+            return audio
+        except Exception as e:
+            print(f"【X】读取TTS缓存文件失败: {e}")
+            self._disk_bytes -= self._disk.pop(key)
+            return None
+
+    def _write_disk(self, key: str, audio: bytes):
+        if len(audio) > self.max_disk_bytes:
+            return
+        path = self._path(key)
+        tmp_file = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(audio)
+            os.replace(tmp_file, path)
+        except Exception as e:
+            print(f"【X】写入TTS缓存文件失败: {e}")
+            return
+        self._disk[key] = len(audio)
+        self._disk_bytes += len(audio)
+        self._evict_disk()
+
+    def _evict_disk(self):
+        while self._disk_bytes > self.max_disk_bytes:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        清空内存和磁盘缓存
+        """
+        with self.lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for key in self._disk:
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._disk.clear()
+            self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        :return: 命中、未命中次数和两级缓存的条目数、字节数
+        """
+        with self.lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                'memory_items': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'disk_items': len(self._disk),
+                'disk_bytes': self._disk_bytes,
+            }
+
+    def summary(self) -> str:
+        """
+        :return: 一行统计信息
+        """
+        stats = self.stats()
+        return (f"TTS缓存 命中 {stats['memory_hits']}+{stats['disk_hits']}（内存+磁盘），"
+                f"未命中 {stats['misses']}，命中率 {stats['hit_rate']:.0%}，"
+                f"内存 {stats['memory_items']} 条 {stats['memory_bytes'] / 1024:.0f}KB，"
+                f"磁盘 {stats['disk_items']} 条 {stats['disk_bytes'] / 1024:.0f}KB")
+
+
+_shared_cache: Optional[TTSCache] = None
+_lock = threading.Lock()
+
+
+def get_tts_cache() -> TTSCache:
+    """
+    获取进程内共享的TTS缓存，默认磁盘缓存在当前目录的 tts_cache 下，可通过 configure_tts_cache 修改
+    :return: TTSCache
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _lock:
+            if _shared_cache is None:
+                _shared_cache = TTSCache('tts_cache')
+    return _shared_cache
+
+
+def configure_tts_cache(cache_dir: Optional[str] = 'tts_cache', **kwargs) -> TTSCache:
+    """
+    替换进程内共享的TTS缓存，应在第一次播放之前调用
+    :param cache_dir: 磁盘缓存目录，None 表示只缓存在内存中
+    :param kwargs: 传给 TTSCache 的其他参数
+    :return: 新的 TTSCache
+    """
+    global _shared_cache
+    with _lock:
+        _shared_cache = TTSCache(cache_dir, **kwargs)
+    return _shared_cache
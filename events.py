@@ -0,0 +1,238 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+直播间消息的事件类型
+
+每条解析出的消息是一个事件对象（namedtuple，无 __dict__），字段只有字符串、整数等基本类型，
+不引用 protobuf 对象；消息类型是类属性，不占实例空间。一条消息只有一个对象，
+而原来的 {'type': ..., 'payload': {...}} 是两个字典。
+
+事件兼容原来的字典格式，已有的消费者不需要修改：
+    event['type']      -> event.type
+    event['payload']   -> event 本身
+    event['content'] / event.get('content') / 'content' in event / dict(event)
+新代码直接用属性访问（event.content）更快。
+
+与字典不同的地方：
+    for value in event   按字段顺序得到字段的值（元组的行为），要遍历字段名用 event.keys()；
+                         不改写 __iter__，namedtuple 的 _replace、pickle 和解包都依赖按值遍历
+    event == other       类型与字段都相同才相等，不同事件类或普通元组即使字段值相同也不相等
+
+不是由解析得到、内容为普通字典的消息（如 MessageHandler.add_message 传入的）用 Message 表示，
+同样有 type、payload 属性并兼容字典格式。
+"""
+
+from collections import namedtuple
+from typing import Any, Dict, Union
+
+
+class Event:
+    """
+    事件的公共部分，与各事件的 namedtuple 一起作为基类
+    """
+    __slots__ = ()
+    # 消息类型，子类覆盖
+    type = ''
+
+    @property
+    def payload(self):
+        """消息内容就是事件本身"""
+        return self
+
+    def __eq__(self, other):
+        # 元组只比较值，字段相同的不同事件（如 SocialEvent 与两个元素的元组）会被当成相等
+        if other.__class__ is not self.__class__:
+            return False
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.type, tuple.__hash__(self)))
+
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            if key in self._fields:
+                return getattr(self, key)
+            if key == 'type':
+                return self.type
+            if key == 'payload':
+                return self
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields or key == 'type' or key == 'payload'
+
+    def keys(self):
+        return self._fields
+
+    def items(self):
+        return zip(self._fields, self)
+
+    def replace_payload(self, **changes) -> 'Event':
+        """
+        :return: 修改了部分字段的新事件，原事件不变（可能被多个订阅共享）
+        """
+        return self._replace(**changes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: 原来的字典格式 {'type': 消息类型, 'payload': {字段: 值}}，用于JSON序列化等
+        """
+        return {'type': self.type, 'payload': _plain(self)}
+
+
+def _plain(value):
+    if isinstance(value, (Event, RankEntry)):
+        return {name: _plain(item) for name, item in zip(value._fields, value)}
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
+class Message(namedtuple('Message', 'type payload')):
+    """
+    内容为普通字典的消息
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key == 'type':
+            return self.type
+        if key == 'payload':
+            return self.payload
+        if key.__class__ is str:
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self._fields else default
+
+    def replace_payload(self, **changes) -> 'Message':
+        """
+        :return: 修改了部分内容的新消息，原消息和原字典不变
+        """
+        payload = dict(self.payload)
+        payload.update(changes)
+        return Message(self.type, payload)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'type': self.type, 'payload': self.payload}
+
+
+class ChatEvent(Event, namedtuple('ChatEvent', 'user_name user_id content')):
+    """聊天消息"""
+    __slots__ = ()
+    type = 'chat'
+
+
+class GiftEvent(Event, namedtuple('GiftEvent', 'user_name gift_name gift_count')):
+    """礼物消息"""
+    __slots__ = ()
+    type = 'gift'
+
+
+class LikeEvent(Event, namedtuple('LikeEvent', 'user_name count')):
+    """点赞消息"""
+    __slots__ = ()
+    type = 'like'
+
+
+class MemberEvent(Event, namedtuple('MemberEvent', 'user_name user_id gender')):
+    """进入直播间消息"""
+    __slots__ = ()
+    type = 'member'
+
+
+class SocialEvent(Event, namedtuple('SocialEvent', 'user_name user_id')):
+    """关注消息"""
+    __slots__ = ()
+    type = 'social'
+
+
+class RoomStatsEvent(Event, namedtuple('RoomStatsEvent', 'current_viewers total_viewers')):
+    """直播间统计消息"""
+    __slots__ = ()
+    type = 'room_stats'
+
+
+class FansclubEvent(Event, namedtuple('FansclubEvent', 'content')):
+    """粉丝团消息"""
+    __slots__ = ()
+    type = 'fansclub'
+
+
+class ControlEvent(Event, namedtuple('ControlEvent', 'status')):
+    """直播间状态消息"""
+    __slots__ = ()
+    type = 'control'
+
+
+class EmojiChatEvent(Event, namedtuple('EmojiChatEvent', 'emoji_id user_name user_id default_content')):
+    """聊天表情包消息"""
+    __slots__ = ()
+    type = 'emoji_chat'
+
+
+class RoomDisplayStatsEvent(Event, namedtuple('RoomDisplayStatsEvent', 'display_info')):
+    """直播间统计展示消息"""
+    __slots__ = ()
+    type = 'room_display_stats'
+
+
+class RoomEvent(Event, namedtuple('RoomEvent', 'room_id')):
+    """直播间消息"""
+    __slots__ = ()
+    type = 'room'
+
+
+class RankEntry(namedtuple('RankEntry', 'user_name user_id score')):
+    """排行榜中的一项，兼容字典格式的 entry['user_name']"""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            if key in self._fields:
+                return getattr(self, key)
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+
+class RankEvent(Event, namedtuple('RankEvent', 'ranks')):
+    """直播间排行榜消息，ranks 为 RankEntry 的元组"""
+    __slots__ = ()
+    type = 'rank'
+
+
+class StreamAdaptationEvent(Event, namedtuple('StreamAdaptationEvent', 'adaptation_type')):
+    """直播间流配置消息"""
+    __slots__ = ()
+    type = 'stream_adaptation'
+
+
+# 消息类型 -> 事件类
+EVENT_TYPES = {cls.type: cls for cls in (
+    ChatEvent, GiftEvent, LikeEvent, MemberEvent, SocialEvent, RoomStatsEvent, FansclubEvent, ControlEvent,
+    EmojiChatEvent, RoomDisplayStatsEvent, RoomEvent, RankEvent, StreamAdaptationEvent,
+)}
+
+# 队列中的一条消息：解析得到的事件，或内容为普通字典的 Message
+AnyMessage = Union[Event, Message]
+
+
+def make_message(msg_type: str, payload) -> AnyMessage:
+    """
+    :param msg_type: 消息类型
+    :param payload: 事件或消息内容字典
+    :return: 事件本身就是消息，字典包装成 Message
+    """
+    return payload if isinstance(payload, Event) else Message(msg_type, payload)
@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+弹幕列表的数据模型
+
+弹幕区用 QListView 显示 DanmakuListModel 中的记录，只有可见的行会被绘制；
+DanmakuFilterProxyModel 按消息类型、用户名和关键字筛选，筛选条件改变时对全部已收到的记录重新筛选，
+不需要重建控件。记录数超过容量时丢弃最早的记录。
+"""
+
+from collections import namedtuple
+from typing import Dict, Iterable, List, Optional
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+# 弹幕区中的一行：消息类型、用户名（没有用户的消息为空字符串）、显示文本
+DanmakuRecord = namedtuple('DanmakuRecord', 'type user_name text')
+
+
+class DanmakuListModel(QAbstractListModel):
+    """
+    有界的弹幕记录列表
+    """
+
+    def __init__(self, capacity: int = 100000, colors: Optional[Dict] = None, parent=None):
+        """
+        :param capacity: 最多保留的记录数
+        :param colors: {消息类型: QColor}，'default' 为其他类型的颜色
+        """
+        super().__init__(parent)
+        self.capacity = capacity
+        self.colors = colors or {}
+        self.records: List[DanmakuRecord] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.records[index.row()]
+        if role == Qt.DisplayRole:
+            return record.text
+        if role == Qt.ForegroundRole:
+            return self.colors.get(record.type, self.colors.get('default'))
+        return None
+
+    def append_records(self, records: Iterable[DanmakuRecord]):
+        """
+        在末尾添加一批记录，超出容量时先删除最早的记录
+        :param records: 记录列表
+        """
+        records = list(records)
+        if len(records) > self.capacity:
+            records = records[-self.capacity:]
+        if not records:
+            return
+        overflow = len(self.records) + len(records) - self.capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            del self.records[:overflow]
+            self.endRemoveRows()
+        first = len(self.records)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self.records.extend(records)
+        self.endInsertRows()
+
+    def clear(self):
+        """删除全部记录"""
+        self.beginResetModel()
+        self.records = []
+        self.endResetModel()
+
+
+class DanmakuFilterProxyModel(QSortFilterProxyModel):
+    """
+    按消息类型、用户名和关键字筛选弹幕记录
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hidden_types = frozenset()
+        self.user_filter = ''
+        self.keyword_filter = ''
+
+    def set_filter(self, hidden_types: Iterable[str] = (), user: str = '', keyword: str = ''):
+        """
+        设置筛选条件并对全部记录重新筛选
+        :param hidden_types: 不显示的消息类型，其他类型都显示
+        :param user: 用户名包含的文本，空字符串表示不筛选
+        :param keyword: 显示文本包含的文本，空字符串表示不筛选
+        """
+        self.hidden_types = frozenset(hidden_types)
+        self.user_filter = user
+        self.keyword_filter = keyword
+        # 整体重建映射；invalidateFilter 会逐段发出行删除/插入信号，交替隐藏时十万条要几秒
+        self.invalidate()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        # 直接读源模型的记录，不经过 index()/data()，十万条记录重新筛选也很快
+        record = self.sourceModel().records[source_row]
+        if record.type in self.hidden_types:
+            return False
+        if self.user_filter and self.user_filter not in record.user_name:
+            return False
+        if self.keyword_filter and self.keyword_filter not in record.text:
+            return False
+        return True
@@ -1,8 +1,9 @@
 import sys
 import threading
+import time
 import os
 import json
-import random
+from collections import deque
 
 # 添加项目根目录到Python路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -11,12 +12,26 @@ from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLineEdit, QPushButton, QTextEdit, QLabel, QGroupBox, QCheckBox, QMessageBox,
     QTabWidget, QListWidget, QListWidgetItem, QDialog, QTextBrowser, QFormLayout,
-    QTextEdit
+    QTextEdit, QListView
 )
 from PyQt5.QtCore import QTimer, Qt, pyqtSignal, QObject
-from PyQt5.QtGui import QTextCursor, QColor, QTextCharFormat, QTextDocument
+from PyQt5.QtGui import QColor, QTextDocument
 
+from gui.danmaku_model import DanmakuFilterProxyModel, DanmakuListModel, DanmakuRecord
 from liveMan import DouyinLiveWebFetcher
+from tts_trigger import render_tts_text
+
+# 弹幕区最多保留的消息数，超出后丢弃最早的消息
+MAX_SCROLLBACK = 100000
+# 弹幕区刷新间隔（毫秒），期间收到的消息攒成一批一次性显示
+DISPLAY_INTERVAL_MS = 100
+# 筛选条件停止变化多久后重新筛选（毫秒），全选、连续输入时只筛选一次
+FILTER_DELAY_MS = 150
+# 工作线程合并消息的间隔（秒）和每批最多的消息数，每批只向GUI线程发一次信号
+BATCH_INTERVAL = 0.1
+BATCH_SIZE = 500
+# 可能触发TTS播报的消息类型
+TTS_MESSAGE_TYPES = ('chat', 'gift', 'member', 'social')
 
 
 def play_tts(text):
@@ -42,6 +57,35 @@ def play_tts(text):
     tts_thread.start()
 
 
+def format_message(message):
+    """
+    生成消息在弹幕区显示的文本
+    :param message: 消息（见 events.py）
+    :return: 显示文本
+    """
+    msg_type = message.type
+    payload = message.payload
+    if msg_type == 'chat':
+        return f"[聊天] {payload.user_name}: {payload.content}"
+    if msg_type == 'gift':
+        return f"[礼物] {payload.user_name} 送出了 {payload.gift_name} x{payload.gift_count}"
+    if msg_type == 'like':
+        return f"[点赞] {payload.user_name} 点了{payload.count}个赞"
+    if msg_type == 'member':
+        return f"[进场] {payload.user_name} 进入了直播间"
+    if msg_type == 'social':
+        return f"[关注] {payload.user_name} 关注了主播"
+    if msg_type == 'room_stats':
+        return f"[统计] 当前观看人数: {payload.current_viewers}, 累计观看人数: {payload.total_viewers}"
+    if msg_type == 'fansclub':
+        return f"[粉丝团] {payload.content}"
+    if msg_type == 'control':
+        return f"[控制] 直播间状态: {payload.status}"
+    if msg_type == 'emoji_chat':
+        return f"[表情包] {payload.user_name}: {payload.default_content}"
+    return f"[{msg_type}] {payload}"
+
+
 class TTSConfigDialog(QDialog):
     """TTS配置对话框"""
     
@@ -216,17 +260,29 @@ class TTSConfigDialog(QDialog):
 
 class WorkerSignals(QObject):
     """工作线程信号类"""
-    message_received = pyqtSignal(dict)
+    # 一批 (消息, DanmakuRecord)；按 object 传递同一个列表，声明为 list 时跨线程会整个转换成 QVariantList
+    batch_received = pyqtSignal(object)
+    # 一批消息中最新的直播间统计（events.RoomStatsEvent）
+    stats_received = pyqtSignal(object)
     status_update = pyqtSignal(str)
 
 
 class DanmakuWorker(QObject):
     """弹幕处理工作线程"""
     
-    def __init__(self, live_id):
+    def __init__(self, live_id, fetcher=None):
+        """
+        :param live_id: 直播id
+        :param fetcher: 与其他消费者（如TTS播报）共用的 DouyinLiveWebFetcher，为None时自己创建；
+                        共用时由创建者负责启动和停止
+        """
         super().__init__()
         self.live_id = live_id
-        self.fetcher = DouyinLiveWebFetcher(live_id)
+        self.owns_fetcher = fetcher is None
+        # 只从 'gui' 订阅取消息，自己创建时不需要默认订阅
+        self.fetcher = fetcher or DouyinLiveWebFetcher(live_id, default_subscription=False)
+        # 在消息总线上单独订阅，不和同一个 fetcher 的其他消费者抢消息
+        self.messages = self.fetcher.open_subscription('gui')
         self.signals = WorkerSignals()
         self.running = False
         
@@ -236,15 +292,19 @@ class DanmakuWorker(QObject):
     def start_listening(self):
         """开始监听弹幕"""
         self.running = True
-        # 在新线程中启动fetcher
-        threading.Thread(target=self._run_fetcher, daemon=True).start()
+        if self.owns_fetcher:
+            # 在新线程中启动fetcher
+            threading.Thread(target=self._run_fetcher, daemon=True).start()
         # 在新线程中处理消息
         threading.Thread(target=self._process_messages, daemon=True).start()
 
     def stop_listening(self):
         """停止监听弹幕"""
         self.running = False
-        self.fetcher.stop()
+        if self.owns_fetcher:
+            self.fetcher.stop()
+        else:
+            self.fetcher.close_subscription('gui')
 
     def _run_fetcher(self):
         """运行弹幕获取器"""
@@ -255,14 +315,33 @@ class DanmakuWorker(QObject):
             self.signals.status_update.emit(f"连接错误: {str(e)}")
 
     def _process_messages(self):
-        """处理消息"""
+        """
+        处理消息：在本线程中生成显示文本，每 BATCH_INTERVAL 秒或攒够 BATCH_SIZE 条消息向GUI线程发一次信号，
+        直播间统计只发送其中最新的一条
+        """
+        batch = []
+        stats = None
+        deadline = time.monotonic() + BATCH_INTERVAL
         while self.running:
             try:
-                message = self.fetcher.get_message(timeout=1)
-                if message:
-                    self.signals.message_received.emit(message)
+                for message in self.messages.get_batch(max_n=BATCH_SIZE - len(batch),
+                                                       timeout=max(deadline - time.monotonic(), 0)):
+                    if message.type == 'room_stats':
+                        stats = message
+                        continue
+                    record = DanmakuRecord(message.type, message.payload.get('user_name', ''), format_message(message))
+                    batch.append((message, record))
             except Exception as e:
                 self.signals.status_update.emit(f"消息处理错误: {str(e)}")
+            if len(batch) < BATCH_SIZE and time.monotonic() < deadline:
+                continue
+            if batch:
+                self.signals.batch_received.emit(batch)
+                batch = []
+            if stats is not None:
+                self.signals.stats_received.emit(stats)
+                stats = None
+            deadline = time.monotonic() + BATCH_INTERVAL
                 
     def _on_status_update(self, status):
         """内部状态更新处理"""
@@ -288,6 +367,12 @@ class DouyinLiveGUI(QWidget):
             'emoji_chat': QColor(255, 140, 0), # 深橙色 - 表情包消息
             'default': QColor(0, 0, 0)         # 默认黑色
         }
+        # 全部已收到的消息，弹幕区通过筛选模型显示其中符合条件的部分
+        self.danmaku_model = DanmakuListModel(MAX_SCROLLBACK, self.message_colors, self)
+        self.danmaku_filter = DanmakuFilterProxyModel(self)
+        self.danmaku_filter.setSourceModel(self.danmaku_model)
+        # 等待下次刷新显示的 DanmakuRecord，超过弹幕区容量的部分显示了也会被丢弃
+        self.pending_lines = deque(maxlen=MAX_SCROLLBACK)
         self.init_ui()
         self.setup_timers()
         self.load_tts_config()
@@ -382,16 +467,32 @@ class DouyinLiveGUI(QWidget):
         button_layout.addWidget(self.deselect_all_button)
         button_layout.addStretch()
         
+        # 用户名、关键字筛选
+        search_layout = QHBoxLayout()
+        self.user_filter_input = QLineEdit()
+        self.user_filter_input.setPlaceholderText("用户名包含...")
+        self.user_filter_input.textChanged.connect(self.on_filter_changed)
+        self.keyword_filter_input = QLineEdit()
+        self.keyword_filter_input.setPlaceholderText("内容包含...")
+        self.keyword_filter_input.textChanged.connect(self.on_filter_changed)
+        search_layout.addWidget(QLabel("用户:"))
+        search_layout.addWidget(self.user_filter_input)
+        search_layout.addWidget(QLabel("关键字:"))
+        search_layout.addWidget(self.keyword_filter_input)
+        
         filter_layout.addLayout(checkbox_layout)
         filter_layout.addLayout(button_layout)
+        filter_layout.addLayout(search_layout)
         filter_group.setLayout(filter_layout)
         
         # 创建弹幕显示区域
         danmaku_group = QGroupBox("弹幕内容")
         danmaku_layout = QVBoxLayout()
         
-        self.danmaku_display = QTextEdit()
-        self.danmaku_display.setReadOnly(True)
+        # 只绘制可见的行；每行一样高，不需要逐行计算大小
+        self.danmaku_display = QListView()
+        self.danmaku_display.setUniformItemSizes(True)
+        self.danmaku_display.setModel(self.danmaku_filter)
         
         # 添加清屏按钮
         clear_button = QPushButton("清屏")
@@ -459,8 +560,14 @@ class DouyinLiveGUI(QWidget):
     def setup_timers(self):
         """设置定时器"""
         self.update_timer = QTimer(self)
+        self.update_timer.setInterval(DISPLAY_INTERVAL_MS)
         self.update_timer.timeout.connect(self.update_display)
         
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        
     def start_listening(self):
         """开始监听"""
         room_id = self.room_input.text().strip()
@@ -475,13 +582,15 @@ class DouyinLiveGUI(QWidget):
         self.room_input.setEnabled(False)
         
         # 清空显示区域
-        self.danmaku_display.clear()
+        self.clear_display()
         
         # 创建并启动工作线程
         self.worker = DanmakuWorker(room_id)
-        self.worker.signals.message_received.connect(self.handle_message)
+        self.worker.signals.batch_received.connect(self.handle_batch)
+        self.worker.signals.stats_received.connect(self.update_stats)
         self.worker.signals.status_update.connect(self.update_status)
         self.worker.start_listening()
+        self.update_timer.start()
         
         self.status_label.setText("状态: 正在连接直播间...")
         
@@ -489,6 +598,8 @@ class DouyinLiveGUI(QWidget):
         """停止监听"""
         if self.worker:
             self.worker.stop_listening()
+        self.update_timer.stop()
+        self.update_display()
             
         # 启用开始按钮，禁用停止按钮
         self.start_button.setEnabled(True)
@@ -497,133 +608,31 @@ class DouyinLiveGUI(QWidget):
         
         self.status_label.setText("状态: 已停止监听")
         
-    def handle_message(self, message):
-        """处理接收到的消息"""
-        # 根据消息类型格式化显示
-        msg_type = message['type']
-        payload = message['payload']
-        
-        # 特殊处理统计信息更新
-        if msg_type == 'room_stats':
-            current_viewers = payload.get('current_viewers', '--')
-            total_viewers = payload.get('total_viewers', '--')
-            self.stats_label.setText(f"在线人数: {current_viewers}, 累计观看: {total_viewers}")
-        
-        # 检查筛选条件
-        # 对于未在筛选列表中的消息类型，默认显示
-        if msg_type in self.filter_checkboxes and not self.filter_checkboxes[msg_type].isChecked():
-            return  # 不符合筛选条件，不显示
-        
-        display_text = ""
-        if msg_type == 'chat':
-            display_text = f"[聊天] {payload['user_name']}: {payload['content']}"
-            # 检查是否需要TTS播报
-            self.check_tts_trigger(msg_type, payload)
-        elif msg_type == 'gift':
-            display_text = f"[礼物] {payload['user_name']} 送出了 {payload['gift_name']} x{payload['gift_count']}"
-            # 检查是否需要TTS播报
-            self.check_tts_trigger(msg_type, payload)
-        elif msg_type == 'like':
-            display_text = f"[点赞] {payload['user_name']} 点了{payload['count']}个赞"
-        elif msg_type == 'member':
-            display_text = f"[进场] {payload['user_name']} 进入了直播间"
-            # 检查是否需要TTS播报
-            self.check_tts_trigger(msg_type, payload)
-        elif msg_type == 'social':
-            display_text = f"[关注] {payload['user_name']} 关注了主播"
-            # 检查是否需要TTS播报
-            self.check_tts_trigger(msg_type, payload)
-        elif msg_type == 'room_stats':
-            display_text = f"[统计] 当前观看人数: {payload['current_viewers']}, 累计观看人数: {payload['total_viewers']}"
-        elif msg_type == 'fansclub':
-            display_text = f"[粉丝团] {payload['content']}"
-        elif msg_type == 'control':
-            display_text = f"[控制] 直播间状态: {payload['status']}"
-        elif msg_type == 'emoji_chat':
-            display_text = f"[表情包] {payload['user'].nick_name}: {payload['default_content']}"
-        else:
-            display_text = f"[{msg_type}] {payload}"
-            
-        # 添加到显示区域（统计信息除外）
-        if msg_type != 'room_stats':
-            self.append_colored_text(display_text, msg_type)
-        
-        # 自动滚动到底部
-        self.danmaku_display.moveCursor(QTextCursor.End)
-        
-    def append_colored_text(self, text, msg_type):
-        """使用指定颜色添加文本到显示区域"""
-        # 获取文本游标
-        cursor = self.danmaku_display.textCursor()
-        
-        # 创建文本格式
-        fmt = QTextCharFormat()
-        color = self.message_colors.get(msg_type, self.message_colors['default'])
-        fmt.setForeground(color)
-        
-        # 应用格式并插入文本
-        cursor.movePosition(QTextCursor.End)
-        cursor.insertText(text + "\n", fmt)
-        
-        # 滚动到底部
-        self.danmaku_display.setTextCursor(cursor)
-        self.danmaku_display.ensureCursorVisible()
+    def handle_batch(self, batch):
+        """
+        处理工作线程发来的一批消息
+        :param batch: (消息, DanmakuRecord) 的列表，显示文本已在工作线程中生成
+        """
+        checkboxes = self.filter_checkboxes
+        for message, record in batch:
+            msg_type = message.type
+            # 所有消息都保存下来，筛选只影响显示，改变筛选条件时已收到的消息也会重新筛选
+            # 对于未在筛选列表中的消息类型，默认显示；被筛掉的类型不触发TTS
+            if msg_type in TTS_MESSAGE_TYPES and (msg_type not in checkboxes or checkboxes[msg_type].isChecked()):
+                self.check_tts_trigger(msg_type, message.payload)
+            # 由 update_display 定时批量显示
+            self.pending_lines.append(record)
+        
+    def update_stats(self, stats):
+        """
+        更新直播间统计信息
+        :param stats: 直播间统计消息（events.RoomStatsEvent）
+        """
+        self.stats_label.setText(f"在线人数: {stats.current_viewers}, 累计观看: {stats.total_viewers}")
         
     def check_tts_trigger(self, msg_type, payload):
         """检查是否触发TTS播报"""
-        # 检查TTS是否启用
-        if not self.tts_config.get('tts_enabled', False):
-            return
-            
-        tts_text = ""
-        
-        # 进场TTS播报
-        if msg_type == 'member' and self.tts_config.get('enter_tts_enabled', False):
-            templates = self.tts_config.get('enter_tts_templates', ['欢迎 {user_name} 来到直播间'])
-            if templates:
-                template = random.choice(templates)
-                user_name = payload.get('user_name', '')
-                tts_text = template.format(user_name=user_name)
-            
-        # 关注TTS播报
-        elif msg_type == 'social' and self.tts_config.get('follow_tts_enabled', False):
-            templates = self.tts_config.get('follow_tts_templates', ['感谢 {user_name} 的关注'])
-            if templates:
-                template = random.choice(templates)
-                user_name = payload.get('user_name', '')
-                tts_text = template.format(user_name=user_name)
-            
-        # 礼物TTS播报
-        elif msg_type == 'gift' and self.tts_config.get('gift_tts_enabled', False):
-            templates = self.tts_config.get('gift_tts_templates', ['感谢 {user_name} 送出的 {gift_name} x {gift_count}'])
-            if templates:
-                template = random.choice(templates)
-                user_name = payload.get('user_name', '')
-                gift_name = payload.get('gift_name', '')
-                gift_count = payload.get('gift_count', '')
-                tts_text = template.format(user_name=user_name, gift_name=gift_name, gift_count=gift_count)
-            
-        # 关键字TTS播报
-        elif msg_type == 'chat' and self.tts_config.get('keyword_tts_enabled', False):
-            content = payload.get('content', '')
-            user_name = payload.get('user_name', '')
-            
-            # 查找匹配的关键字和对应的模板
-            keyword_reply_templates = self.tts_config.get('keyword_reply_templates', {})
-            matched_keyword = None
-            matched_templates = []
-            
-            # 精确匹配关键字
-            for keyword, templates in keyword_reply_templates.items():
-                if keyword in content:
-                    matched_keyword = keyword
-                    matched_templates = templates
-                    break
-            
-            # 如果找到匹配的关键字且有对应的模板，则随机选择一个模板
-            if matched_keyword and matched_templates:
-                template = random.choice(matched_templates)
-                tts_text = template.format(user_name=user_name, content=content)
+        tts_text = render_tts_text(self.tts_config, msg_type, payload)
                     
         # 如果有需要播报的TTS文本，则输出
         if tts_text:
@@ -636,17 +645,34 @@ class DouyinLiveGUI(QWidget):
         self.status_label.setText(f"状态: {status}")
         
     def update_display(self):
-        """更新显示"""
-        pass
+        """更新显示，把上次刷新以来收到的消息一次性添加到弹幕区"""
+        if not self.pending_lines:
+            return
+        lines = list(self.pending_lines)
+        self.pending_lines.clear()
+        # 正在往上翻看历史消息时不跳到底部
+        scroll_bar = self.danmaku_display.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        self.danmaku_model.append_records(lines)
+        if at_bottom:
+            self.danmaku_display.scrollToBottom()
         
     def clear_display(self):
         """清空显示区域"""
-        self.danmaku_display.clear()
+        self.pending_lines.clear()
+        self.danmaku_model.clear()
         
     def on_filter_changed(self):
-        """筛选条件改变时的处理"""
-        # 这里可以根据需要添加筛选逻辑
-        pass
+        """筛选条件改变时的处理，稍后统一重新筛选"""
+        self.filter_timer.start()
+        
+    def apply_filter(self):
+        """按当前的筛选条件重新筛选全部已收到的消息"""
+        hidden_types = [key for key, checkbox in self.filter_checkboxes.items() if not checkbox.isChecked()]
+        self.danmaku_filter.set_filter(hidden_types,
+                                       self.user_filter_input.text().strip(),
+                                       self.keyword_filter_input.text().strip())
+        self.danmaku_display.scrollToBottom()
         
     def select_all_filters(self):
         """全选所有筛选项"""
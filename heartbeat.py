@@ -0,0 +1,157 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+多连接共用的心跳调度器
+
+进程内只有一个调度线程，用最小堆按到期时间排列所有连接的心跳，
+没有心跳到期时线程一直阻塞，不会空转唤醒；连接关闭时取消对应的心跳即可，不会遗留线程。
+
+asyncio 版的抓取（async_fetcher.py）不使用调度线程，心跳是事件循环中的任务，
+只用 HeartbeatHandle 记录到期时间，touch/set_interval 的行为与这里一致。
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Optional
+
+
+class HeartbeatHandle:
+    """
+    一个连接的心跳，由 HeartbeatScheduler.register 创建；
+    scheduler 为None时只记录到期时间，由调用方自己按 due 发送
+    """
+
+    def __init__(self, scheduler: Optional['HeartbeatScheduler'], send: Optional[Callable[[], None]],
+                 interval: float):
+        self.scheduler = scheduler
+        self.send = send
+        self.interval = interval
+        self.due = time.monotonic()
+        self.cancelled = False
+        # 堆中有效条目的序号，序号不一致的条目已作废
+        self._seq = None
+
+    def touch(self):
+        """
+        连接上刚有上行数据（如ack），推迟下一次心跳
+        """
+        self.due = time.monotonic() + self.interval
+
+    def set_interval(self, interval: float):
+        """
+        修改心跳间隔
+        :param interval: 心跳间隔（秒）
+        """
+        if self.scheduler is None:
+            self.due += interval - self.interval
+            self.interval = interval
+            return
+        self.scheduler._set_interval(self, interval)
+
+    def cancel(self):
+        """
+        取消心跳，堆中的条目在到期时丢弃
+        """
+        self.cancelled = True
+
+
+class HeartbeatScheduler:
+    """
+    心跳调度器，一个线程服务任意多个连接
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def register(self, send: Callable[[], None], interval: float) -> HeartbeatHandle:
+        """
+        注册一个连接的心跳，立即发送第一次
+        :param send: 发送心跳的函数，在调度线程中调用，抛出异常时取消该心跳
+        :param interval: 心跳间隔（秒）
+        :return: HeartbeatHandle
+        """
+        handle = HeartbeatHandle(self, send, interval)
+        with self._cond:
+            self._push(handle, handle.due)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="HeartbeatScheduler", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return handle
+
+    def _push(self, handle: HeartbeatHandle, due: float):
+        handle._seq = next(self._counter)
+        heapq.heappush(self._heap, (due, handle._seq, handle))
+
+    def _set_interval(self, handle: HeartbeatHandle, interval: float):
+        with self._cond:
+            if handle.cancelled or interval == handle.interval:
+                return
+            due = handle.due - handle.interval + interval
+            handle.interval = interval
+            handle.due = due
+            # 间隔变短时需要提前唤醒，旧条目因序号作废被丢弃
+            self._push(handle, due)
+            self._cond.notify()
+
+    def _next_due(self) -> Optional[HeartbeatHandle]:
+        """
+        等待并取出下一个到期的心跳，调用时需持有锁
+        """
+        while True:
+            if not self._heap:
+                self._cond.wait()
+                continue
+            due, seq, handle = self._heap[0]
+            if handle.cancelled or seq != handle._seq:
+                heapq.heappop(self._heap)
+                continue
+            if handle.due > due:
+                # 被 touch 推迟过，按新的到期时间重新入堆
+                heapq.heappop(self._heap)
+                self._push(handle, handle.due)
+                continue
+            delay = due - time.monotonic()
+            if delay > 0:
+                self._cond.wait(delay)
+                continue
+            heapq.heappop(self._heap)
+            return handle
+
+    def _run(self):
+        while True:
+            with self._cond:
+                handle = self._next_due()
+            try:
+                handle.send()
+            except Exception as e:
+                print("【X】心跳包检测错误: ", e)
+                handle.cancel()
+                continue
+            with self._cond:
+                if not handle.cancelled:
+                    handle.due = time.monotonic() + handle.interval
+                    self._push(handle, handle.due)
+
+
+_scheduler: Optional[HeartbeatScheduler] = None
+_lock = threading.Lock()
+
+
+def get_heartbeat_scheduler() -> HeartbeatScheduler:
+    """
+    获取进程内共享的心跳调度器
+    :return: HeartbeatScheduler
+    """
+    global _scheduler
+    if _scheduler is None:
+        with _lock:
+            if _scheduler is None:
+                _scheduler = HeartbeatScheduler()
+    return _scheduler
@@ -0,0 +1,211 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+常驻JS执行引擎
+
+sign.js 约 485 KB，每次新建 MiniRacer 上下文并 eval 一遍需要几十到几百毫秒。
+这里把脚本只编译一次，维护一组预热好的 V8 上下文，供所有直播间的签名计算复用。
+a_bogus.js 同理，不再每次通过 execjs 拉起外部 Node 进程。
+"""
+
+import codecs
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+import execjs
+from py_mini_racer import MiniRacer
+
+
+def execute_js(js_file: str):
+    """
+    执行 JavaScript 文件
+    :param js_file: JavaScript 文件路径
+    :return: 执行结果
+    """
+    with open(js_file, 'r', encoding='utf-8') as file:
+        js_code = file.read()
+    
+    ctx = execjs.compile(js_code)
+    return ctx
+
+
+class JsContextPool:
+    """
+    预热的 MiniRacer 上下文池，线程安全
+    每个上下文在创建时就已 eval 过脚本，调用时借出一个上下文，用完归还
+    """
+
+    def __init__(self, script_file: str, size: int = 2):
+        """
+        初始化上下文池
+        :param script_file: JavaScript 文件路径
+        :param size: 池中上下文的最大数量
+        """
+        self.script_file = script_file
+        self.size = max(1, size)
+        self._script = None
+        self._contexts = queue.Queue(maxsize=self.size)
+        self._created = 0
+        self.lock = threading.Lock()
+
+    @property
+    def script(self) -> str:
+        """
+        脚本源码，只从磁盘读取一次
+        :return: 脚本内容
+        """
+        if self._script is None:
+            with codecs.open(self.script_file, 'r', encoding='utf8') as f:
+                self._script = f.read()
+        return self._script
+
+    def _new_context(self) -> MiniRacer:
+        ctx = MiniRacer()
+        ctx.eval(self.script)
+        return ctx
+
+    def _acquire(self) -> MiniRacer:
+        try:
+            return self._contexts.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.lock:
+            create = self._created < self.size
+            if create:
+                self._created += 1
+        if create:
+            try:
+                return self._new_context()
+            except Exception:
+                with self.lock:
+                    self._created -= 1
+                raise
+        # 上下文已全部借出，等待归还
+        return self._contexts.get()
+
+    def _release(self, ctx: MiniRacer):
+        self._contexts.put_nowait(ctx)
+
+    def warm_up(self, count: Optional[int] = None):
+        """
+        预先创建上下文，避免首次调用时才编译脚本
+        :param count: 预热的上下文数量，默认填满整个池
+        """
+        count = self.size if count is None else min(count, self.size)
+        contexts = [self._acquire() for _ in range(count)]
+        for ctx in contexts:
+            self._release(ctx)
+
+    @contextmanager
+    def context(self):
+        """
+        借出一个上下文，退出时自动归还，适合在同一上下文中连续调用多次
+        """
+        ctx = self._acquire()
+        try:
+            yield ctx
+        finally:
+            self._release(ctx)
+
+    def call(self, func_name: str, *args) -> Any:
+        """
+        调用脚本中的函数
+        :param func_name: 函数名
+        :param args: 函数参数
+        :return: 调用结果
+        """
+        with self.context() as ctx:
+            return ctx.call(func_name, *args)
+
+
+_pools: Dict[str, JsContextPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_js_pool(script_file: str, size: int = 2) -> JsContextPool:
+    """
+    获取进程内共享的上下文池，同一个脚本只会创建一个池
+    :param script_file: JavaScript 文件路径
+    :param size: 首次创建时池的大小
+    :return: 上下文池
+    """
+    key = os.path.abspath(script_file)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = JsContextPool(script_file, size)
+                _pools[key] = pool
+    return pool
+
+
+class ABogusGenerator:
+    """
+    a_bogus 生成器
+    优先使用进程内常驻的 V8 上下文池，不可用时回退到 execjs（外部 Node 进程）
+    """
+
+    def __init__(self, script_file: str = 'a_bogus.js', pool_size: int = 2):
+        """
+        :param script_file: a_bogus.js 文件路径
+        :param pool_size: 上下文池大小
+        """
+        self.script_file = script_file
+        self.pool = get_js_pool(script_file, pool_size)
+        self._execjs_ctx = None
+
+    def _fallback(self, params_list: List[str], user_agent: str) -> List[str]:
+        if self._execjs_ctx is None:
+            self._execjs_ctx = execute_js(self.script_file)
+        return [self._execjs_ctx.call("get_ab", params, user_agent) for params in params_list]
+
+    def get_ab(self, params: str, user_agent: str) -> str:
+        """
+        计算一条 a_bogus
+        :param params: urlencode 后的查询参数
+        :param user_agent: User-Agent 字符串
+        :return: a_bogus
+        """
+        return self.get_ab_many([params], user_agent)[0]
+
+    def get_ab_many(self, params_list: Iterable[str], user_agent: str) -> List[str]:
+        """
+        批量计算 a_bogus，整批只借用一次上下文
+        :param params_list: urlencode 后的查询参数列表
+        :param user_agent: User-Agent 字符串
+        :return: 与输入顺序一致的 a_bogus 列表
+        """
+        params_list = list(params_list)
+        try:
+            with self.pool.context() as ctx:
+                return [ctx.call("get_ab", params, user_agent) for params in params_list]
+        except Exception as e:
+            print("【X】V8计算a_bogus失败，回退到execjs: ", e)
+            return self._fallback(params_list, user_agent)
+
+
+_abogus_generators: Dict[str, ABogusGenerator] = {}
+_abogus_lock = threading.Lock()
+
+
+def get_abogus_generator(script_file: str = 'a_bogus.js') -> ABogusGenerator:
+    """
+    获取进程内共享的 a_bogus 生成器
+    :param script_file: a_bogus.js 文件路径
+    :return: a_bogus 生成器
+    """
+    key = os.path.abspath(script_file)
+    generator = _abogus_generators.get(key)
+    if generator is None:
+        with _abogus_lock:
+            generator = _abogus_generators.get(key)
+            if generator is None:
+                generator = ABogusGenerator(script_file)
+                _abogus_generators[key] = generator
+    return generator
@@ -1,42 +1,59 @@
 #!/usr/bin/python
 # coding:utf-8
 
-import codecs
-import gzip
 import hashlib
 import random
-import re
 import string
 import subprocess
 import threading
 import time
-import execjs
 import urllib.parse
 from contextlib import contextmanager
 from unittest.mock import patch
 
-import requests
 import websocket
-from py_mini_racer import MiniRacer
 
-from ac_signature import get__ac_signature
+import a_bogus
+from ac_signature import AcSignatureGenerator
+from backoff import Backoff
+from bootstrap import RoomIdNotFoundError, fetch_room_id, get_bootstrap_cache, get_shared_session
+from heartbeat import get_heartbeat_scheduler
+from js_engine import get_abogus_generator, get_js_pool
+from codec import get_codec, decode_messages, gunzip, scan_response_header
+from decode_pool import OrderedDelivery, get_decode_pool
 from protobuf.douyin import *
 
 from urllib3.util.url import parse_url
+from message_bus import MessageBus
 from message_handler import MessageHandler
 
 
-def execute_js(js_file: str):
-    """
-    执行 JavaScript 文件
-    :param js_file: JavaScript 文件路径
-    :return: 执行结果
-    """
-    with open(js_file, 'r', encoding='utf-8') as file:
-        js_code = file.read()
-    
-    ctx = execjs.compile(js_code)
-    return ctx
+# 默认推送服务器，收到 Response.push_server 后改用服务端下发的地址
+WSS_PUSH_SERVER = "wss://webcast100-ws-web-lq.douyin.com/webcast/im/push/v2/"
+WSS_DID = "7319483754668557238"
+# 签名参数不变时复用签名的最长时间（秒）
+SIGNATURE_TTL = 10 * 60
+HEARTBEAT_FRAME = PushFrame(payload_type='hb').SerializeToString()
+# 服务端下发的 heartbeat_duration 低于该值时按该值发送（秒）
+MIN_HEARTBEAT_INTERVAL = 1
+
+# Message.method -> (消息类型, 处理方法名)，消息类型即 MessageHandler 中消息的 'type'
+MESSAGE_METHODS = {
+    'WebcastChatMessage': ('chat', '_handleChatMsg'),  # 聊天消息
+    'WebcastGiftMessage': ('gift', '_handleGiftMsg'),  # 礼物消息
+    'WebcastLikeMessage': ('like', '_handleLikeMsg'),  # 点赞消息
+    'WebcastMemberMessage': ('member', '_handleMemberMsg'),  # 进入直播间消息
+    'WebcastSocialMessage': ('social', '_handleSocialMsg'),  # 关注消息
+    'WebcastRoomUserSeqMessage': ('room_stats', '_handleRoomUserSeqMsg'),  # 直播间统计
+    'WebcastFansclubMessage': ('fansclub', '_handleFansclubMsg'),  # 粉丝团消息
+    'WebcastControlMessage': ('control', '_handleControlMsg'),  # 直播间状态消息
+    'WebcastEmojiChatMessage': ('emoji_chat', '_handleEmojiChatMsg'),  # 聊天表情包消息
+    'WebcastRoomStatsMessage': ('room_display_stats', '_handleRoomStatsMsg'),  # 直播间统计信息
+    'WebcastRoomMessage': ('room', '_handleRoomMsg'),  # 直播间信息
+    'WebcastRoomRankMessage': ('rank', '_handleRankMsg'),  # 直播间排行榜信息
+    'WebcastRoomStreamAdaptationMessage': ('stream_adaptation', '_handleRoomStreamAdaptationMsg'),  # 直播间流配置
+}
+MESSAGE_TYPES = frozenset(msg_type for msg_type, _ in MESSAGE_METHODS.values())
 
 
 @contextmanager
@@ -51,9 +68,11 @@ def patched_popen_encoding(encoding='utf-8'):
         yield
 
 
-def generateSignature(wss, script_file='sign.js'):
+def signatureDigest(wss):
     """
-    出现gbk编码问题则修改 python模块subprocess.py的源码中Popen类的__init__函数参数encoding值为 "utf-8"
+    计算wss地址中参与签名的参数的md5，只有这些参数变化时才需要重新签名
+    :param wss: wss地址
+    :return: md5
     """
     params = ("live_id,aid,version_code,webcast_sdk_version,"
               "room_id,sub_room_id,sub_channel_id,did_rule,"
@@ -65,16 +84,18 @@ def generateSignature(wss, script_file='sign.js'):
     param = ','.join(tpl_params)
     md5 = hashlib.md5()
     md5.update(param.encode())
-    md5_param = md5.hexdigest()
-    
-    with codecs.open(script_file, 'r', encoding='utf8') as f:
-        script = f.read()
-    
-    ctx = MiniRacer()
-    ctx.eval(script)
-    
+    return md5.hexdigest()
+
+
+def generateSignature(wss, script_file='sign.js'):
+    """
+    出现gbk编码问题则修改 python模块subprocess.py的源码中Popen类的__init__函数参数encoding值为 "utf-8"
+    """
+    md5_param = signatureDigest(wss)
+
+    # 复用进程内预热的V8上下文，避免每次连接都重新编译sign.js
     try:
-        signature = ctx.call("get_sign", md5_param)
+        signature = get_js_pool(script_file).call("get_sign", md5_param)
         return signature
     except Exception as e:
         print(e)
@@ -102,16 +123,34 @@ def generateMsToken(length=182):
 
 class DouyinLiveWebFetcher:
     
-    def __init__(self, live_id, abogus_file='a_bogus.js'):
+    def __init__(self, live_id, abogus_file=None, max_reconnect_delay=60, heartbeat_interval=5,
+                 subscriptions=None, codec=None, decode_pool=None, recorder=None, endpoint=None,
+                 skip_bootstrap=None, default_subscription=True):
         """
         直播间弹幕抓取对象
         :param live_id: 直播间的直播id，打开直播间web首页的链接如：https://live.douyin.com/261378947940，
                         其中的261378947940即是live_id
+        :param abogus_file: a_bogus的JS脚本路径，为None时使用纯Python实现(a_bogus.py)
+        :param max_reconnect_delay: 断线重连的最长等待时间（秒）
+        :param heartbeat_interval: 默认心跳间隔（秒），收到服务端的 heartbeat_duration 后以服务端为准
+        :param subscriptions: 需要的消息类型，如 ('chat', 'gift')，未订阅的消息不解析；None表示全部
+        :param codec: protobuf编解码后端（见 codec.py），为None时使用 configure_codec 选择的后端
+        :param decode_pool: 解析消息列表的 DecodePool（见 decode_pool.py），为None时使用进程内共享的线程池，
+                            为False时在接收线程中直接解析
+        :param recorder: 原始帧录制器 FrameRecorder（见 capture.py），为None时不录制
+        :param endpoint: 推送服务器地址，如本地模拟服务器（见 mock_server.py）的 ws://127.0.0.1:8765/webcast/im/push/v2/，
+                         指定后不再使用服务端下发的 push_server；为None时连接抖音
+        :param skip_bootstrap: 是否跳过签名、ttwid/room_id获取和直播间状态查询（live_id直接作为room_id），
+                               为None时指定了endpoint就跳过
+        :param default_subscription: 是否创建名为 default 的订阅（get_message/get_messages 读取的队列）；
+                                     只用 open_subscription 取消息的消费者应设为False，否则没人读取的默认队列
+                                     一直是满的，每条消息都要白白入队再被丢弃
         """
         self.abogus_file = abogus_file
         self.__ttwid = None
         self.__room_id = None
-        self.session = requests.Session()
+        self.session = get_shared_session()
+        self.bootstrap_cache = get_bootstrap_cache()
         self.live_id = live_id
         self.host = "https://www.douyin.com/"
         self.live_url = "https://live.douyin.com/"
@@ -119,15 +158,145 @@ class DouyinLiveWebFetcher:
         self.headers = {
             'User-Agent': self.user_agent
         }
-        self.message_handler = MessageHandler()
+        self.ac_signer = AcSignatureGenerator(self.host[8:], self.user_agent)
+        # 消息广播给总线上的所有订阅，message_handler 是其中名为 default 的订阅
+        self.bus = MessageBus()
+        self.message_handler = self._createMessageHandler()
+        self.default_subscription = default_subscription
+        if not default_subscription:
+            # 不挂到总线上，get_message 等立即返回而不是一直等待
+            self.message_handler.stop()
+        self.codec = codec or get_codec()
+        if decode_pool is None:
+            decode_pool = get_decode_pool()
+        # 解析结果按帧顺序交付，为None表示在接收线程中直接解析
+        self._delivery = OrderedDelivery(decode_pool, self._deliverMessages) if decode_pool else None
+        self.recorder = recorder
+        self.endpoint = endpoint
+        self.skip_bootstrap = endpoint is not None if skip_bootstrap is None else skip_bootstrap
         self.on_status_update = None  # 状态更新回调函数
+        self.ws = None
+        self.max_reconnect_delay = max_reconnect_delay
+        self.heartbeat_interval = heartbeat_interval
+        self._heartbeat = None
+        self.room_status = None
+        # 最近一次收到的 Response 中的续传位置，重连时从这里继续，不丢消息也不重复
+        self.cursor = None
+        self.internal_ext = None
+        self.push_server = None
+        # 续传位置所属的room_id，主播重新开播后旧的续传位置作废
+        self._resume_room_id = None
+        # (签名参数md5, 签名时间, signature)
+        self._signature = None
+        self._stop_event = threading.Event()
+        self.subscriptions = None
+        # Message.method -> 消息类型，只有其中的消息才会被解析
+        self._wanted = {}
+        self._queued = None
+        self._handlers = {}
+        self.subscribe(subscriptions)
+    
+    def subscribe(self, subscriptions=None):
+        """
+        设置需要的消息类型并重建分发表，未订阅的消息直接跳过，不解析payload
+        直播间状态消息总会解析（直播结束时需要停止抓取），但只有订阅了 'control' 才会放入消息队列
+        :param subscriptions: 消息类型列表，None表示全部
+        """
+        if subscriptions is not None:
+            subscriptions = frozenset(subscriptions)
+            unknown = subscriptions - MESSAGE_TYPES
+            if unknown:
+                raise ValueError(f"未知的消息类型: {', '.join(sorted(unknown))}")
+        self.subscriptions = subscriptions
+        # 放入消息队列的消息类型，None表示全部
+        self._queued = None if subscriptions is None or 'control' in subscriptions else subscriptions
+        self._wanted = {
+            method: msg_type
+            for method, (msg_type, _) in MESSAGE_METHODS.items()
+            if subscriptions is None or msg_type in subscriptions or msg_type == 'control'
+        }
+        if self.default_subscription:
+            self.bus.attach('default', self.message_handler, self._queued, replace=True)
+        self._handlers = {msg_type: getattr(self, handler) for msg_type, handler in MESSAGE_METHODS.values()}
+    
+    def _createMessageHandler(self):
+        """
+        创建默认的消息处理器，get_message/get_messages 从这里取消息
+        """
+        return MessageHandler()
+    
+    def open_subscription(self, name, types=None, maxsize=1000, backpressure='coalesce', put_timeout=1.0):
+        """
+        在消息总线上创建一个命名订阅，多个消费者（GUI、TTS播报、导出等）各自取到完整的消息流，互不抢占
+        :param name: 订阅名
+        :param types: 需要的消息类型，None表示全部；只能是 subscriptions 中解析的类型
+        :param maxsize: 订阅队列的最大容量
+        :param backpressure: 队列满时的处理方式：'drop'、'coalesce' 或 'block'（见 message_bus.py）
+        :param put_timeout: block 方式接收线程最多等待的时间（秒）
+        :return: 订阅的消息处理器，用 get_message/get_batch 取消息
+        """
+        if types is not None:
+            types = frozenset(types)
+            unknown = types - MESSAGE_TYPES
+            if unknown:
+                raise ValueError(f"未知的消息类型: {', '.join(sorted(unknown))}")
+            if self.subscriptions is not None and not types <= self.subscriptions | {'control'}:
+                raise ValueError(f"消息类型未解析: {', '.join(sorted(types - self.subscriptions - {'control'}))}")
+        return self.bus.subscribe(name, types, maxsize, backpressure, put_timeout)
+    
+    def close_subscription(self, name):
+        """
+        取消命名订阅，正在等待该订阅消息的消费者会被唤醒
+        取消 default 订阅后 get_message/get_messages 不再有消息，subscribe 也不会重新创建
+        :param name: 订阅名
+        """
+        if name == 'default':
+            self.default_subscription = False
+        self.bus.unsubscribe(name)
     
     def start(self):
-        self._connectWebSocket()
+        """
+        连接直播间并持续接收消息，连接断开后按指数退避自动重连，直到调用stop或直播结束
+        """
+        backoff = Backoff(maximum=self.max_reconnect_delay, jitter=0.5)
+        while self.bus.is_running():
+            backoff.mark_started()
+            self._connectWebSocket()
+            if not self._shouldReconnect():
+                break
+            delay = backoff.next_delay()
+            print(f"【X】连接已断开，{delay:.1f}秒后重连")
+            if self._stop_event.wait(delay):
+                break
+            # 主播可能已重新开播，下次连接时重新获取room_id
+            self._invalidateRoomId()
+    
+    def _invalidateRoomId(self):
+        """
+        作废缓存的room_id：主播重新开播后room_id会变化，缓存（可能持久化在磁盘上）中的旧值
+        会让重连一直连到已结束的直播间，直到缓存过期
+        """
+        if self.skip_bootstrap:
+            return
+        self.bootstrap_cache.invalidate_room_id(self.live_id)
+        self.__room_id = None
     
     def stop(self):
-        self.ws.close()
-        self.message_handler.stop()
+        self._stop_event.set()
+        self._stopHeartbeat()
+        self.bus.stop()
+        if self.ws is not None:
+            self.ws.close()
+    
+    def flush(self, timeout=None):
+        """
+        等待已收到的帧全部解析并放入消息队列，在接收线程中直接解析时立即返回
+        :param timeout: 超时时间（秒），None表示一直等待
+        :return: 是否全部处理完
+        """
+        if self._delivery is None:
+            return True
+        return self._delivery.join(timeout)
     
     def get_message(self, timeout=None):
         """
@@ -137,6 +306,15 @@ class DouyinLiveWebFetcher:
         """
         return self.message_handler.get_message(timeout)
     
+    def get_messages(self, max_n=100, timeout=None):
+        """
+        批量获取消息，有消息后立即返回，每次唤醒处理一批
+        :param max_n: 最多获取的消息数
+        :param timeout: 超时时间（秒），None表示阻塞等待
+        :return: 消息字典列表，超时或被关闭时为空列表
+        """
+        return self.message_handler.get_batch(max_n, timeout)
+    
     def get_message_nowait(self):
         """
         非阻塞获取一条消息
@@ -151,12 +329,24 @@ class DouyinLiveWebFetcher:
         """
         return self.message_handler.size()
     
+    def message_stats(self):
+        """
+        获取各类消息的入队、合并、丢弃计数
+        :return: {消息类型: {'added':, 'coalesced':, 'evicted':, 'rejected':}}
+        """
+        return self.message_handler.stats()
+    
     @property
     def ttwid(self):
         """
         产生请求头部cookie中的ttwid字段，访问抖音网页版直播间首页可以获取到响应cookie中的ttwid
         :return: ttwid
         """
+        if self.__ttwid:
+            return self.__ttwid
+        if self.skip_bootstrap:
+            return ''
+        self.__ttwid = self.bootstrap_cache.get_ttwid()
         if self.__ttwid:
             return self.__ttwid
         headers = {
@@ -169,6 +359,8 @@ class DouyinLiveWebFetcher:
             print("【X】Request the live url error: ", err)
         else:
             self.__ttwid = response.cookies.get('ttwid')
+            if self.__ttwid:
+                self.bootstrap_cache.set_ttwid(self.__ttwid)
             return self.__ttwid
     
     @property
@@ -177,6 +369,11 @@ class DouyinLiveWebFetcher:
         根据直播间的地址获取到真正的直播间roomId，有时会有错误，可以重试请求解决
         :return:room_id
         """
+        if self.__room_id:
+            return self.__room_id
+        if self.skip_bootstrap:
+            return self.live_id
+        self.__room_id = self.bootstrap_cache.get_room_id(self.live_id)
         if self.__room_id:
             return self.__room_id
         url = self.live_url + self.live_id
@@ -185,17 +382,14 @@ class DouyinLiveWebFetcher:
             "cookie": f"ttwid={self.ttwid}&msToken={generateMsToken()}; __ac_nonce=0123407cc00a9e438deb4",
         }
         try:
-            response = self.session.get(url, headers=headers)
-            response.raise_for_status()
+            # 流式读取页面，匹配到roomId后立即停止下载
+            self.__room_id = fetch_room_id(self.session, self.live_id, url, headers)
+        except RoomIdNotFoundError as err:
+            print("【X】No match found for roomId: ", err)
         except Exception as err:
             print("【X】Request the live room url error: ", err)
         else:
-            match = re.search(r'roomId\\":\\"(\d+)\\"', response.text)
-            if match is None or len(match.groups()) < 1:
-                print("【X】No match found for roomId")
-            
-            self.__room_id = match.group(1)
-            
+            self.bootstrap_cache.set_room_id(self.live_id, self.__room_id)
             return self.__room_id
     
     def get_ac_nonce(self):
@@ -209,7 +403,7 @@ class DouyinLiveWebFetcher:
         """
         获取 __ac_signature
         """
-        __ac_signature = get__ac_signature(self.host[8:], __ac_nonce, self.user_agent)
+        __ac_signature = self.ac_signer.sign(__ac_nonce)
         self.session.cookies.set("__ac_signature", __ac_signature)
         return __ac_signature
     
@@ -218,8 +412,10 @@ class DouyinLiveWebFetcher:
         获取 a_bogus
         """
         url = urllib.parse.urlencode(url_params)
-        ctx = execute_js(self.abogus_file)
-        _a_bogus = ctx.call("get_ab", url, self.user_agent)
+        if self.abogus_file is None:
+            _a_bogus = a_bogus.get_ab(url, self.user_agent)
+        else:
+            _a_bogus = get_abogus_generator(self.abogus_file).get_ab(url, self.user_agent)
         return _a_bogus
     
     def get_room_status(self):
@@ -227,10 +423,24 @@ class DouyinLiveWebFetcher:
         获取直播间开播状态:
         room_status: 2 直播已结束
         room_status: 0 直播进行中
+        跳过引导时不查询，返回当前记录的状态
         """
-        msToken = generateMsToken()
+        if self.skip_bootstrap:
+            return self.room_status
         nonce = self.get_ac_nonce()
         signature = self.get_ac_signature(nonce)
+        url, headers = self._roomStatusRequest(nonce, signature)
+        resp = self.session.get(url, headers=headers)
+        return self._parseRoomStatus(resp.json().get('data'))
+    
+    def _roomStatusRequest(self, nonce, signature):
+        """
+        拼接查询直播间状态的请求，同步与 asyncio 版本共用
+        :param nonce: __ac_nonce
+        :param signature: __ac_signature
+        :return: (带a_bogus的url, 请求头)
+        """
+        msToken = generateMsToken()
         url = ('https://live.douyin.com/webcast/room/web/enter/?aid=6383'
                '&app_name=douyin_web&live_id=1&device_platform=web&language=zh-CN&enter_from=page_refresh'
                '&cookie_enabled=true&screen_width=5120&screen_height=1440&browser_language=zh-CN&browser_platform=Win32'
@@ -247,37 +457,103 @@ class DouyinLiveWebFetcher:
             'Referer': f'https://live.douyin.com/{self.live_id}',
             'Cookie': f'ttwid={self.ttwid};__ac_nonce={nonce}; __ac_signature={signature}',
         })
-        resp = self.session.get(url, headers=headers)
-        data = resp.json().get('data')
+        return url, headers
+    
+    def _parseRoomStatus(self, data):
+        """
+        :param data: 直播间状态接口返回的 data 字段
+        :return: room_status，没有数据时为None
+        """
         if data:
             room_status = data.get('room_status')
             user = data.get('user')
             user_id = user.get('id_str')
             nickname = user.get('nickname')
             print(f"【{nickname}】[{user_id}]直播间：{['正在直播', '已结束'][bool(room_status)]}.")
+            return room_status
+    
+    def _buildWssUrl(self):
+        """
+        拼接websocket连接地址（不含signature）
+        有续传位置时从上次收到的 cursor/internal_ext 继续，否则从当前时间开始
+        :return: wss地址
+        """
+        push_server = self.endpoint or self.push_server or WSS_PUSH_SERVER
+        room_id = self.room_id
+        if self._resume_room_id != room_id:
+            # 重新开播后是新的直播间，从当前时间开始
+            self.cursor = None
+            self.internal_ext = None
+            self._resume_room_id = room_id
+        if self.cursor:
+            cursor = self.cursor
+            internal_ext = self.internal_ext
+        else:
+            now = int(time.time() * 1000)
+            cursor = f"d-1_u-1_fh-7392091211001140287_t-{now}_r-1"
+            internal_ext = (f"internal_src:dim|wss_push_room_id:{room_id}|wss_push_did:{WSS_DID}"
+                            f"|first_req_ms:{now}|fetch_time:{now}|seq:1|wss_info:0-{now}-0-0|"
+                            f"wrds_v:7392094459690748497")
+        return (f"{push_server}?app_name=douyin_web"
+                "&version_code=180800&webcast_sdk_version=1.0.14-beta.0"
+                "&update_version_code=1.0.14-beta.0&compress=gzip&device_platform=web&cookie_enabled=true"
+                "&screen_width=1536&screen_height=864&browser_language=zh-CN&browser_platform=Win32"
+                "&browser_name=Mozilla"
+                "&browser_version=5.0%20(Windows%20NT%2010.0;%20Win64;%20x64)%20AppleWebKit/537.36%20(KHTML,"
+                "%20like%20Gecko)%20Chrome/126.0.0.0%20Safari/537.36"
+                "&browser_online=true&tz_name=Asia/Shanghai"
+                f"&cursor={urllib.parse.quote(cursor, safe='-_')}"
+                f"&internal_ext={urllib.parse.quote(internal_ext, safe=':|-_,')}"
+                f"&host=https://live.douyin.com&aid=6383&live_id=1&did_rule=3&endpoint=live_pc&support_wrds=1"
+                f"&user_unique_id={WSS_DID}&im_path=/webcast/im/fetch/&identity=audience"
+                f"&need_persist_msg_count=15&insert_task_id=&live_reason=&room_id={room_id}&heartbeatDuration=0")
+    
+    def _signWssUrl(self, wss):
+        """
+        给wss地址加上signature，参与签名的参数没有变化时复用上次的签名
+        续传重连只改变 cursor/internal_ext，不需要重新签名
+        :param wss: wss地址
+        :return: 带signature的wss地址
+        """
+        if self.skip_bootstrap:
+            return wss
+        digest = signatureDigest(wss)
+        cached = self._signature
+        if cached is None or cached[0] != digest or time.monotonic() - cached[1] > SIGNATURE_TTL:
+            signature = generateSignature(wss)
+            if signature is None:
+                return wss
+            cached = self._signature = (digest, time.monotonic(), signature)
+        return wss + f"&signature={cached[2]}"
+    
+    def _saveResumeState(self, response):
+        """
+        记录续传位置，消息分发完成后调用，保证重连后既不丢消息也不重复
+        :param response: 解析后的Response
+        """
+        if response.cursor:
+            self.cursor = response.cursor
+        if response.internal_ext:
+            self.internal_ext = response.internal_ext
+        if response.push_server.startswith('ws'):
+            self.push_server = response.push_server
+        if response.heartbeat_duration:
+            # heartbeat_duration 单位为毫秒
+            self.heartbeat_interval = max(response.heartbeat_duration / 1000, MIN_HEARTBEAT_INTERVAL)
+            if self._heartbeat is not None:
+                self._heartbeat.set_interval(self.heartbeat_interval)
+    
+    def _shouldReconnect(self):
+        """
+        连接关闭后是否需要重连：未调用stop且直播没有结束
+        """
+        return self.bus.is_running() and self.room_status != 2
     
     def _connectWebSocket(self):
         """
         连接抖音直播间websocket服务器，请求直播间数据
         """
-        wss = ("wss://webcast100-ws-web-lq.douyin.com/webcast/im/push/v2/?app_name=douyin_web"
-               "&version_code=180800&webcast_sdk_version=1.0.14-beta.0"
-               "&update_version_code=1.0.14-beta.0&compress=gzip&device_platform=web&cookie_enabled=true"
-               "&screen_width=1536&screen_height=864&browser_language=zh-CN&browser_platform=Win32"
-               "&browser_name=Mozilla"
-               "&browser_version=5.0%20(Windows%20NT%2010.0;%20Win64;%20x64)%20AppleWebKit/537.36%20(KHTML,"
-               "%20like%20Gecko)%20Chrome/126.0.0.0%20Safari/537.36"
-               "&browser_online=true&tz_name=Asia/Shanghai"
-               "&cursor=d-1_u-1_fh-7392091211001140287_t-1721106114633_r-1"
-               f"&internal_ext=internal_src:dim|wss_push_room_id:{self.room_id}|wss_push_did:7319483754668557238"
-               f"|first_req_ms:1721106114541|fetch_time:1721106114633|seq:1|wss_info:0-1721106114633-0-0|"
-               f"wrds_v:7392094459690748497"
-               f"&host=https://live.douyin.com&aid=6383&live_id=1&did_rule=3&endpoint=live_pc&support_wrds=1"
-               f"&user_unique_id=7319483754668557238&im_path=/webcast/im/fetch/&identity=audience"
-               f"&need_persist_msg_count=15&insert_task_id=&live_reason=&room_id={self.room_id}&heartbeatDuration=0")
-        
-        signature = generateSignature(wss)
-        wss += f"&signature={signature}"
+        wss = self._signWssUrl(self._buildWssUrl())
         
         headers = {
             "cookie": f"ttwid={self.ttwid}",
@@ -295,20 +571,27 @@ class DouyinLiveWebFetcher:
             self.stop()
             raise
     
-    def _sendHeartbeat(self):
+    def _sendHeartbeat(self, ws):
         """
-        发送心跳包
+        发送心跳包，由心跳调度线程调用，抛出异常时该连接的心跳被取消
+        :param ws: websocket实例
         """
-        while True:
-            try:
-                heartbeat = PushFrame(payload_type='hb').SerializeToString()
-                self.ws.send(heartbeat, websocket.ABNF.OPCODE_PING)
-                print("【√】发送心跳包")
-            except Exception as e:
-                print("【X】心跳包检测错误: ", e)
-                break
-            else:
-                time.sleep(5)
+        ws.send(HEARTBEAT_FRAME, websocket.ABNF.OPCODE_PING)
+        print("【√】发送心跳包")
+    
+    def _startHeartbeat(self, ws):
+        """
+        把连接注册到进程内共享的心跳调度器，不再为每个连接单独开线程
+        :param ws: websocket实例
+        """
+        self._stopHeartbeat()
+        self._heartbeat = get_heartbeat_scheduler().register(lambda: self._sendHeartbeat(ws),
+                                                             self.heartbeat_interval)
+    
+    def _stopHeartbeat(self):
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
     
     def _wsOnOpen(self, ws):
         """
@@ -317,7 +600,7 @@ class DouyinLiveWebFetcher:
         print("【√】WebSocket连接成功.")
         if self.on_status_update:
             self.on_status_update("WebSocket连接成功")
-        threading.Thread(target=self._sendHeartbeat).start()
+        self._startHeartbeat(ws)
     
     def _wsOnMessage(self, ws, message):
         """
@@ -325,228 +608,139 @@ class DouyinLiveWebFetcher:
         :param ws: websocket实例
         :param message: 数据
         """
+        if self.recorder is not None:
+            self.recorder.record(message)
         
-        # 根据proto结构体解析对象
-        package = PushFrame().parse(message)
-        response = Response().parse(gzip.decompress(package.payload))
+        package, data, response = self._decodeFrame(message)
         
         # 返回直播间服务器链接存活确认消息，便于持续获取数据
-        if response.need_ack:
-            ack = PushFrame(log_id=package.log_id,
-                            payload_type='ack',
-                            payload=response.internal_ext.encode('utf-8')
-                            ).SerializeToString()
+        # ack只依赖 Response 头部字段，在解析消息列表之前立即发送
+        ack = self._buildAck(package, response)
+        if ack:
             ws.send(ack, websocket.ABNF.OPCODE_BINARY)
+            # ack本身就能保持连接活跃，推迟下一次心跳
+            if self._heartbeat is not None:
+                self._heartbeat.touch()
         
-        # 根据消息类别解析消息体
-        for msg in response.messages_list:
-            method = msg.method
+        self._dispatchMessages(data)
+        self._saveResumeState(response)
+    
+    def _decodeFrame(self, message):
+        """
+        解析 PushFrame 并解压，只扫描 Response 头部字段，消息列表留给 _dispatchMessages
+        :param message: websocket收到的原始数据
+        :return: (Frame, 解压后的Response, 头部字段的ResponseView)
+        """
+        package = self.codec.parse_frame(message)
+        data = gunzip(package.payload)
+        return package, data, scan_response_header(data)
+    
+    def _buildAck(self, package, response):
+        """
+        构造存活确认消息
+        :return: 序列化后的ack帧，不需要ack时返回None
+        """
+        if not response.need_ack:
+            return None
+        return self.codec.build_ack(package.log_id, response.internal_ext)
+    
+    def _dispatchMessages(self, data):
+        """
+        解析消息列表并按类别分发，未订阅和未知的消息类别直接跳过
+        使用解析池时交给解析池，结果按帧顺序通过 _deliverMessages 交付
+        :param data: 解压后的Response
+        """
+        if self._delivery is None:
+            self._applyMessages(decode_messages(self.codec, data, self._wanted))
+        else:
+            self._delivery.submit(self.codec.name, data, self._wanted)
+    
+    def _deliverMessages(self, decoded):
+        """
+        接收解析池按顺序交付的结果，在解析池的线程中调用
+        :param decoded: 事件列表（见 events.py）
+        """
+        self._applyMessages(decoded)
+    
+    def _applyMessages(self, decoded):
+        """
+        一帧中的消息一次性发布到消息总线，再依次调用各类消息的处理方法（打印、直播结束时停止等）
+        :param decoded: 事件列表（见 events.py）
+        """
+        self.bus.publish_many(decoded)
+        handlers = self._handlers
+        for event in decoded:
             try:
-                {
-                    'WebcastChatMessage': self._parseChatMsg,  # 聊天消息
-                    'WebcastGiftMessage': self._parseGiftMsg,  # 礼物消息
-                    'WebcastLikeMessage': self._parseLikeMsg,  # 点赞消息
-                    'WebcastMemberMessage': self._parseMemberMsg,  # 进入直播间消息
-                    'WebcastSocialMessage': self._parseSocialMsg,  # 关注消息
-                    'WebcastRoomUserSeqMessage': self._parseRoomUserSeqMsg,  # 直播间统计
-                    'WebcastFansclubMessage': self._parseFansclubMsg,  # 粉丝团消息
-                    'WebcastControlMessage': self._parseControlMsg,  # 直播间状态消息
-                    'WebcastEmojiChatMessage': self._parseEmojiChatMsg,  # 聊天表情包消息
-                    'WebcastRoomStatsMessage': self._parseRoomStatsMsg,  # 直播间统计信息
-                    'WebcastRoomMessage': self._parseRoomMsg,  # 直播间信息
-                    'WebcastRoomRankMessage': self._parseRankMsg,  # 直播间排行榜信息
-                    'WebcastRoomStreamAdaptationMessage': self._parseRoomStreamAdaptationMsg,  # 直播间流配置
-                }.get(method)(msg.payload)
-            except Exception:
-                pass
+                handlers[event.type](event)
+            except Exception as e:
+                print(f"【X】处理{event.type}消息出错: ", e)
     
     def _wsOnError(self, ws, error):
         print("WebSocket error: ", error)
+        if isinstance(error, websocket.WebSocketBadStatusException):
+            # 握手被拒绝，可能是签名失效，下次重连重新签名
+            self._signature = None
         if self.on_status_update:
             self.on_status_update(f"WebSocket错误: {error}")
     
     def _wsOnClose(self, ws, *args):
-        self.get_room_status()
+        self._stopHeartbeat()
+        try:
+            self.room_status = self.get_room_status()
+        except Exception as e:
+            print("【X】获取直播间状态失败: ", e)
         print("WebSocket connection closed.")
         if self.on_status_update:
             self.on_status_update("WebSocket连接已关闭")
     
-    def _parseChatMsg(self, payload):
+    def _handleChatMsg(self, chat_msg):
         """聊天消息"""
-        message = ChatMessage().parse(payload)
-        user_name = message.user.nick_name
-        user_id = message.user.id
-        content = message.content
-        
-        chat_msg = {
-            'user_name': user_name,
-            'user_id': user_id,
-            'content': content
-        }
-        
-        self.message_handler.add_message('chat', chat_msg)
-        print(f"【聊天msg】[{user_id}]{user_name}: {content}")
-
+        print(f"【聊天msg】[{chat_msg.user_id}]{chat_msg.user_name}: {chat_msg.content}")
     
-    def _parseGiftMsg(self, payload):
+    def _handleGiftMsg(self, gift_msg):
         """礼物消息"""
-        message = GiftMessage().parse(payload)
-        user_name = message.user.nick_name
-        gift_name = message.gift.name
-        gift_cnt = message.combo_count
-        
-        gift_msg = {
-            'user_name': user_name,
-            'gift_name': gift_name,
-            'gift_count': gift_cnt
-        }
-        
-        self.message_handler.add_message('gift', gift_msg)
-        # print(f"【礼物msg】{user_name} 送出了 {gift_name}x{gift_cnt}")
+        # print(f"【礼物msg】{gift_msg.user_name} 送出了 {gift_msg.gift_name}x{gift_msg.gift_count}")
     
-    def _parseLikeMsg(self, payload):
+    def _handleLikeMsg(self, like_msg):
         '''点赞消息'''
-        message = LikeMessage().parse(payload)
-        user_name = message.user.nick_name
-        count = message.count
-        
-        like_msg = {
-            'user_name': user_name,
-            'count': count
-        }
-        
-        self.message_handler.add_message('like', like_msg)
-        # print(f"【点赞msg】{user_name} 点了{count}个赞")
+        # print(f"【点赞msg】{like_msg.user_name} 点了{like_msg.count}个赞")
     
-    def _parseMemberMsg(self, payload):
+    def _handleMemberMsg(self, member_msg):
         '''进入直播间消息'''
-        message = MemberMessage().parse(payload)
-        user_name = message.user.nick_name
-        user_id = message.user.id
-        gender = ["女", "男"][message.user.gender]
-        
-        member_msg = {
-            'user_name': user_name,
-            'user_id': user_id,
-            'gender': gender
-        }
-        
-        self.message_handler.add_message('member', member_msg)
-        # print(f"【进场msg】[{user_id}][{gender}]{user_name} 进入了直播间")
+        # print(f"【进场msg】[{member_msg.user_id}][{member_msg.gender}]{member_msg.user_name} 进入了直播间")
     
-    def _parseSocialMsg(self, payload):
+    def _handleSocialMsg(self, social_msg):
         '''关注消息'''
-        message = SocialMessage().parse(payload)
-        user_name = message.user.nick_name
-        user_id = message.user.id
-        
-        social_msg = {
-            'user_name': user_name,
-            'user_id': user_id
-        }
-        
-        self.message_handler.add_message('social', social_msg)
-        # print(f"【关注msg】[{user_id}]{user_name} 关注了主播")
+        # print(f"【关注msg】[{social_msg.user_id}]{social_msg.user_name} 关注了主播")
     
-    def _parseRoomUserSeqMsg(self, payload):
+    def _handleRoomUserSeqMsg(self, stats_msg):
         '''直播间统计'''
-        message = RoomUserSeqMessage().parse(payload)
-        current = message.total
-        total = message.total_pv_for_anchor
-        
-        stats_msg = {
-            'current_viewers': current,
-            'total_viewers': total
-        }
-        
-        self.message_handler.add_message('room_stats', stats_msg)
-        # print(f"【统计msg】当前观看人数: {current}, 累计观看人数: {total}")
+        # print(f"【统计msg】当前观看人数: {stats_msg.current_viewers}, 累计观看人数: {stats_msg.total_viewers}")
     
-    def _parseFansclubMsg(self, payload):
+    def _handleFansclubMsg(self, fansclub_msg):
         '''粉丝团消息'''
-        message = FansclubMessage().parse(payload)
-        content = message.content
-        
-        fansclub_msg = {
-            'content': content
-        }
-        
-        self.message_handler.add_message('fansclub', fansclub_msg)
-        # print(f"【粉丝团msg】 {content}")
+        # print(f"【粉丝团msg】 {fansclub_msg.content}")
     
-    def _parseEmojiChatMsg(self, payload):
+    def _handleEmojiChatMsg(self, emoji_msg):
         '''聊天表情包消息'''
-        message = EmojiChatMessage().parse(payload)
-        emoji_id = message.emoji_id
-        user = message.user
-        common = message.common
-        default_content = message.default_content
-        
-        emoji_msg = {
-            'emoji_id': emoji_id,
-            'user': user,
-            'common': common,
-            'default_content': default_content
-        }
-        
-        self.message_handler.add_message('emoji_chat', emoji_msg)
-        print(f"【聊天表情包id】 {emoji_id},user：{user},common:{common},default_content:{default_content}")
+        print(f"【聊天表情包id】 {emoji_msg.emoji_id},user：[{emoji_msg.user_id}]{emoji_msg.user_name},"
+              f"default_content:{emoji_msg.default_content}")
     
-    def _parseRoomMsg(self, payload):
-        message = RoomMessage().parse(payload)
-        common = message.common
-        room_id = common.room_id
-        
-        room_msg = {
-            'room_id': room_id
-        }
-        
-        self.message_handler.add_message('room', room_msg)
-        print(f"【直播间msg】直播间id:{room_id}")
+    def _handleRoomMsg(self, room_msg):
+        print(f"【直播间msg】直播间id:{room_msg.room_id}")
     
-    def _parseRoomStatsMsg(self, payload):
-        message = RoomStatsMessage().parse(payload)
-        display_long = message.display_long
-        
-        room_stats_msg = {
-            'display_info': display_long
-        }
-        
-        self.message_handler.add_message('room_display_stats', room_stats_msg)
-        print(f"【直播间统计msg】{display_long}")
+    def _handleRoomStatsMsg(self, room_stats_msg):
+        print(f"【直播间统计msg】{room_stats_msg.display_info}")
     
-    def _parseRankMsg(self, payload):
-        message = RoomRankMessage().parse(payload)
-        ranks_list = message.ranks_list
-        
-        rank_msg = {
-            'ranks': ranks_list
-        }
-        
-        self.message_handler.add_message('rank', rank_msg)
-        # print(f"【直播间排行榜msg】{ranks_list}")
+    def _handleRankMsg(self, rank_msg):
+        '''直播间排行榜信息'''
+        # print(f"【直播间排行榜msg】{rank_msg.ranks}")
     
-    def _parseControlMsg(self, payload):
+    def _handleControlMsg(self, control_msg):
         '''直播间状态消息'''
-        message = ControlMessage().parse(payload)
-        
-        control_msg = {
-            'status': message.status
-        }
-        
-        self.message_handler.add_message('control', control_msg)
-        
-        if message.status == 3:
+        if control_msg.status == 3:
             print("直播间已结束")
             self.stop()
     
-    def _parseRoomStreamAdaptationMsg(self, payload):
-        message = RoomStreamAdaptationMessage().parse(payload)
-        adaptationType = message.adaptation_type
-        
-        adaptation_msg = {
-            'adaptation_type': adaptationType
-        }
-        
-        self.message_handler.add_message('stream_adaptation', adaptation_msg)
-        print(f'直播间adaptation: {adaptationType}')
\ No newline at end of file
+    def _handleRoomStreamAdaptationMsg(self, adaptation_msg):
+        print(f"直播间adaptation: {adaptation_msg.adaptation_type}")
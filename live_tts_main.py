@@ -8,23 +8,34 @@ from liveMan import DouyinLiveWebFetcher
 class LiveTTS:
     """直播TTS播放器"""
     
-    def __init__(self, live_id):
+    def __init__(self, live_id, fetcher=None):
+        """
+        :param live_id: 直播id
+        :param fetcher: 与其他消费者（如GUI）共用的 DouyinLiveWebFetcher，为None时自己创建；
+                        共用时由创建者负责启动和停止
+        """
         self.live_id = live_id
-        self.fetcher = DouyinLiveWebFetcher(live_id)
+        self.owns_fetcher = fetcher is None
+        # 只播报聊天消息，自己创建时其他类型的消息不解析；只从 'tts' 订阅取消息，不需要默认订阅
+        self.fetcher = fetcher or DouyinLiveWebFetcher(live_id, subscriptions=('chat',), default_subscription=False)
+        self.messages = self.fetcher.open_subscription('tts', types=('chat',))
         self.running = True
 
     def start(self):
         """启动直播监听和TTS播放"""
-        # 启动直播监听线程
-        listener_thread = threading.Thread(target=self._listen_danmaku, name="DanmakuListener")
-        listener_thread.daemon = True
-        listener_thread.start()
-        
         # 启动TTS播放线程
         player_thread = threading.Thread(target=self._tts_player, name="TTSPlayer")
         player_thread.daemon = True
         player_thread.start()
         
+        if self.owns_fetcher:
+            # 启动直播监听线程
+            listener_thread = threading.Thread(target=self._listen_danmaku, name="DanmakuListener")
+            listener_thread.daemon = True
+            listener_thread.start()
+        else:
+            listener_thread = player_thread
+        
         # 等待监听线程结束
         try:
             listener_thread.join()
@@ -41,15 +52,13 @@ class LiveTTS:
 
     def _tts_player(self):
         """TTS播放线程"""
-        while self.running and self.fetcher.message_handler.is_running():
+        while self.running and self.messages.is_running():
             try:
-                # 从消息处理器获取消息
-                message = self.fetcher.get_message(timeout=1)
-                
-                if message and message['type'] == 'chat':
+                # 从订阅批量获取聊天消息，一次唤醒处理一批
+                for message in self.messages.get_batch(max_n=100, timeout=1):
                     # 处理聊天消息
-                    content = message['payload']['content']
-                    user_name = message['payload']['user_name']
+                    content = message.content
+                    user_name = message.user_name
                     
                     text_to_speak = f"{user_name}说：{content}"
                     print(f"[TTS队列] 添加消息: {text_to_speak}")
@@ -8,6 +8,10 @@
 1. 命令行直接运行: python main.py <room_id>
 2. GUI界面运行: python main.py gui
 3. TTS模式运行: python live_tts_main.py
+4. 多直播间运行: python main.py multi <room_id...|file>
+5. 回放录制文件: python main.py replay <file> [倍速|max]
+
+以上命令行方式均可加 --codec <betterproto|protobuf|auto> 选择protobuf解析后端
 """
 
 import sys
@@ -16,8 +20,13 @@ import os
 # 添加项目根目录到Python路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from bootstrap import configure_bootstrap_cache
+from codec import configure_codec
 from liveMan import DouyinLiveWebFetcher
 
+# ttwid/room_id 缓存文件，重启后在有效期内可直接连接，无需再请求直播间页面
+BOOTSTRAP_CACHE_FILE = 'bootstrap_cache.json'
+
 
 def show_usage():
     """显示使用说明"""
@@ -32,6 +41,25 @@ def show_usage():
 
 3. TTS模式: python live_tts_main.py
 
+4. 多直播间模式: python main.py multi <room_id...|file>
+   示例: python main.py multi 50828500437 261378947940
+         python main.py multi rooms.txt   (每行一个直播间ID)
+
+5. 回放模式: python main.py replay <录制文件> [倍速|max]
+   不联网，把录制的原始帧按原速(默认)、N倍速或最快速度重新解析分发，输出吞吐
+   示例: python main.py replay room.dycap max
+
+选项:
+   --codec <名称>  protobuf解析后端: betterproto(默认)、protobuf(需 pip install protobuf，解析更快)、
+                   auto(已安装 protobuf 时使用 protobuf)
+   示例: python main.py --codec protobuf 50828500437
+   --record <文件>  命令行模式下把收到的原始帧录制到文件，文件名以 .zst 结尾时使用zstd压缩
+                   (需 pip install zstandard)
+   示例: python main.py --record room.dycap 50828500437
+   --endpoint <地址>  命令行模式下连接指定的推送服务器（如 mock_server.py 启动的本地模拟服务器），
+                     跳过签名和直播间引导
+   示例: python main.py --endpoint ws://127.0.0.1:8765/webcast/im/push/v2/ 1
+
 注意: 
 - 使用前请确保已安装所需依赖: pip install -r requirements.txt
 - 需要安装Node.js环境以执行JavaScript签名计算
@@ -40,16 +68,98 @@ def show_usage():
     print(usage)
 
 
-def run_command_line_mode(live_id):
-    """运行命令行模式"""
+def pop_option(args, option, default=None):
+    """
+    从命令行参数中取出 <option> <值>
+    :param args: 命令行参数，会被原地修改
+    :param option: 选项名，如 '--codec'
+    :param default: 未指定时的值
+    :return: 选项的值
+    """
+    if option not in args:
+        return default
+    index = args.index(option)
+    if index + 1 >= len(args):
+        raise SystemExit(f"{option} 需要指定值")
+    value = args[index + 1]
+    del args[index:index + 2]
+    return value
+
+
+def pop_codec_option(args):
+    """
+    从命令行参数中取出 --codec <名称>
+    :param args: 命令行参数，会被原地修改
+    :return: 后端名称，未指定时为 'betterproto'
+    """
+    return pop_option(args, '--codec', 'betterproto')
+
+
+def run_command_line_mode(live_id, record_file=None, endpoint=None):
+    """
+    运行命令行模式
+    :param live_id: 直播间ID
+    :param record_file: 原始帧录制文件，为None时不录制
+    :param endpoint: 推送服务器地址，为None时连接抖音
+    """
+    recorder = None
     try:
         print(f"正在连接直播间: {live_id}")
-        room = DouyinLiveWebFetcher(live_id)
+        configure_bootstrap_cache(BOOTSTRAP_CACHE_FILE)
+        if record_file:
+            from capture import FrameRecorder
+            recorder = FrameRecorder(record_file, compress=record_file.endswith('.zst'))
+            print(f"原始帧录制到: {record_file}")
+        room = DouyinLiveWebFetcher(live_id, recorder=recorder, endpoint=endpoint)
         room.start()
     except KeyboardInterrupt:
         print("\n程序已退出")
     except Exception as e:
         print(f"发生错误: {e}")
+    finally:
+        if recorder is not None:
+            recorder.close()
+            print(f"已录制 {recorder.frames} 帧")
+
+
+def run_replay_mode(args):
+    """
+    运行回放模式
+    :param args: [录制文件, 倍速|max]
+    """
+    from capture import replay
+
+    if not args:
+        show_usage()
+        return
+    path = args[0]
+    speed = args[1] if len(args) > 1 else '1'
+    speed = None if speed == 'max' else float(speed)
+    # 回放不联网，只打印统计结果，消息队列满时自动丢弃最旧的消息
+    room = DouyinLiveWebFetcher('replay')
+    stats = replay(room, path, speed)
+    print(f"回放 {stats.frames} 帧，ack {stats.acks} 次，出错 {stats.errors} 帧，"
+          f"耗时 {stats.seconds:.2f} 秒，{stats.frames_per_second:.1f} 帧/秒")
+
+
+def run_multi_room_mode(args, rooms_per_worker=8):
+    """运行多直播间模式"""
+    from supervisor import RoomSupervisor, load_live_ids
+
+    live_ids = load_live_ids(args)
+    if not live_ids:
+        show_usage()
+        return
+    print(f"正在连接{len(live_ids)}个直播间，每个工作进程{rooms_per_worker}个")
+    supervisor = RoomSupervisor(live_ids, rooms_per_worker=rooms_per_worker)
+    supervisor.start()
+    try:
+        for message in supervisor:
+            print(f"[{message['room']}] {message['type']}: {message['payload']}")
+    except KeyboardInterrupt:
+        print("\n程序已退出")
+    finally:
+        supervisor.stop()
 
 
 def run_gui_mode():
@@ -63,10 +173,20 @@ def run_gui_mode():
 
 
 if __name__ == '__main__':
+    try:
+        configure_codec(pop_codec_option(sys.argv))
+    except (ImportError, ValueError) as e:
+        raise SystemExit(f"无法使用指定的protobuf解析后端: {e}")
+    record_file = pop_option(sys.argv, '--record')
+    endpoint = pop_option(sys.argv, '--endpoint')
     if len(sys.argv) < 2:
         show_usage()
     elif sys.argv[1] == 'gui':
         run_gui_mode()
+    elif sys.argv[1] == 'multi':
+        run_multi_room_mode(sys.argv[2:])
+    elif sys.argv[1] == 'replay':
+        run_replay_mode(sys.argv[2:])
     else:
         live_id = sys.argv[1]
-        run_command_line_mode(live_id)
\ No newline at end of file
+        run_command_line_mode(live_id, record_file, endpoint)
\ No newline at end of file
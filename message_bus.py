@@ -0,0 +1,167 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+消息广播总线
+
+MessageHandler 是单消费者队列，GUI、TTS播报和日志记录同时取消息会互相抢走对方的消息。
+MessageBus 把每批消息广播给所有命名订阅，每个订阅有自己的消息类型过滤、有界队列和背压策略：
+
+    drop      队列满时丢弃最旧的消息，不区分类型
+    coalesce  按消息类型的优先级和配额丢弃，点赞按用户合并、统计类消息只保留最新（DEFAULT_POLICIES）
+    block     队列满时发布者等待消费者取走消息，最多等待 put_timeout 秒，超时后丢弃最旧的消息
+
+每条消息（见 events.py）只有一个对象，所有订阅共享；事件不可修改，合并时会生成新的事件。
+发布者通常是接收线程，block 订阅消费太慢会拖慢所有订阅和ack，只适合不能丢消息的导出等场景。
+
+用法:
+    fetcher = DouyinLiveWebFetcher(live_id)
+    tts = fetcher.open_subscription('tts', types=('gift', 'social'))
+    log = fetcher.open_subscription('log', backpressure='block')
+    ...
+    for message in tts.get_batch(timeout=1):
+        ...
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from events import AnyMessage, make_message
+from message_handler import MessageHandler
+
+BACKPRESSURE_POLICIES = ('drop', 'coalesce', 'block')
+
+
+class MessageBus:
+    """
+    把消息广播给多个命名订阅的总线
+    """
+
+    def __init__(self):
+        # 发布时直接遍历当前快照，订阅变化时整体替换，发布不需要加锁
+        self._routes: Tuple[Tuple[str, Optional[frozenset], Any], ...] = ()
+        self.running = True
+        self.lock = threading.Lock()
+
+    def attach(self, name: str, handler, types: Optional[Iterable[str]] = None, replace: bool = False):
+        """
+        挂接一个已有的消息处理器，如 AsyncMessageHandler
+        :param name: 订阅名
+        :param handler: 有 put_messages、stop 方法的消息处理器
+        :param types: 需要的消息类型，None表示全部
+        :param replace: 是否替换同名的订阅，被替换的处理器不会被停止
+        :return: handler
+        """
+        types = None if types is None else frozenset(types)
+        with self.lock:
+            routes = [route for route in self._routes if route[0] != name]
+            if len(routes) != len(self._routes) and not replace:
+                raise ValueError(f"订阅已存在: {name}")
+            routes.append((name, types, handler))
+            self._routes = tuple(routes)
+        return handler
+
+    def subscribe(self, name: str, types: Optional[Iterable[str]] = None, maxsize: int = 1000,
+                  backpressure: str = 'coalesce', put_timeout: Optional[float] = 1.0) -> MessageHandler:
+        """
+        创建一个命名订阅
+        :param name: 订阅名
+        :param types: 需要的消息类型，None表示全部
+        :param maxsize: 订阅队列的最大容量
+        :param backpressure: 队列满时的处理方式，见 BACKPRESSURE_POLICIES
+        :param put_timeout: block 方式发布者最多等待的时间（秒），None表示一直等待
+        :return: 订阅的消息处理器，用 get_message/get_batch 取消息
+        """
+        if backpressure == 'coalesce':
+            handler = MessageHandler(maxsize)
+        elif backpressure == 'drop':
+            handler = MessageHandler(maxsize, policies={})
+        elif backpressure == 'block':
+            handler = MessageHandler(maxsize, policies={}, put_timeout=put_timeout)
+        else:
+            raise ValueError(f"未知的背压策略: {backpressure}，可选: {', '.join(BACKPRESSURE_POLICIES)}")
+        if not self.running:
+            handler.stop()
+        return self.attach(name, handler, types)
+
+    def unsubscribe(self, name: str):
+        """
+        取消订阅并停止其消息处理器
+        :param name: 订阅名
+        :return: 被取消的消息处理器，不存在时为None
+        """
+        with self.lock:
+            removed = [route for route in self._routes if route[0] == name]
+            self._routes = tuple(route for route in self._routes if route[0] != name)
+        if not removed:
+            return None
+        handler = removed[0][2]
+        handler.stop()
+        return handler
+
+    def get(self, name: str):
+        """
+        :param name: 订阅名
+        :return: 订阅的消息处理器，不存在时为None
+        """
+        for route_name, _, handler in self._routes:
+            if route_name == name:
+                return handler
+        return None
+
+    def names(self) -> List[str]:
+        """
+        :return: 所有订阅名
+        """
+        return [route[0] for route in self._routes]
+
+    def publish(self, msg_type: str, payload) -> int:
+        """
+        发布一条消息
+        :param msg_type: 消息类型
+        :param payload: 消息内容，事件或字典
+        :return: 收到该消息的订阅数
+        """
+        message = make_message(msg_type, payload)
+        count = 0
+        for _, types, handler in self._routes:
+            if types is None or msg_type in types:
+                count += handler.put_messages([message])
+        return count
+
+    def publish_many(self, messages: List[AnyMessage]) -> int:
+        """
+        发布一批消息，如一个 Response 中的全部事件，每个订阅只加锁、唤醒一次
+        :param messages: 事件或 Message 的列表（见 events.py）
+        :return: 发布的消息数
+        """
+        routes = self._routes
+        if not routes or not messages:
+            return len(messages)
+        for _, types, handler in routes:
+            if types is None:
+                handler.put_messages(messages)
+            else:
+                handler.put_messages([message for message in messages if message.type in types])
+        return len(messages)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: {订阅名: {'size': 队列中的消息数, 'types': 各类消息的入队、合并、丢弃计数}}
+        """
+        return {name: {'size': handler.size(), 'types': handler.stats()} for name, _, handler in self._routes}
+
+    def stop(self):
+        """
+        停止总线和所有订阅的消息处理器，唤醒正在等待的消费者
+        """
+        self.running = False
+        for _, _, handler in self._routes:
+            handler.stop()
+
+    def is_running(self) -> bool:
+        """
+        检查总线是否正在运行
+        :return: 是否正在运行
+        """
+        return self.running
@@ -1,67 +1,350 @@
 #!/usr/bin/python
 # coding:utf-8
 
-import queue
+import asyncio
 import threading
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from events import AnyMessage, make_message
+
+
+class TypePolicy(NamedTuple):
+    """
+    一类消息在队列中的处理策略
+    """
+    # 优先级，队列满时先丢弃优先级最低的类型中最旧的消息；新消息的优先级低于队列中所有消息时丢弃新消息
+    priority: int = 1
+    # 该类型在队列中最多的条数，超出时丢弃该类型最旧的消息，None表示只受队列总容量限制
+    budget: Optional[int] = None
+    # 合并方式：None不合并；'latest' 只保留最新一条；'sum' key 字段相同且还未被取走的消息累加 field 字段
+    coalesce: Optional[str] = None
+    key: str = ''
+    field: str = ''
+
+
+DEFAULT_POLICY = TypePolicy()
+
+DEFAULT_POLICIES: Dict[str, TypePolicy] = {
+    # 礼物是付费消息，控制消息决定是否停止，只会被同优先级的消息挤掉
+    'gift': TypePolicy(priority=3),
+    'control': TypePolicy(priority=3),
+    'chat': TypePolicy(priority=2),
+    'emoji_chat': TypePolicy(priority=2),
+    'social': TypePolicy(priority=2),
+    'fansclub': TypePolicy(priority=2),
+    'member': TypePolicy(priority=1, budget=200),
+    'room': TypePolicy(priority=1, coalesce='latest'),
+    'stream_adaptation': TypePolicy(priority=1, coalesce='latest'),
+    # 同一用户连续的点赞合并成一条，点赞数累加
+    'like': TypePolicy(priority=0, budget=200, coalesce='sum', key='user_name', field='count'),
+    # 统计和榜单只有最新的有意义
+    'room_stats': TypePolicy(priority=0, coalesce='latest'),
+    'room_display_stats': TypePolicy(priority=0, coalesce='latest'),
+    'rank': TypePolicy(priority=0, coalesce='latest'),
+}
+
+
+class _TypeState:
+    """
+    一类消息的策略、排队中的消息和计数
+    """
+    __slots__ = ('policy', 'queue', 'added', 'coalesced', 'evicted', 'rejected')
+
+    def __init__(self, policy: TypePolicy):
+        self.policy = policy
+        # 该类型排队中的元素，按到达顺序
+        self.queue: Deque[list] = deque()
+        # 进入队列的消息数
+        self.added = 0
+        # 合并到队列中已有消息的消息数
+        self.coalesced = 0
+        # 进入队列后因超出类型配额或队列已满被丢弃的消息数
+        self.evicted = 0
+        # 队列已满且优先级不够，没能进入队列的消息数
+        self.rejected = 0
+
+    def counters(self) -> Dict[str, int]:
+        return {'added': self.added, 'coalesced': self.coalesced, 'evicted': self.evicted, 'rejected': self.rejected}
+
+
+class PolicyQueue:
+    """
+    按消息类型设置优先级和配额的有界队列，本身不加锁，由 MessageHandler/AsyncMessageHandler 负责同步
+
+    队列满了不再一律丢弃最旧的消息，而是按 TypePolicy 先丢低优先级的消息，点赞、进场刷屏时礼物和弹幕不会被挤掉。
+    元素为 [序号, 消息]，同时放在按到达顺序的总队列和所属类型的队列中；被丢弃的元素消息置为None，
+    留在总队列中等取出时跳过，取出仍按到达顺序先进先出。
+    """
+
+    def __init__(self, maxsize: int = 1000, policies: Optional[Mapping[str, TypePolicy]] = None):
+        """
+        :param maxsize: 队列总容量
+        :param policies: {消息类型: TypePolicy}，None表示使用 DEFAULT_POLICIES，未列出的类型使用 DEFAULT_POLICY
+        """
+        self.maxsize = maxsize
+        self.policies = DEFAULT_POLICIES if policies is None else policies
+        self._types: Dict[str, _TypeState] = {}
+        self._order: Deque[list] = deque()
+        # 可合并的未取走消息：{(消息类型, key字段的值): 元素}
+        self._pending: Dict[Tuple[str, Any], list] = {}
+        self._size = 0
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _state(self, msg_type: str) -> _TypeState:
+        state = self._types[msg_type] = _TypeState(self.policies.get(msg_type, DEFAULT_POLICY))
+        return state
+
+    @staticmethod
+    def _coalesce_key(msg_type: str, policy: TypePolicy, payload) -> Tuple[str, Any]:
+        return msg_type, payload.get(policy.key) if policy.coalesce == 'sum' else None
+
+    def push(self, message: AnyMessage) -> bool:
+        """
+        放入一条消息，消息可能同时在其他队列中（见 message_bus.py），合并时不修改已有的消息，而是替换成新的
+        :param message: 事件或 Message（见 events.py）
+        :return: 是否进入队列（包括合并到已有消息），False表示因优先级不够被丢弃
+        """
+        msg_type = message.type
+        state = self._types.get(msg_type) or self._state(msg_type)
+        policy = state.policy
+
+        if policy.coalesce:
+            key = self._coalesce_key(msg_type, policy, message.payload)
+            entry = self._pending.get(key)
+            if entry is not None:
+                if policy.coalesce == 'sum':
+                    total = entry[1].payload.get(policy.field, 0) + message.payload.get(policy.field, 0)
+                    message = message.replace_payload(**{policy.field: total})
+                entry[1] = message
+                state.coalesced += 1
+                return True
+
+        if policy.budget is not None and len(state.queue) >= policy.budget:
+            self._evict(state)
+        elif self._size >= self.maxsize:
+            victim = self._victim()
+            if victim is None or victim.policy.priority > policy.priority:
+                state.rejected += 1
+                return False
+            self._evict(victim)
+
+        entry = [self._seq, message]
+        self._seq += 1
+        state.queue.append(entry)
+        self._order.append(entry)
+        self._size += 1
+        state.added += 1
+        if policy.coalesce:
+            self._pending[key] = entry
+        return True
+
+    def _victim(self) -> _TypeState:
+        """
+        :return: 队列满时要丢弃消息的类型：优先级最低的类型中队头最旧的
+        """
+        victim, lowest = None, None
+        for state in self._types.values():
+            if state.queue:
+                rank = (state.policy.priority, state.queue[0][0])
+                if lowest is None or rank < lowest:
+                    victim, lowest = state, rank
+        return victim
+
+    def _evict(self, state: _TypeState):
+        entry = state.queue.popleft()
+        self._forget(state.policy, entry)
+        entry[1] = None
+        self._size -= 1
+        state.evicted += 1
+        # 被丢弃的元素太多时整理总队列，没有消费者时也不会无限增长
+        if len(self._order) > 2 * self.maxsize:
+            self._order = deque(entry for entry in self._order if entry[1] is not None)
+
+    def _forget(self, policy: TypePolicy, entry: list):
+        """
+        消息离开队列后不能再被合并
+        """
+        if policy.coalesce:
+            message = entry[1]
+            key = self._coalesce_key(message.type, policy, message.payload)
+            if self._pending.get(key) is entry:
+                del self._pending[key]
+
+    def pop(self) -> Optional[AnyMessage]:
+        """
+        取出最早到达的一条消息
+        :return: 消息字典或None（队列为空时）
+        """
+        order = self._order
+        while order:
+            entry = order.popleft()
+            message = entry[1]
+            if message is not None:
+                # 同类型中被丢弃的都是更早的元素，该元素一定在类型队列的队头
+                state = self._types[message.type]
+                state.queue.popleft()
+                self._size -= 1
+                if state.policy.coalesce:
+                    self._forget(state.policy, entry)
+                return message
+        return None
+
+    def pop_many(self, max_n: int) -> List[AnyMessage]:
+        """
+        按到达顺序取出最多 max_n 条消息
+        """
+        batch = []
+        pop = self.pop
+        while len(batch) < max_n:
+            message = pop()
+            if message is None:
+                break
+            batch.append(message)
+        return batch
+
+    def clear(self):
+        """
+        清空队列，计数保留
+        """
+        for state in self._types.values():
+            state.queue.clear()
+        self._order.clear()
+        self._pending.clear()
+        self._size = 0
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        :return: {消息类型: {'added':, 'coalesced':, 'evicted':, 'rejected':}}
+        """
+        return {msg_type: state.counters() for msg_type, state in self._types.items()}
 
 
 class MessageHandler:
     """
     消息处理器，用于集中处理和获取直播间的各种消息
+
+    消息存放在 PolicyQueue 中，队列满时按消息类型的优先级和配额丢弃，低价值的消息会先合并；
+    消费者用 get_batch 一次取走多条消息，每次唤醒处理一批而不是一条。
     """
 
-    def __init__(self, maxsize: int = 1000):
+    def __init__(self, maxsize: int = 1000, policies: Optional[Mapping[str, TypePolicy]] = None,
+                 put_timeout: Optional[float] = 0):
         """
         初始化消息处理器
         :param maxsize: 消息队列最大容量
+        :param policies: {消息类型: TypePolicy}，None表示使用 DEFAULT_POLICIES
+        :param put_timeout: 队列满时生产者最多等待的时间（秒），超时后再按策略丢弃；
+                            0表示不等待，None表示一直等到有空位
         """
-        self.message_queue = queue.Queue(maxsize=maxsize)
+        self.maxsize = maxsize
+        self.message_queue = PolicyQueue(maxsize, policies)
+        self.put_timeout = put_timeout
         self.running = True
         self.lock = threading.Lock()
+        self._not_empty = threading.Condition(self.lock)
+        self._not_full = threading.Condition(self.lock)
+        # 正在等待消息的消费者数，为0时生产者不需要唤醒
+        self._waiters = 0
+        # 正在等待空位的生产者数，为0时消费者不需要唤醒
+        self._putters = 0
 
     def add_message(self, msg_type: str, payload: Dict[str, Any]) -> bool:
         """
-        添加消息到队列
+        添加消息到队列，队列满了按优先级丢弃消息
         :param msg_type: 消息类型
-        :param payload: 消息内容
-        :return: 是否添加成功
+        :param payload: 消息内容，事件或字典
+        :return: 是否添加成功（包括合并到已有消息）
         """
-        if not self.running:
-            return False
+        return self.put_messages([make_message(msg_type, payload)]) == 1
+
+    def add_messages(self, messages: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        批量添加消息，如一个 Response 中的全部消息，只加锁、唤醒一次
+        :param messages: [(消息类型, 消息内容), ...]
+        :return: 添加成功的消息数
+        """
+        return self.put_messages([make_message(msg_type, payload) for msg_type, payload in messages])
 
-        message = {
-            'type': msg_type,
-            'payload': payload
-        }
+    def put_messages(self, messages: List[AnyMessage]) -> int:
+        """
+        批量放入已构造好的消息，消息可以同时放入多个处理器（见 message_bus.py），不会被修改
+        :param messages: 事件或 Message 的列表（见 events.py）
+        :return: 添加成功的消息数
+        """
+        if not self.running or not messages:
+            return 0
+
+        with self.lock:
+            queue = self.message_queue
+            push = queue.push
+            block = self.put_timeout != 0
+            count = 0
+            for message in messages:
+                if block and len(queue) >= self.maxsize:
+                    if not self._wait_not_full():
+                        break
+                count += push(message)
+            if count and self._waiters:
+                self._not_empty.notify_all()
+        return count
 
+    def _wait_not_full(self) -> bool:
+        """
+        持有锁时等待队列有空位，最多等待 put_timeout
+        :return: 是否仍在运行
+        """
+        if self._waiters:
+            # 先唤醒消费者取走已放入的消息
+            self._not_empty.notify_all()
+        self._putters += 1
         try:
-            self.message_queue.put(message, block=False)
-            return True
-        except queue.Full:
-            # 队列满了，移除最旧的消息再添加新的
+            self._not_full.wait_for(lambda: not self.running or len(self.message_queue) < self.maxsize,
+                                    self.put_timeout)
+        finally:
+            self._putters -= 1
+        return self.running
+
+    def _ready(self) -> bool:
+        return not self.running or len(self.message_queue) > 0
+
+    def _wait(self, timeout: Optional[float]) -> bool:
+        """
+        持有锁时等待队列非空
+        :return: 是否可以取消息
+        """
+        if self.running and not len(self.message_queue):
+            self._waiters += 1
             try:
-                self.message_queue.get_nowait()
-                self.message_queue.put(message, block=False)
-                return True
-            except queue.Empty:
-                return False
+                self._not_empty.wait_for(self._ready, timeout)
+            finally:
+                self._waiters -= 1
+        return self.running and len(self.message_queue) > 0
 
-    def get_message(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    def _taken(self):
+        """
+        持有锁时，取走消息后唤醒等待空位的生产者
+        """
+        if self._putters:
+            self._not_full.notify_all()
+
+    def get_message(self, timeout: Optional[float] = None) -> Optional[AnyMessage]:
         """
         获取一条消息
         :param timeout: 超时时间（秒），None表示阻塞等待
-        :return: 消息字典或None（超时或被关闭时）
+        :return: 消息（事件或 Message，兼容 {'type':..., 'payload':...} 的字典访问）或None（超时或被关闭时）
         """
-        if not self.running:
-            return None
-
-        try:
-            return self.message_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        with self.lock:
+            if not self._wait(timeout):
+                return None
+            message = self.message_queue.pop()
+            self._taken()
+            return message
 
-    def get_message_nowait(self) -> Optional[Dict[str, Any]]:
+    def get_message_nowait(self) -> Optional[AnyMessage]:
         """
         非阻塞获取一条消息
         :return: 消息字典或None（无消息时）
@@ -69,39 +352,192 @@ class MessageHandler:
         if not self.running:
             return None
 
-        try:
-            return self.message_queue.get_nowait()
-        except queue.Empty:
-            return None
+        with self.lock:
+            message = self.message_queue.pop()
+            self._taken()
+            return message
+
+    def get_batch(self, max_n: int = 100, timeout: Optional[float] = None) -> List[AnyMessage]:
+        """
+        批量获取消息，队列为空时等待，有消息后立即取走最多 max_n 条
+        :param max_n: 最多获取的消息数
+        :param timeout: 超时时间（秒），None表示阻塞等待
+        :return: 消息列表，超时或被关闭时为空列表
+        """
+        with self.lock:
+            if not self._wait(timeout):
+                return []
+            batch = self.message_queue.pop_many(max_n)
+            self._taken()
+            return batch
 
     def size(self) -> int:
         """
         获取当前队列中的消息数量
         :return: 消息数量
         """
-        return self.message_queue.qsize()
+        return len(self.message_queue)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        获取各类消息的入队、合并、丢弃计数
+        :return: {消息类型: {'added':, 'coalesced':, 'evicted':, 'rejected':}}
+        """
+        with self.lock:
+            return self.message_queue.stats()
 
     def stop(self):
         """
-        停止消息处理器
+        停止消息处理器，并唤醒正在等待消息的消费者
         """
         with self.lock:
             self.running = False
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
 
     def is_running(self) -> bool:
         """
         检查消息处理器是否正在运行
         :return: 是否正在运行
         """
-        with self.lock:
-            return self.running
+        return self.running
 
     def clear(self):
         """
         清空消息队列
         """
-        while not self.message_queue.empty():
+        with self.lock:
+            self.message_queue.clear()
+            self._taken()
+
+class AsyncMessageHandler:
+    """
+    asyncio 版本的消息处理器，供 AsyncDouyinLiveWebFetcher 在事件循环内使用
+    接口与 MessageHandler 保持一致，get_message 为协程
+    """
+
+    def __init__(self, maxsize: int = 1000, policies: Optional[Mapping[str, TypePolicy]] = None):
+        """
+        初始化消息处理器
+        :param maxsize: 消息队列最大容量
+        :param policies: {消息类型: TypePolicy}，None表示使用 DEFAULT_POLICIES
+        """
+        self.maxsize = maxsize
+        self.message_queue = PolicyQueue(maxsize, policies)
+        self._event = None
+        self.running = True
+
+    @property
+    def not_empty(self) -> asyncio.Event:
+        # 延迟到事件循环内首次使用时再创建，避免绑定到错误的事件循环
+        if self._event is None:
+            self._event = asyncio.Event()
+        return self._event
+
+    def _wake(self):
+        if self._event is not None:
+            self._event.set()
+
+    def add_message(self, msg_type: str, payload: Dict[str, Any]) -> bool:
+        """
+        添加消息到队列
+        :param msg_type: 消息类型
+        :param payload: 消息内容，事件或字典
+        :return: 是否添加成功（包括合并到已有消息）
+        """
+        return self.put_messages([make_message(msg_type, payload)]) == 1
+
+    def add_messages(self, messages: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        批量添加消息
+        :param messages: [(消息类型, 消息内容), ...]
+        :return: 添加成功的消息数
+        """
+        return self.put_messages([make_message(msg_type, payload) for msg_type, payload in messages])
+
+    def put_messages(self, messages: List[AnyMessage]) -> int:
+        """
+        批量放入已构造好的消息，需在事件循环所在的线程中调用
+        :param messages: 事件或 Message 的列表（见 events.py）
+        :return: 添加成功的消息数
+        """
+        if not self.running:
+            return 0
+
+        push = self.message_queue.push
+        count = 0
+        for message in messages:
+            count += push(message)
+        if count:
+            self._wake()
+        return count
+
+    async def get_message(self, timeout: Optional[float] = None) -> Optional[AnyMessage]:
+        """
+        获取一条消息，停止后会先取完队列中剩余的消息
+        :param timeout: 超时时间（秒），None表示一直等待
+        :return: 消息字典或None（超时或已停止且队列为空时）
+        """
+        while True:
+            message = self.message_queue.pop()
+            if message is not None or not self.running:
+                return message
+            event = self.not_empty
+            event.clear()
             try:
-                self.message_queue.get_nowait()
-            except queue.Empty:
-                break
\ No newline at end of file
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+    def get_message_nowait(self) -> Optional[AnyMessage]:
+        """
+        非阻塞获取一条消息
+        :return: 消息字典或None（无消息时）
+        """
+        return self.message_queue.pop()
+
+    async def get_batch(self, max_n: int = 100, timeout: Optional[float] = None) -> List[AnyMessage]:
+        """
+        批量获取消息，队列为空时等待，有消息后立即取走最多 max_n 条
+        :param max_n: 最多获取的消息数
+        :param timeout: 超时时间（秒），None表示一直等待
+        :return: 消息列表，超时或已停止且队列为空时为空列表
+        """
+        message = await self.get_message(timeout)
+        if message is None:
+            return []
+        return [message] + self.message_queue.pop_many(max_n - 1)
+
+    def size(self) -> int:
+        """
+        获取当前队列中的消息数量
+        :return: 消息数量
+        """
+        return len(self.message_queue)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        获取各类消息的入队、合并、丢弃计数
+        :return: {消息类型: {'added':, 'coalesced':, 'evicted':, 'rejected':}}
+        """
+        return self.message_queue.stats()
+
+    def stop(self):
+        """
+        停止消息处理器，并唤醒正在等待消息的协程
+        """
+        self.running = False
+        self._wake()
+
+    def is_running(self) -> bool:
+        """
+        检查消息处理器是否正在运行
+        :return: 是否正在运行
+        """
+        return self.running
+
+    def clear(self):
+        """
+        清空消息队列
+        """
+        self.message_queue.clear()
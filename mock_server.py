@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+本地模拟推送服务器
+
+在本机提供与抖音推送服务器相同的协议：/webcast/im/push/v2/ 上的websocket握手（校验 room_id/cursor/
+internal_ext 等参数），gzip压缩的 PushFrame/Response 帧，need_ack 与客户端回复的ack，以及心跳ping。
+弹幕流量按 TrafficProfile 合成：各类消息的速率、用户数、周期性突发，直到指定时长后发送直播结束消息。
+
+配合 DouyinLiveWebFetcher(live_id, endpoint=服务器地址) 使用，不需要网络、签名和直播间引导，
+可用于可复现的端到端吞吐和延迟测试。服务器统计每个ack相对于帧发出的延迟。
+
+用法: python mock_server.py [--port 8765] [--chat 20] [--gift 2] [--like 30] [--member 10] [--social 0.5]
+                            [--users 1000] [--burst-every 0] [--burst-duration 2] [--burst-multiplier 10]
+                            [--duration 0] [--seed 0]
+"""
+
+import argparse
+import asyncio
+import gzip
+import itertools
+import random
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from aiohttp import WSMsgType, web
+
+from protobuf.douyin import (ChatMessage, Common, ControlMessage, GiftMessage, GiftStruct, LikeMessage,
+                             MemberMessage, Message, PushFrame, Response, SocialMessage)
+
+PUSH_PATH = '/webcast/im/push/v2/'
+# 握手时必须携带的参数，缺少时与真实服务器一样拒绝握手
+REQUIRED_PARAMS = ('room_id', 'cursor', 'internal_ext', 'compress', 'user_unique_id', 'identity')
+
+# 消息类型 -> Message.method
+TRAFFIC_METHODS = {
+    'chat': 'WebcastChatMessage',
+    'gift': 'WebcastGiftMessage',
+    'like': 'WebcastLikeMessage',
+    'member': 'WebcastMemberMessage',
+    'social': 'WebcastSocialMessage',
+}
+
+# 每种消息预先生成的payload数，发送时从中随机选取，避免发送端成为瓶颈
+CORPUS_SIZE = 512
+
+_NICK_NAMES = ["小明", "Alice", "夜猫子🌙", "路人甲", "今天也要开心", "Bob", "追光者", "一只咸鱼"]
+_CHAT_CONTENTS = ["你好", "主播好！", "666", "哈哈哈哈", "这个怎么卖", "来了来了", "点赞点赞", "主播唱首歌吧"]
+_GIFTS = [(463, "小心心"), (685, "玫瑰"), (3389, "人气票"), (4229, "加油鸭"), (3743, "大啤酒")]
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _field(number: int, value) -> bytes:
+    """
+    按wire格式编码一个字段，int为varint，bytes/str为length-delimited
+    """
+    if isinstance(value, int):
+        return _varint(number << 3) + _varint(value)
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    return _varint(number << 3 | 2) + _varint(len(value)) + value
+
+
+class TrafficProfile(NamedTuple):
+    """
+    合成流量的配置，各类消息的速率单位为 条/秒
+    """
+    chat: float = 20
+    gift: float = 2
+    like: float = 30
+    member: float = 10
+    social: float = 0.5
+    # 不同用户数
+    users: int = 1000
+    # 每隔多少秒发送一帧，同一帧内的消息合并到一个 Response
+    frame_interval: float = 0.2
+    # 每隔多少秒突发一次，0表示不突发
+    burst_every: float = 0
+    # 每次突发持续的秒数
+    burst_duration: float = 2
+    # 突发期间速率的倍数
+    burst_multiplier: float = 10
+    # 直播间统计消息的间隔（秒），0表示不发送
+    room_stats_interval: float = 5
+    # 连接持续的秒数，到时发送直播结束消息；0表示一直发送
+    duration: float = 0
+    # 下发给客户端的心跳间隔（毫秒）
+    heartbeat_duration: int = 10000
+    seed: int = 0
+
+
+class MessageCorpus:
+    """
+    预先生成的消息，每条已编码为 Response.messages_list 的一个元素，一帧只需拼接
+
+    消息主体用 protobuf/douyin.py 生成模板，用户、内容、数量等逐条变化的字段按wire格式追加在模板之后
+    （protobuf解析时后出现的字段覆盖/合并前面的）。betterproto序列化带 User 的消息一条要几十毫秒，
+    逐条用 douyin.py 生成上千条消息启动会很慢。
+    """
+
+    def __init__(self, profile: TrafficProfile, room_id: int = 7392091211001140287):
+        rnd = random.Random(profile.seed)
+        # User: id=1, short_id=2, nick_name=3, gender=4
+        users = [_field(1, rnd.getrandbits(60)) + _field(2, rnd.getrandbits(40)) +
+                 _field(3, f"{rnd.choice(_NICK_NAMES)}{i}") + _field(4, rnd.randint(0, 1))
+                 for i in range(max(profile.users, 1))]
+        common = Common(msg_id=rnd.getrandbits(62), room_id=room_id, create_time=int(time.time() * 1000))
+        gifts = [bytes(GiftMessage(common=common, gift_id=gift_id,
+                                   gift=GiftStruct(id=gift_id, name=name, describe=f"送出了{name}")))
+                 for gift_id, name in _GIFTS]
+        templates = {msg_type: bytes(cls(common=common)) for msg_type, cls in (
+            ('chat', ChatMessage), ('like', LikeMessage), ('member', MemberMessage), ('social', SocialMessage))
+            if getattr(profile, msg_type) > 0}
+
+        def build(msg_type):
+            user = rnd.choice(users)
+            if msg_type == 'chat':
+                # ChatMessage: user=2, content=3
+                return templates['chat'] + _field(2, user) + _field(3, rnd.choice(_CHAT_CONTENTS))
+            if msg_type == 'gift':
+                # GiftMessage: combo_count=6, user=7
+                return rnd.choice(gifts) + _field(6, rnd.randint(1, 99)) + _field(7, user)
+            if msg_type == 'like':
+                # LikeMessage: count=2, total=3, user=5
+                return templates['like'] + _field(2, rnd.randint(1, 20)) + _field(3, rnd.getrandbits(20)) + \
+                    _field(5, user)
+            # MemberMessage/SocialMessage: user=2
+            return templates[msg_type] + _field(2, user)
+
+        size = min(CORPUS_SIZE, max(profile.users, 1) * 4)
+        # 消息类型 -> Message.payload
+        self.payloads: Dict[str, List[bytes]] = {
+            msg_type: [build(msg_type) for _ in range(size)]
+            for msg_type in TRAFFIC_METHODS
+            if getattr(profile, msg_type) > 0
+        }
+        # 消息类型 -> 编码后的 Response.messages_list 元素（Response: messages_list=1）
+        self.messages: Dict[str, List[bytes]] = {
+            msg_type: [_field(1, bytes(Message(method=TRAFFIC_METHODS[msg_type], payload=payload)))
+                       for payload in payloads]
+            for msg_type, payloads in self.payloads.items()
+        }
+
+
+class TrafficGenerator:
+    """
+    一个连接上的合成流量，按时间生成帧
+    """
+
+    def __init__(self, profile: TrafficProfile, corpus: MessageCorpus, room_id: str, seed: int):
+        self.profile = profile
+        self.corpus = corpus
+        self.room_id = room_id
+        self.rnd = random.Random(seed)
+        self.seq = 0
+        self.log_ids = itertools.count(self.rnd.getrandbits(48))
+        # 各类消息的小数部分累积，保证长期平均速率准确
+        self._carry = dict.fromkeys(corpus.messages, 0.0)
+        self._last_stats = 0.0
+        self.viewers = self.rnd.randint(100, 10000)
+
+    def in_burst(self, elapsed: float) -> bool:
+        every = self.profile.burst_every
+        return every > 0 and elapsed % every < self.profile.burst_duration
+
+    def next_messages(self, elapsed: float, interval: float) -> List[bytes]:
+        """
+        生成一帧内的消息
+        :param elapsed: 连接建立以来的秒数
+        :param interval: 距上一帧的秒数
+        :return: 编码后的 Response.messages_list 元素
+        """
+        multiplier = self.profile.burst_multiplier if self.in_burst(elapsed) else 1
+        messages = []
+        for msg_type, pool in self.corpus.messages.items():
+            expected = getattr(self.profile, msg_type) * multiplier * interval + self._carry[msg_type]
+            count = int(expected)
+            self._carry[msg_type] = expected - count
+            messages.extend(self.rnd.choices(pool, k=count))
+        self.rnd.shuffle(messages)
+        stats_interval = self.profile.room_stats_interval
+        if stats_interval > 0 and elapsed - self._last_stats >= stats_interval:
+            self._last_stats = elapsed
+            self.viewers = max(0, self.viewers + self.rnd.randint(-50, 80))
+            # RoomUserSeqMessage: total=3, total_pv_for_anchor=11
+            payload = _field(3, self.viewers) + _field(11, str(self.viewers * 7))
+            messages.append(_field(1, bytes(Message(method='WebcastRoomUserSeqMessage', payload=payload))))
+        return messages
+
+    def end_messages(self) -> List[bytes]:
+        """直播结束"""
+        return [_field(1, bytes(Message(method='WebcastControlMessage', payload=bytes(ControlMessage(status=3)))))]
+
+    def frame(self, messages: List[bytes]):
+        """
+        :param messages: 编码后的 Response.messages_list 元素
+        :return: (log_id, 序列化后的 PushFrame)
+        """
+        self.seq += 1
+        now = int(time.time() * 1000)
+        response = bytes(Response(cursor=f"t-{now}_r-{self.seq}", fetch_interval=0, now=now,
+                                  internal_ext=f"internal_src:dim|wss_push_room_id:{self.room_id}|seq:{self.seq}",
+                                  heartbeat_duration=self.profile.heartbeat_duration, need_ack=True))
+        log_id = next(self.log_ids)
+        return log_id, PushFrame(log_id=log_id, payload_encoding='pb', payload_type='msg',
+                                 payload=gzip.compress(b''.join(messages) + response,
+                                                       compresslevel=6)).SerializeToString()
+
+
+class MockStats:
+    """
+    服务器统计，ack延迟为帧发出到收到对应ack的时间
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.rejected = 0
+        self.frames = 0
+        self.messages = 0
+        self.acks = 0
+        self.pings = 0
+        self.ack_latencies: List[float] = []
+
+    def latency_percentile(self, percent: float) -> float:
+        """
+        :param percent: 百分位，如 50、99
+        :return: ack延迟（秒），没有ack时为0
+        """
+        if not self.ack_latencies:
+            return 0.0
+        latencies = sorted(self.ack_latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percent / 100))]
+
+    def summary(self) -> str:
+        return (f"连接 {self.connections}（拒绝 {self.rejected}），帧 {self.frames}，消息 {self.messages}，"
+                f"ack {self.acks}，心跳 {self.pings}，ack延迟 p50 {self.latency_percentile(50) * 1000:.2f}ms "
+                f"p99 {self.latency_percentile(99) * 1000:.2f}ms")
+
+
+class MockPushServer:
+    """
+    模拟推送服务器，每个连接独立生成流量
+    """
+
+    def __init__(self, profile: TrafficProfile = TrafficProfile(), host: str = '127.0.0.1', port: int = 8765,
+                 require_signature: bool = False):
+        """
+        :param profile: 合成流量配置
+        :param host: 监听地址
+        :param port: 监听端口，0表示随机端口（启动后见 port）
+        :param require_signature: 握手时是否要求 signature 参数（不校验内容）
+        """
+        self.profile = profile
+        self.host = host
+        self.port = port
+        self.require_signature = require_signature
+        self.stats = MockStats()
+        self.corpus = MessageCorpus(profile)
+        self._connections = itertools.count()
+        self._runner: Optional[web.AppRunner] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """供 DouyinLiveWebFetcher(endpoint=...) 使用的地址"""
+        return f"ws://{self.host}:{self.port}{PUSH_PATH}"
+
+    async def start(self):
+        """
+        在当前事件循环中启动服务器
+        """
+        app = web.Application()
+        app.router.add_get(PUSH_PATH, self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        if self.port == 0:
+            self.port = self._runner.addresses[0][1]
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start_in_thread(self) -> 'MockPushServer':
+        """
+        在后台线程的事件循环中启动服务器，用于同步代码（如 DouyinLiveWebFetcher.start）的测试
+        :return: self
+        """
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.stop())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="MockPushServer", daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop_thread(self):
+        """
+        停止 start_in_thread 启动的服务器
+        """
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        missing = [name for name in REQUIRED_PARAMS if name not in request.query]
+        if self.require_signature and 'signature' not in request.query:
+            missing.append('signature')
+        if missing or request.query.get('compress') != 'gzip':
+            self.stats.rejected += 1
+            raise web.HTTPBadRequest(text=f"missing params: {','.join(missing)}")
+
+        ws = web.WebSocketResponse(autoping=False, max_msg_size=0)
+        await ws.prepare(request)
+        self.stats.connections += 1
+        generator = TrafficGenerator(self.profile, self.corpus, request.query['room_id'],
+                                     self.profile.seed + next(self._connections))
+        # log_id -> 发出时间，收到ack后计算延迟
+        pending: Dict[int, float] = {}
+        sender = asyncio.ensure_future(self._send(ws, generator, pending))
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.BINARY:
+                    self._on_frame(msg.data, pending)
+                elif msg.type == WSMsgType.PING:
+                    self.stats.pings += 1
+                    await ws.pong(msg.data)
+                elif msg.type == WSMsgType.ERROR:
+                    break
+        finally:
+            sender.cancel()
+        return ws
+
+    def _on_frame(self, data: bytes, pending: Dict[int, float]):
+        frame = PushFrame().parse(data)
+        if frame.payload_type == 'ack':
+            sent = pending.pop(frame.log_id, None)
+            if sent is not None:
+                self.stats.acks += 1
+                self.stats.ack_latencies.append(time.perf_counter() - sent)
+        elif frame.payload_type == 'hb':
+            self.stats.pings += 1
+
+    async def _send(self, ws: web.WebSocketResponse, generator: TrafficGenerator, pending: Dict[int, float]):
+        profile = self.profile
+        start = last = time.monotonic()
+        next_due = start
+        try:
+            while not ws.closed:
+                next_due += profile.frame_interval
+                await asyncio.sleep(max(0.0, next_due - time.monotonic()))
+                now = time.monotonic()
+                elapsed = now - start
+                if profile.duration and elapsed >= profile.duration:
+                    await self._send_frame(ws, generator, generator.end_messages(), pending)
+                    break
+                messages = generator.next_messages(elapsed, now - last)
+                last = now
+                if messages:
+                    await self._send_frame(ws, generator, messages, pending)
+        except ConnectionResetError:
+            pass
+
+    async def _send_frame(self, ws, generator, messages, pending):
+        log_id, frame = generator.frame(messages)
+        pending[log_id] = time.perf_counter()
+        await ws.send_bytes(frame)
+        self.stats.frames += 1
+        self.stats.messages += len(messages)
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="本地模拟推送服务器")
+    defaults = TrafficProfile()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--require-signature', action='store_true', help="握手时要求 signature 参数")
+    for name, default in defaults._asdict().items():
+        parser.add_argument('--' + name.replace('_', '-'), type=type(default), default=default)
+    return parser.parse_args(argv)
+
+
+async def _serve(server: MockPushServer):
+    await server.start()
+    print(f"模拟推送服务器已启动: {server.url}")
+    print(f"连接方式: python main.py --endpoint {server.url} <任意room_id>")
+    try:
+        while True:
+            await asyncio.sleep(5)
+            print(server.stats.summary())
+    finally:
+        await server.stop()
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    profile = TrafficProfile(**{name: getattr(args, name) for name in TrafficProfile._fields})
+    server = MockPushServer(profile, args.host, args.port, args.require_signature)
+    try:
+        asyncio.run(_serve(server))
+    except KeyboardInterrupt:
+        print(f"\n{server.stats.summary()}")
+
+
+if __name__ == '__main__':
+    main()
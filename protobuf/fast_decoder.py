@@ -0,0 +1,219 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+高频消息的快速解码
+
+betterproto 的 Message().parse 会递归解析整个消息，ChatMessage 等消息里的 User 带有头像、
+PayGrade、FansClub、勋章等大量嵌套结构，而实际只用到昵称、id 等几个字段。
+这里直接遍历 protobuf 的 wire 格式，只取需要的字段，其余字段（包括嵌套消息）按长度跳过。
+
+解码结果为 events.py 中的事件，与用 douyin.py 完整解析得到的一致，可用 verify 对拍。
+被跳过的字段不做校验，其中的数据损坏（如非法UTF-8）不会像完整解析那样报错。
+"""
+
+from typing import Any, Callable, Dict
+
+from events import ChatEvent, Event, GiftEvent, LikeEvent, MemberEvent, SocialEvent
+
+from . import douyin
+
+# wire type
+VARINT = 0
+FIXED64 = 1
+LENGTH_DELIMITED = 2
+FIXED32 = 5
+
+
+def _read_varint(buf: bytes, pos: int):
+    """
+    读取一个varint
+    :return: (值, 新位置)
+    """
+    result = 0
+    shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError("varint过长")
+
+
+def scan_fields(buf: bytes, wanted) -> Dict[int, Any]:
+    """
+    遍历一层消息，只取出需要的字段，其余字段按长度跳过
+    :param buf: 消息的序列化数据
+    :param wanted: 需要的字段编号集合
+    :return: {字段编号: 值}，varint/fixed 为整数，length-delimited 为bytes；重复出现时取最后一个
+    """
+    fields = {}
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        key = buf[pos]
+        if key < 0x80:
+            pos += 1
+        else:
+            key, pos = _read_varint(buf, pos)
+        number = key >> 3
+        wire_type = key & 7
+        if wire_type == LENGTH_DELIMITED:
+            length = buf[pos]
+            if length < 0x80:
+                pos += 1
+            else:
+                length, pos = _read_varint(buf, pos)
+            if number in wanted:
+                fields[number] = buf[pos:pos + length]
+            pos += length
+        elif wire_type == VARINT:
+            value = buf[pos]
+            if value < 0x80:
+                pos += 1
+            else:
+                value, pos = _read_varint(buf, pos)
+            if number in wanted:
+                fields[number] = value
+        elif wire_type == FIXED64:
+            if number in wanted:
+                fields[number] = int.from_bytes(buf[pos:pos + 8], 'little')
+            pos += 8
+        elif wire_type == FIXED32:
+            if number in wanted:
+                fields[number] = int.from_bytes(buf[pos:pos + 4], 'little')
+            pos += 4
+        else:
+            raise ValueError(f"不支持的wire type: {wire_type}")
+    return fields
+
+
+# User: id=1, nick_name=3, gender=4
+_USER_FIELDS = frozenset((1, 3, 4))
+
+
+def _user(buf: bytes):
+    """
+    :return: (昵称, id, 性别)
+    """
+    if not buf:
+        return '', 0, 0
+    fields = scan_fields(buf, _USER_FIELDS)
+    return fields.get(3, b'').decode('utf-8'), fields.get(1, 0), fields.get(4, 0)
+
+
+# ChatMessage: user=2, content=3
+_CHAT_FIELDS = frozenset((2, 3))
+
+
+def decode_chat(payload: bytes) -> ChatEvent:
+    """聊天消息"""
+    fields = scan_fields(payload, _CHAT_FIELDS)
+    user_name, user_id, _ = _user(fields.get(2))
+    return ChatEvent(user_name, user_id, fields.get(3, b'').decode('utf-8'))
+
+
+# GiftMessage: combo_count=6, user=7, gift=15; GiftStruct: name=16
+_GIFT_FIELDS = frozenset((6, 7, 15))
+_GIFT_STRUCT_FIELDS = frozenset((16,))
+
+
+def decode_gift(payload: bytes) -> GiftEvent:
+    """礼物消息"""
+    fields = scan_fields(payload, _GIFT_FIELDS)
+    user_name, _, _ = _user(fields.get(7))
+    gift = scan_fields(fields.get(15, b''), _GIFT_STRUCT_FIELDS)
+    return GiftEvent(user_name, gift.get(16, b'').decode('utf-8'), fields.get(6, 0))
+
+
+# LikeMessage: count=2, user=5
+_LIKE_FIELDS = frozenset((2, 5))
+
+
+def decode_like(payload: bytes) -> LikeEvent:
+    """点赞消息"""
+    fields = scan_fields(payload, _LIKE_FIELDS)
+    user_name, _, _ = _user(fields.get(5))
+    return LikeEvent(user_name, fields.get(2, 0))
+
+
+# MemberMessage / SocialMessage: user=2
+_USER_ONLY_FIELDS = frozenset((2,))
+
+
+def decode_member(payload: bytes) -> MemberEvent:
+    """进入直播间消息"""
+    user_name, user_id, gender = _user(scan_fields(payload, _USER_ONLY_FIELDS).get(2))
+    return MemberEvent(user_name, user_id, ["女", "男"][gender])
+
+
+def decode_social(payload: bytes) -> SocialEvent:
+    """关注消息"""
+    user_name, user_id, _ = _user(scan_fields(payload, _USER_ONLY_FIELDS).get(2))
+    return SocialEvent(user_name, user_id)
+
+
+# Message.method -> 快速解码函数
+FAST_DECODERS: Dict[str, Callable[[bytes], Event]] = {
+    'WebcastChatMessage': decode_chat,
+    'WebcastGiftMessage': decode_gift,
+    'WebcastLikeMessage': decode_like,
+    'WebcastMemberMessage': decode_member,
+    'WebcastSocialMessage': decode_social,
+}
+
+
+def _reference_chat(payload):
+    message = douyin.ChatMessage().parse(payload)
+    return ChatEvent(message.user.nick_name, message.user.id, message.content)
+
+
+def _reference_gift(payload):
+    message = douyin.GiftMessage().parse(payload)
+    return GiftEvent(message.user.nick_name, message.gift.name, message.combo_count)
+
+
+def _reference_like(payload):
+    message = douyin.LikeMessage().parse(payload)
+    return LikeEvent(message.user.nick_name, message.count)
+
+
+def _reference_member(payload):
+    message = douyin.MemberMessage().parse(payload)
+    return MemberEvent(message.user.nick_name, message.user.id, ["女", "男"][message.user.gender])
+
+
+def _reference_social(payload):
+    message = douyin.SocialMessage().parse(payload)
+    return SocialEvent(message.user.nick_name, message.user.id)
+
+
+# 用 douyin.py 完整解析得到的结果，作为对拍基准
+REFERENCE_DECODERS: Dict[str, Callable[[bytes], Event]] = {
+    'WebcastChatMessage': _reference_chat,
+    'WebcastGiftMessage': _reference_gift,
+    'WebcastLikeMessage': _reference_like,
+    'WebcastMemberMessage': _reference_member,
+    'WebcastSocialMessage': _reference_social,
+}
+
+
+def verify(method: str, payload: bytes) -> bool:
+    """
+    用 douyin.py 对拍一条消息
+    :param method: Message.method
+    :param payload: Message.payload
+    :return: 快速解码结果是否与 betterproto 完整解析一致（两者都失败也视为一致）
+    """
+    try:
+        expected = REFERENCE_DECODERS[method](payload)
+    except Exception:
+        expected = None
+    try:
+        actual = FAST_DECODERS[method](payload)
+    except Exception:
+        actual = None
+    return expected == actual
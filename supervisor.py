@@ -0,0 +1,218 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+多直播间监控
+
+把直播间按每个工作进程 N 个分片，每个工作进程在一个事件循环里用 AsyncDouyinLiveWebFetcher
+挂载自己负责的直播间，消息解析和 gzip 解压分散在多个进程里，不再争抢同一把 GIL。
+所有消息带上直播间 id 汇总到同一个输出流。
+
+- 单个直播间断开或出错：在工作进程内按指数退避重连
+- 整个工作进程崩溃：由 RoomSupervisor 按指数退避重启该分片
+"""
+
+import asyncio
+import collections
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from backoff import Backoff
+from codec import configure_codec, get_codec
+
+# 工作进程向主进程批量发送消息的间隔（秒）与单批最大条数
+FLUSH_INTERVAL = 0.05
+FLUSH_MAX_SIZE = 500
+
+
+async def _run_room(live_id: str, session, outbox: List, stop_event):
+    """
+    在工作进程内持续监听一个直播间
+    网络断开由 fetcher 自己续传重连，这里处理引导失败、直播结束等 fetcher 退出的情况，
+    按退避时间重新获取 room_id 后再连接
+    """
+    from async_fetcher import AsyncDouyinLiveWebFetcher
+
+    backoff = Backoff(jitter=0.5)
+    while not stop_event.is_set():
+        backoff.mark_started()
+        fetcher = AsyncDouyinLiveWebFetcher(live_id, session)
+        try:
+            async for message in fetcher:
+                # 跨进程仍传原来的字典格式，主进程的消费者不依赖 events.py
+                outbox.append({'room': live_id, **message.to_dict()})
+        except asyncio.CancelledError:
+            fetcher.stop()
+            raise
+        except Exception as e:
+            print(f"【X】[{live_id}] 连接出错: {e}")
+        if stop_event.is_set():
+            break
+        # 主播可能已重新开播，room_id 需要重新获取
+        fetcher.bootstrap_cache.invalidate_room_id(live_id)
+        delay = backoff.next_delay()
+        print(f"【X】[{live_id}] 连接已断开，{delay:.0f}秒后重连")
+        await asyncio.sleep(delay)
+
+
+async def _flush_outbox(outbox: List, out_queue, stop_event):
+    """
+    定期把本进程收集到的消息批量发往主进程，减少跨进程传输次数
+    """
+    while True:
+        if outbox:
+            batch = outbox[:FLUSH_MAX_SIZE]
+            del outbox[:len(batch)]
+            out_queue.put(batch)
+            continue
+        if stop_event.is_set():
+            break
+        await asyncio.sleep(FLUSH_INTERVAL)
+
+
+async def _worker_async(live_ids: List[str], out_queue, stop_event):
+    import aiohttp
+
+    outbox = []
+    async with aiohttp.ClientSession() as session:
+        rooms = [asyncio.ensure_future(_run_room(live_id, session, outbox, stop_event)) for live_id in live_ids]
+        flusher = asyncio.ensure_future(_flush_outbox(outbox, out_queue, stop_event))
+        while not stop_event.is_set():
+            await asyncio.sleep(0.5)
+        for room in rooms:
+            room.cancel()
+        await asyncio.gather(*rooms, return_exceptions=True)
+        await flusher
+
+
+def _worker_main(live_ids: List[str], out_queue, stop_event, codec_name: str):
+    """
+    工作进程入口
+    :param live_ids: 本进程负责的直播id列表
+    :param out_queue: 发往主进程的消息队列
+    :param stop_event: 停止信号
+    :param codec_name: 与主进程一致的protobuf编解码后端
+    """
+    configure_codec(codec_name)
+    try:
+        asyncio.run(_worker_async(live_ids, out_queue, stop_event))
+    except KeyboardInterrupt:
+        pass
+
+
+class RoomSupervisor:
+    """
+    多直播间监控器，按分片把直播间分配到多个工作进程，并汇总所有消息
+    """
+
+    def __init__(self, live_ids: Iterable[str], rooms_per_worker: int = 8, max_backoff: float = 60):
+        """
+        :param live_ids: 直播id列表
+        :param rooms_per_worker: 每个工作进程负责的直播间数量
+        :param max_backoff: 工作进程崩溃后重启的最长等待时间（秒）
+        """
+        live_ids = list(dict.fromkeys(live_ids))
+        rooms_per_worker = max(1, rooms_per_worker)
+        self.shards = [live_ids[i:i + rooms_per_worker] for i in range(0, len(live_ids), rooms_per_worker)]
+        self.max_backoff = max_backoff
+        self.out_queue = multiprocessing.Queue()
+        self.stop_event = multiprocessing.Event()
+        self.processes: Dict[int, multiprocessing.Process] = {}
+        self._backoffs = [Backoff(maximum=max_backoff) for _ in self.shards]
+        self._pending = collections.deque()
+        self._monitor_thread = None
+        self.running = False
+
+    def _spawn(self, index: int):
+        process = multiprocessing.Process(target=_worker_main,
+                                          args=(self.shards[index], self.out_queue, self.stop_event,
+                                                get_codec().name),
+                                          name=f"RoomWorker-{index}",
+                                          daemon=True)
+        process.start()
+        self._backoffs[index].mark_started()
+        self.processes[index] = process
+
+    def start(self):
+        """
+        启动所有工作进程
+        """
+        self.running = True
+        for index in range(len(self.shards)):
+            self._spawn(index)
+        self._monitor_thread = threading.Thread(target=self._monitor, name="RoomSupervisor", daemon=True)
+        self._monitor_thread.start()
+
+    def _monitor(self):
+        """
+        检查工作进程是否存活，崩溃的分片按退避时间重启
+        """
+        restart_at: Dict[int, float] = {}
+        while self.running:
+            now = time.monotonic()
+            for index, process in list(self.processes.items()):
+                if process.is_alive() or not self.running:
+                    continue
+                if index not in restart_at:
+                    delay = self._backoffs[index].next_delay()
+                    restart_at[index] = now + delay
+                    print(f"【X】工作进程{index}已退出(exitcode={process.exitcode})，{delay:.0f}秒后重启: "
+                          f"{','.join(self.shards[index])}")
+                elif now >= restart_at[index]:
+                    del restart_at[index]
+                    self._spawn(index)
+            time.sleep(0.5)
+
+    def stop(self, timeout: float = 5):
+        """
+        停止所有工作进程
+        :param timeout: 等待每个工作进程退出的时间（秒）
+        """
+        self.running = False
+        self.stop_event.set()
+        for process in self.processes.values():
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+
+    def get_message(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        从汇总的输出流获取一条消息
+        :param timeout: 超时时间（秒），None表示阻塞等待
+        :return: 消息字典，包含 'room'、'type'、'payload'，超时返回None
+        """
+        if not self._pending:
+            try:
+                self._pending.extend(self.out_queue.get(timeout=timeout))
+            except queue.Empty:
+                return None
+        return self._pending.popleft()
+
+    def __iter__(self):
+        while self.running:
+            message = self.get_message(timeout=1)
+            if message is not None:
+                yield message
+
+
+def load_live_ids(args: List[str]) -> List[str]:
+    """
+    解析直播id参数，支持直接给出多个id，或给出一个每行一个id的文件（#开头为注释）
+    :param args: 命令行参数
+    :return: 直播id列表
+    """
+    live_ids = []
+    for arg in args:
+        if os.path.isfile(arg):
+            with open(arg, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.split('#', 1)[0].strip()
+                    if line:
+                        live_ids.append(line)
+        else:
+            live_ids.append(arg)
+    return live_ids
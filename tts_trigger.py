@@ -0,0 +1,77 @@
+#!/usr/bin/python
+# coding:utf-8
+
+"""
+TTS播报文本的生成
+
+根据 tts_config.json 的配置和一条消息决定是否播报、播报什么，不依赖GUI，
+GUI中的 check_tts_trigger 与基准测试共用。
+"""
+
+import random
+from typing import Any, Dict
+
+
+def render_tts_text(tts_config: Dict[str, Any], msg_type: str, payload: Dict[str, Any]) -> str:
+    """
+    生成一条消息的TTS播报文本
+    :param tts_config: TTS配置，格式同 tts_config.json
+    :param msg_type: 消息类型
+    :param payload: 消息内容，事件（见 events.py）或字典
+    :return: 播报文本，不需要播报时为空字符串
+    """
+    # 检查TTS是否启用
+    if not tts_config.get('tts_enabled', False):
+        return ""
+
+    tts_text = ""
+
+    # 进场TTS播报
+    if msg_type == 'member' and tts_config.get('enter_tts_enabled', False):
+        templates = tts_config.get('enter_tts_templates', ['欢迎 {user_name} 来到直播间'])
+        if templates:
+            template = random.choice(templates)
+            user_name = payload.get('user_name', '')
+            tts_text = template.format(user_name=user_name)
+
+    # 关注TTS播报
+    elif msg_type == 'social' and tts_config.get('follow_tts_enabled', False):
+        templates = tts_config.get('follow_tts_templates', ['感谢 {user_name} 的关注'])
+        if templates:
+            template = random.choice(templates)
+            user_name = payload.get('user_name', '')
+            tts_text = template.format(user_name=user_name)
+
+    # 礼物TTS播报
+    elif msg_type == 'gift' and tts_config.get('gift_tts_enabled', False):
+        templates = tts_config.get('gift_tts_templates', ['感谢 {user_name} 送出的 {gift_name} x {gift_count}'])
+        if templates:
+            template = random.choice(templates)
+            user_name = payload.get('user_name', '')
+            gift_name = payload.get('gift_name', '')
+            gift_count = payload.get('gift_count', '')
+            tts_text = template.format(user_name=user_name, gift_name=gift_name, gift_count=gift_count)
+
+    # 关键字TTS播报
+    elif msg_type == 'chat' and tts_config.get('keyword_tts_enabled', False):
+        content = payload.get('content', '')
+        user_name = payload.get('user_name', '')
+
+        # 查找匹配的关键字和对应的模板
+        keyword_reply_templates = tts_config.get('keyword_reply_templates', {})
+        matched_keyword = None
+        matched_templates = []
+
+        # 精确匹配关键字
+        for keyword, templates in keyword_reply_templates.items():
+            if keyword in content:
+                matched_keyword = keyword
+                matched_templates = templates
+                break
+
+        # 如果找到匹配的关键字且有对应的模板，则随机选择一个模板
+        if matched_keyword and matched_templates:
+            template = random.choice(matched_templates)
+            tts_text = template.format(user_name=user_name, content=content)
+
+    return tts_text